@@ -0,0 +1,3 @@
+"""
+Maintenance commands (python -m app.commands.<name>).
+"""
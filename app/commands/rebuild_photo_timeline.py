@@ -0,0 +1,79 @@
+"""
+Rebuild the photo timeline rollup (photo_timeline_buckets) from photos.
+
+타임라인 도입 전 데이터 집계, 롤업 불일치 복구에 사용합니다. 사용자 단위로 다시 계산해 커밋하므로
+언제든 다시 실행할 수 있습니다 (실행 중 업로드가 많으면 해당 사용자는 한 번 더 실행).
+
+Usage:
+    python -m app.commands.rebuild_photo_timeline [--user-id 123]
+"""
+import argparse
+import asyncio
+import logging
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, select
+
+from app.database import async_session_maker, close_db
+from app.models.photo import Photo
+from app.models.photo_timeline import PhotoTimelineBucket
+
+logger = logging.getLogger("app.commands")
+
+
+async def _rebuild_user(user_id: int) -> int:
+    async with async_session_maker() as session:
+        day = func.date(Photo.created_at)
+        result = await session.execute(
+            select(day.label("bucket"), func.count().label("photo_count"))
+            .where(Photo.owner_id == user_id)
+            .group_by(day)
+        )
+        # SQLite의 date()는 문자열을 반환
+        rows = [
+            {
+                "owner_id": user_id,
+                "bucket": row.bucket if isinstance(row.bucket, date) else date.fromisoformat(row.bucket),
+                "photo_count": row.photo_count,
+            }
+            for row in result.all()
+        ]
+        await session.execute(delete(PhotoTimelineBucket).where(PhotoTimelineBucket.owner_id == user_id))
+        if rows:
+            await session.execute(insert(PhotoTimelineBucket), rows)
+        await session.commit()
+        return len(rows)
+
+
+async def rebuild(user_id: Optional[int]) -> None:
+    if user_id is not None:
+        user_ids = [user_id]
+    else:
+        async with async_session_maker() as session:
+            result = await session.execute(select(Photo.owner_id).distinct())
+            user_ids = [row.owner_id for row in result.all()]
+        # 사진이 모두 삭제된 사용자의 남은 버킷 정리
+        async with async_session_maker() as session:
+            await session.execute(
+                delete(PhotoTimelineBucket).where(PhotoTimelineBucket.owner_id.not_in(user_ids))
+            )
+            await session.commit()
+
+    buckets = 0
+    for uid in user_ids:
+        buckets += await _rebuild_user(uid)
+    logger.info("Photo timeline rebuilt", extra={"event": "photo_timeline", "users": len(user_ids), "buckets": buckets})
+    print(f"Rebuilt {buckets} timeline buckets for {len(user_ids)} users")
+    await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(rebuild(args.user_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Rebuild the full-text search index from photos and albums.
+
+검색 기능 도입 전 데이터 색인, 토크나이저 변경 후 재색인에 사용합니다.
+배치 단위로 커밋하므로 대용량에서도 트랜잭션이 길어지지 않습니다.
+
+Usage:
+    python -m app.commands.rebuild_search_index [--batch-size 500]
+"""
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import select
+
+from app.database import async_session_maker, close_db
+from app.models.album import Album
+from app.models.photo import Photo
+from app.services.search import SearchService
+
+logger = logging.getLogger("app.commands")
+
+
+async def _reindex(model, index, batch_size: int) -> int:
+    """Index all rows of `model` in id order, one transaction per batch."""
+    last_id = 0
+    total = 0
+    while True:
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(model).where(model.id > last_id).order_by(model.id).limit(batch_size)
+            )
+            rows = list(result.scalars().all())
+            if not rows:
+                return total
+            await index(SearchService(session), rows)
+            await session.commit()
+        last_id = rows[-1].id
+        total += len(rows)
+
+
+async def rebuild(batch_size: int) -> None:
+    photos = await _reindex(Photo, lambda service, rows: service.index_photos(rows), batch_size)
+
+    async def _index_albums(service: SearchService, rows) -> None:
+        for album in rows:
+            await service.index_album(album)
+
+    albums = await _reindex(Album, _index_albums, batch_size)
+    logger.info("Search index rebuilt", extra={"event": "search_index", "photos": photos, "albums": albums})
+    print(f"Indexed {photos} photos and {albums} albums")
+    await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(rebuild(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -186,6 +186,152 @@ class Settings(BaseSettings):
         description="Log 서비스 타임아웃 (초)",
     )
     
+    # Batch Operations
+    photo_batch_max_ids: int = Field(
+        default=1000,
+        description="사진 일괄 처리(삭제) 요청 1회당 최대 사진 수",
+    )
+    photo_upload_batch_max_files: int = Field(
+        default=50,
+        description="다중 파일 업로드 요청 1회당 최대 파일 수",
+    )
+    storage_upload_concurrency: int = Field(
+        default=8,
+        description="다중 파일 업로드 시 동시 Object Storage PUT 요청 수",
+    )
+    storage_delete_concurrency: int = Field(
+        default=16,
+        description="Object Storage 일괄 삭제 시 동시 DELETE 요청 수",
+    )
+    zip_download_prefetch: int = Field(
+        default=2,
+        description="앨범 ZIP 다운로드 시 현재 사진과 함께 미리 받아둘 사진 수",
+    )
+    
+    # Album Detail Pagination
+    album_photos_page_size: int = Field(
+        default=100,
+        description="앨범 상세·공유 앨범 응답에 포함할 첫 페이지 사진 수 (나머지는 photos?cursor=로 이어 조회)",
+    )
+    
+    # Near-duplicate Detection (perceptual hash 인덱스, 워커 프로세스별 메모리 캐시)
+    similarity_index_max_users: int = Field(
+        default=256,
+        description="메모리에 유지할 사용자별 유사 사진 인덱스 수 (LRU)",
+    )
+    similarity_index_ttl_seconds: int = Field(
+        default=600,
+        description="유사 사진 인덱스 재생성 주기 (초). 다른 워커의 업로드/삭제 반영 지연 상한",
+    )
+    
+    # Share Link Cache (공유 링크 토큰·앨범 구성, 워커 프로세스별 메모리 캐시)
+    share_cache_ttl_seconds: int = Field(
+        default=30,
+        description="공유 링크·앨범 구성 캐시 유지 시간 (초). 다른 워커의 비활성화/앨범 변경 반영 지연 상한",
+    )
+    share_cache_max_links: int = Field(
+        default=10000,
+        description="메모리에 유지할 공유 링크 토큰 수 (LRU)",
+    )
+    share_cache_max_albums: int = Field(
+        default=1000,
+        description="메모리에 유지할 공유 앨범 구성(정렬된 사진 ID 배열) 수 (LRU)",
+    )
+    shared_album_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="직렬화된 공유 앨범 응답 캐시 최대 크기 (바이트, LRU)",
+    )
+    share_negative_cache_seconds: int = Field(
+        default=60,
+        description="없는 공유 토큰을 DB 재조회 없이 거절하는 시간 (초)",
+    )
+    share_negative_cache_max_tokens: int = Field(
+        default=100000,
+        description="음성 캐시에 유지할 없는 토큰 수 (LRU)",
+    )
+    share_token_filter_sync_seconds: int = Field(
+        default=2,
+        description="필터에 없는 토큰 요청 시 다른 워커가 만든 토큰을 DB에서 반영하는 최소 간격 (초)",
+    )
+    share_token_filter_rebuild_seconds: int = Field(
+        default=3600,
+        description="유효 공유 토큰 Bloom filter 재생성 주기 (초, 삭제된 토큰 정리)",
+    )
+    share_image_url_ttl_seconds: int = Field(
+        default=600,
+        description="공유 앨범 응답에 담는 서명된 이미지 URL 유효 시간 (초). 다른 워커의 링크 비활성화·사진 삭제 반영 지연 상한",
+    )
+    share_album_max_age_seconds: int = Field(
+        default=60,
+        description="공유 앨범 JSON의 Cache-Control max-age (초, CDN·프록시 캐시). 링크 비활성화가 공용 캐시에 반영되는 지연 상한",
+    )
+    share_album_stale_while_revalidate_seconds: int = Field(
+        default=300,
+        description="공유 앨범 JSON의 stale-while-revalidate (초). 응답 속 서명 이미지 URL 만료 전까지로 제한",
+    )
+    share_manifest_enabled: bool = Field(
+        default=False,
+        description="공유 링크별 정적 매니페스트 게시 허용 (publish_manifest 링크의 앨범 JSON을 Object Storage에 기록)",
+    )
+    share_manifest_base_url: str = Field(
+        default="",
+        description="매니페스트를 제공하는 공개 URL 접두사 (미설정 시 https://{NHN_CDN_DOMAIN}/{컨테이너})",
+    )
+    share_manifest_token_seconds: int = Field(
+        default=3600,
+        description="매니페스트 속 사진 CDN 토큰 유효 시간 (초). 남은 시간이 1/4 미만이면 다시 게시",
+    )
+    share_manifest_refresh_seconds: int = Field(
+        default=30,
+        description="매니페스트 갱신 루프 주기 (초). 앨범 변경·비활성화·만료가 매니페스트에 반영되는 지연 상한",
+    )
+    share_view_flush_seconds: int = Field(
+        default=10,
+        description="메모리에 누적한 공유 링크 조회수를 DB에 반영하는 주기 (초)",
+    )
+    
+    # Usage & Quota (user_usage 카운터 기반, 업로드 시 행 1개 조회로 확인)
+    user_quota_bytes: int = Field(
+        default=0,
+        description="사용자별 사진 저장 용량 한도 (바이트, 0이면 무제한)",
+    )
+    user_quota_photos: int = Field(
+        default=0,
+        description="사용자별 사진 수 한도 (0이면 무제한)",
+    )
+    usage_reconcile_interval_seconds: int = Field(
+        default=3600,
+        description="사용량 카운터 재집계 주기 (초, 0이면 비활성화)",
+    )
+    
+    # Background Deletion (앨범·계정 삭제는 soft delete 후 deletion_jobs 워커가 청크 단위로 정리)
+    deletion_chunk_size: int = Field(
+        default=500,
+        description="삭제 작업 1회 트랜잭션에서 지울 최대 행(사진) 수",
+    )
+    deletion_job_poll_seconds: int = Field(
+        default=60,
+        description="삭제 작업 워커의 대기 작업 확인 주기 (초, 0이면 비활성화)",
+    )
+    deletion_job_lease_seconds: int = Field(
+        default=300,
+        description="실행 중인 삭제 작업의 임대 시간 (초). 워커가 중단되면 이후 다른 워커가 이어받음",
+    )
+    deletion_job_max_attempts: int = Field(
+        default=5,
+        description="삭제 작업 최대 시도 횟수 (초과 시 failed)",
+    )
+    
+    # Resumable Uploads
+    upload_session_ttl_seconds: int = Field(
+        default=86400,
+        description="재개 가능 업로드 세션 유효 시간 (초)",
+    )
+    upload_chunk_max_bytes: int = Field(
+        default=5 * 1024 * 1024,
+        description="재개 가능 업로드 PATCH 요청 1회당 최대 청크 크기 (바이트)",
+    )
+    
     # NHN Cloud Log & Crash
     nhn_log_appkey: str = Field(default="")
     nhn_log_url: str = Field(
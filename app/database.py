@@ -133,12 +133,6 @@ class Base(DeclarativeBase):
     pass
 
 
-async def init_db() -> None:
-    """Initialize database by creating all tables."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-
 async def close_db() -> None:
     """Close database connections properly."""
     await engine.dispose()
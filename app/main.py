@@ -20,9 +20,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.config import get_settings
-from app.database import init_db, close_db
-from app.routers import auth_router, photos_router, albums_router, share_router
+from app.database import close_db
+from app.routers import auth_router, photos_router, albums_router, share_router, uploads_router, search_router
 from app.routers import health as health_router
+from app.services.usage import usage_reconcile_loop
+from app.services.deletion import deletion_worker_loop
+from app.services.share_cache import build_share_token_filter
+from app.services.share_manifest import share_manifest_loop
+from app.services.view_counter import get_view_counter, view_counter_flush_loop
 from app.utils.prometheus_metrics import (
     exceptions_total,
     ready,
@@ -71,8 +76,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         version=settings.app_version,
         environment=settings.environment.value,
     )
-    await init_db()
-    ready.set(1)  # Health check 통과: 설정 검증·DB 초기화 완료 후
+    # 스키마는 Alembic 마이그레이션(alembic upgrade head)으로 관리: 기동 시 DDL 실행/인트로스펙션 없음
+    # 유효 공유 토큰 Bloom filter: 무작위 토큰 스캔을 DB 조회 없이 거절 (실패 시 필터 없이 동작)
+    await build_share_token_filter()
+    ready.set(1)  # Health check 통과: 설정 검증 완료 후
     logger_service = get_logger_service()
     await logger_service.start()
 
@@ -81,6 +88,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     
     # 비즈니스 메트릭 수집: 주기적으로 DB에서 집계하여 메트릭 업데이트
     business_metrics_task = asyncio.create_task(business_metrics_loop())
+    
+    # 사용량 카운터(user_usage) 주기 재집계
+    usage_reconcile_task = (
+        asyncio.create_task(usage_reconcile_loop())
+        if settings.usage_reconcile_interval_seconds > 0
+        else None
+    )
+    
+    # 삭제 작업(deletion_jobs) 재시도·중단된 작업 재개
+    deletion_worker_task = (
+        asyncio.create_task(deletion_worker_loop())
+        if settings.deletion_job_poll_seconds > 0
+        else None
+    )
+    
+    # 공유 링크 조회수 버퍼 주기 반영
+    view_counter_task = asyncio.create_task(view_counter_flush_loop())
+    
+    # 정적 공유 매니페스트 갱신·tombstone 처리
+    share_manifest_task = (
+        asyncio.create_task(share_manifest_loop())
+        if settings.share_manifest_enabled
+        else None
+    )
 
     yield
 
@@ -123,6 +154,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         await business_metrics_task
     except asyncio.CancelledError:
         pass
+    if usage_reconcile_task:
+        usage_reconcile_task.cancel()
+        try:
+            await usage_reconcile_task
+        except asyncio.CancelledError:
+            pass
+    if deletion_worker_task:
+        deletion_worker_task.cancel()
+        try:
+            await deletion_worker_task
+        except asyncio.CancelledError:
+            pass
+    if share_manifest_task:
+        share_manifest_task.cancel()
+        try:
+            await share_manifest_task
+        except asyncio.CancelledError:
+            pass
+    view_counter_task.cancel()
+    try:
+        await view_counter_task
+    except asyncio.CancelledError:
+        pass
+    # 남은 조회수 마지막 반영 (DB 연결 종료 전)
+    await get_view_counter().flush()
 
     await logger_service.stop()
     await close_db()
@@ -225,6 +281,8 @@ app.include_router(auth_router)
 app.include_router(photos_router)
 app.include_router(albums_router)
 app.include_router(share_router)
+app.include_router(uploads_router)
+app.include_router(search_router)
 app.include_router(health_router.router)
 
 
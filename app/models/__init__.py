@@ -6,5 +6,12 @@ from app.models.user import User
 from app.models.photo import Photo
 from app.models.album import Album, AlbumPhoto
 from app.models.share import ShareLink
+from app.models.stored_object import StoredObject
+from app.models.upload_session import UploadSession
+from app.models.search_document import SearchDocument
+from app.models.photo_timeline import PhotoTimelineBucket
+from app.models.user_usage import UserUsage
+from app.models.deletion_job import DeletionJob
+from app.models.share_view import ShareLinkDailyView
 
-__all__ = ["User", "Photo", "Album", "AlbumPhoto", "ShareLink"]
+__all__ = ["User", "Photo", "Album", "AlbumPhoto", "ShareLink", "StoredObject", "UploadSession", "SearchDocument", "PhotoTimelineBucket", "UserUsage", "DeletionJob", "ShareLinkDailyView"]
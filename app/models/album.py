@@ -4,7 +4,7 @@ Album model for organizing photos into collections.
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String, DateTime, Integer, ForeignKey, Text
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Text, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -19,6 +19,10 @@ class Album(Base):
     """Album model for grouping photos together."""
     
     __tablename__ = "albums"
+    __table_args__ = (
+        # 목록 keyset 페이지네이션: WHERE owner_id = ? ORDER BY created_at DESC, id DESC
+        Index("ix_albums_owner_created_id", "owner_id", "created_at", "id"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     owner_id: Mapped[int] = mapped_column(
@@ -31,7 +35,7 @@ class Album(Base):
     
     # Cover photo (optional)
     cover_photo_id: Mapped[Optional[int]] = mapped_column(
-        Integer, ForeignKey("photos.id", ondelete="SET NULL"), nullable=True
+        Integer, ForeignKey("photos.id", ondelete="SET NULL"), nullable=True, index=True
     )
     
     # Timestamps
@@ -41,6 +45,14 @@ class Album(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+    # 앨범 정보·구성·포함 사진이 바뀔 때마다 증가 (공유 앨범 응답 캐시 키)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+    # 삭제 요청 시각 (설정되면 조회·공유에서 제외, 연관 행은 deletion_jobs 워커가 정리)
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )
     
     # Relationships
     owner: Mapped["User"] = relationship("User", back_populates="albums")
@@ -65,6 +77,14 @@ class AlbumPhoto(Base):
     """
     
     __tablename__ = "album_photos"
+    __table_args__ = (
+        # 같은 사진은 앨범에 한 번만: 추가는 INSERT ... ON CONFLICT DO NOTHING으로 처리
+        UniqueConstraint("album_id", "photo_id", name="uq_album_photos_album_photo"),
+        # 앨범 내 사진 목록/개수/최대 order: WHERE album_id = ? ORDER BY order
+        Index("ix_album_photos_album_order", "album_id", "order"),
+        # 사진 삭제 시 연관 행 조회, 앨범 포함 여부 확인: WHERE photo_id = ? (AND album_id = ?)
+        Index("ix_album_photos_photo_album", "photo_id", "album_id"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     album_id: Mapped[int] = mapped_column(
@@ -0,0 +1,52 @@
+"""
+Deletion job model (대용량 앨범·계정 삭제를 요청 밖에서 청크 단위로 처리).
+
+삭제 요청은 대상에 deleted_at(soft delete)만 표시하고 작업 행을 넣은 뒤 202로 응답합니다.
+워커는 stage 순서대로 연관 행을 deletion_chunk_size개씩 지우며, 각 청크 삭제와 stage/processed 갱신을
+같은 트랜잭션으로 커밋하므로 중단되어도 마지막 체크포인트부터 이어서 진행합니다.
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, DateTime, Integer, Text, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+JOB_KIND_ALBUM = "album"
+JOB_KIND_USER = "user"
+
+JOB_STATUS_PENDING = "pending"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_DONE = "done"
+JOB_STATUS_FAILED = "failed"
+
+
+class DeletionJob(Base):
+    """Background deletion of an album or a user account."""
+
+    __tablename__ = "deletion_jobs"
+    __table_args__ = (
+        # 워커 폴링: WHERE status IN ('pending', 'running') ORDER BY id
+        Index("ix_deletion_jobs_status_id", "status", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(16), nullable=False)
+    # 대상 행은 작업 마지막에 삭제되므로 FK 없음
+    target_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default=JOB_STATUS_PENDING)
+    # 체크포인트: 진행 중인 단계와 지금까지 삭제한 행 수
+    stage: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # 실행 중인 워커의 임대 만료 시각 (지나면 다른 워커가 이어받음)
+    locked_until: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<DeletionJob(id={self.id}, kind={self.kind}, target_id={self.target_id}, status={self.status})>"
@@ -5,7 +5,7 @@ Actual photo files are stored in NHN Cloud Object Storage.
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String, DateTime, Integer, ForeignKey, Text
+from sqlalchemy import BigInteger, String, DateTime, Integer, SmallInteger, ForeignKey, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -22,6 +22,14 @@ class Photo(Base):
     """
     
     __tablename__ = "photos"
+    __table_args__ = (
+        # 사용자별 촬영일 정렬/필터: WHERE owner_id = ? ORDER BY taken_at
+        Index("ix_photos_owner_taken_at", "owner_id", "taken_at"),
+        # 사용자별 중복 확인: WHERE owner_id = ? AND content_hash = ?
+        Index("ix_photos_owner_content_hash", "owner_id", "content_hash"),
+        # 목록 keyset 페이지네이션: WHERE owner_id = ? ORDER BY created_at DESC, id DESC
+        Index("ix_photos_owner_created_id", "owner_id", "created_at", "id"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     owner_id: Mapped[int] = mapped_column(
@@ -38,11 +46,29 @@ class Photo(Base):
     storage_path: Mapped[str] = mapped_column(
         String(500), nullable=False, index=True
     )
+    # SHA-256 (hex). stored_objects.content_hash와 연결되며, presigned 업로드는 확인 전까지 None
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True, index=True
+    )
     
     # Optional metadata
     title: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
+    # Placeholder (업로드/업로드 확인 시 1회 계산): blurhash, 대표 색상(#rrggbb)
+    blurhash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    dominant_color: Mapped[Optional[str]] = mapped_column(String(7), nullable=True)
+    
+    # Image metadata (업로드 시 헤더에서 추출, 정렬·필터는 SQL로 처리)
+    width: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
+    height: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
+    orientation: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True, index=True)
+    taken_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    camera: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
+    
+    # Perceptual hash (dHash 64비트, 부호 있는 정수). 근접 중복 검색은 메모리 인덱스(services/similarity_index.py)로 처리하므로 DB 인덱스 없음
+    phash: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow
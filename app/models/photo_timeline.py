@@ -0,0 +1,27 @@
+"""
+Photo timeline rollup model (사용자별 일 단위 사진 수).
+
+사진 업로드/삭제 시 증분 갱신되며, 타임라인 조회는 이 테이블만 읽습니다 (photos GROUP BY 없음).
+버킷은 사진 목록 정렬 기준과 같은 created_at(UTC)의 날짜입니다.
+"""
+from datetime import date
+
+from sqlalchemy import Date, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class PhotoTimelineBucket(Base):
+    """Number of photos a user added on one (UTC) day."""
+
+    __tablename__ = "photo_timeline_buckets"
+
+    owner_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    bucket: Mapped[date] = mapped_column(Date, primary_key=True)
+    photo_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<PhotoTimelineBucket(owner_id={self.owner_id}, bucket={self.bucket}, count={self.photo_count})>"
@@ -0,0 +1,50 @@
+"""
+Search document model (사진·앨범 전문 검색 색인).
+
+검색 대상 텍스트를 토큰화(app/utils/search_tokens.py)해 tokens 컬럼에 저장하고,
+DB별 전문 검색 인덱스가 이 컬럼을 색인합니다 (마이그레이션 0006 참고):
+- SQLite: FTS5 외부 콘텐츠 테이블 search_documents_fts + 동기화 트리거
+- PostgreSQL: to_tsvector('simple', tokens) GIN 인덱스
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Text, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+DOC_TYPE_PHOTO = "photo"
+DOC_TYPE_ALBUM = "album"
+
+
+class SearchDocument(Base):
+    """One searchable photo or album."""
+
+    __tablename__ = "search_documents"
+    __table_args__ = (
+        UniqueConstraint("doc_type", "doc_id", name="uq_search_documents_doc"),
+        # 사용자 범위 검색: WHERE owner_id = ? [AND doc_type = ?]
+        Index("ix_search_documents_owner_type", "owner_id", "doc_type"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    owner_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    doc_type: Mapped[str] = mapped_column(String(16), nullable=False)
+    doc_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # 결과 표시용 원문
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    body: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # 공백으로 구분된 검색 토큰 (한글은 bigram)
+    tokens: Mapped[str] = mapped_column(Text, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return f"<SearchDocument({self.doc_type}:{self.doc_id})>"
@@ -4,7 +4,7 @@ Share link model for public album sharing.
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, DateTime, Integer, ForeignKey, Boolean
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Boolean, Index, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -20,6 +20,12 @@ class ShareLink(Base):
     """
     
     __tablename__ = "share_links"
+    __table_args__ = (
+        # 앨범별 공유 링크 목록: WHERE album_id = ? ORDER BY created_at DESC
+        Index("ix_share_links_album_created", "album_id", "created_at"),
+        # 매니페스트 게시 대상만 훑는 갱신 루프용
+        Index("ix_share_links_publish_manifest", "publish_manifest"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     album_id: Mapped[int] = mapped_column(
@@ -37,6 +43,14 @@ class ShareLink(Base):
         DateTime, nullable=True
     )
     
+    # Static manifest (CDN 직접 제공): 게시 여부, 게시된 album version, 매니페스트 속 CDN 토큰 만료 시각
+    # manifest_version이 NULL이면 게시된 매니페스트 없음 (미게시 또는 tombstone)
+    publish_manifest: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=false()
+    )
+    manifest_version: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    manifest_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    
     # Statistics
     view_count: Mapped[int] = mapped_column(Integer, default=0)
     
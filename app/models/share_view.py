@@ -0,0 +1,26 @@
+"""
+Per-day share link view counts (공유 링크 일별 조회수).
+
+조회수는 요청마다 쓰지 않고 프로세스 메모리에 모았다가 주기적으로 한 번에 반영합니다 (view_counter).
+"""
+from datetime import date
+
+from sqlalchemy import Date, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class ShareLinkDailyView(Base):
+    """Number of views a share link received on one (UTC) day."""
+
+    __tablename__ = "share_link_daily_views"
+
+    share_link_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("share_links.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    view_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<ShareLinkDailyView(share_link_id={self.share_link_id}, day={self.day}, views={self.view_count})>"
@@ -0,0 +1,37 @@
+"""
+Stored object model for content-addressed Object Storage.
+동일한 바이트(SHA-256)는 Object Storage에 한 번만 저장하고, 참조하는 Photo 수를 ref_count로 관리합니다.
+"""
+from datetime import datetime
+
+from sqlalchemy import String, DateTime, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class StoredObject(Base):
+    """
+    One physical object in Object Storage, keyed by its SHA-256 content hash.
+    The object is deleted from storage when ref_count drops to zero.
+    """
+
+    __tablename__ = "stored_objects"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    content_hash: Mapped[str] = mapped_column(
+        String(64), unique=True, index=True, nullable=False
+    )
+    storage_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    file_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    content_type: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    # 이 오브젝트를 참조하는 Photo 수
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return f"<StoredObject(content_hash={self.content_hash}, ref_count={self.ref_count})>"
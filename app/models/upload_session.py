@@ -0,0 +1,53 @@
+"""
+Resumable upload session model.
+청크 업로드 진행 상태를 저장하고, 청크는 Object Storage에 세그먼트 오브젝트로 보관합니다.
+"""
+from datetime import datetime
+
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class UploadSession(Base):
+    """
+    One in-progress resumable upload.
+    Segment i is stored at `{segment_prefix}/{i:06d}`; `offset` is the number of bytes received.
+    """
+
+    __tablename__ = "upload_sessions"
+    __table_args__ = (
+        # 만료 세션 정리: WHERE expires_at < ?
+        Index("ix_upload_sessions_expires_at", "expires_at"),
+    )
+
+    # URL에 노출되므로 추측 불가능한 랜덤 ID 사용
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    owner_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    album_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("albums.id", ondelete="CASCADE"), nullable=False
+    )
+
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    content_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    total_size: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # 수신 완료 바이트 수 / 저장된 세그먼트 수
+    offset: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    segment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    segment_prefix: Mapped[str] = mapped_column(String(500), nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    @property
+    def is_complete(self) -> bool:
+        return self.offset >= self.total_size
+
+    def __repr__(self) -> str:
+        return f"<UploadSession(id={self.id}, offset={self.offset}/{self.total_size})>"
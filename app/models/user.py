@@ -2,7 +2,7 @@
 User model for authentication and user management.
 """
 from datetime import datetime
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy import String, DateTime, Boolean
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -34,6 +34,10 @@ class User(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+    # 탈퇴 요청 시각 (is_active=False와 함께 설정, 데이터는 deletion_jobs 워커가 정리)
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )
     
     # Relationships
     photos: Mapped[List["Photo"]] = relationship(
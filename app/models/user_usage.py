@@ -0,0 +1,32 @@
+"""
+Per-user usage counters (사진 수, 앨범 수, 사용 바이트).
+
+사진 업로드/삭제, 앨범 생성/삭제와 같은 트랜잭션에서 증분 갱신되며,
+주기적인 재집계(services/usage.py reconcile_usage)가 어긋난 값을 바로잡습니다.
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class UserUsage(Base):
+    """Usage totals for one user. bytes_used는 사용자 사진의 file_size 합 (중복 제거 전 논리 용량)."""
+
+    __tablename__ = "user_usage"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    photo_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    album_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bytes_used: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    # 마지막 재집계 시각
+    reconciled_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<UserUsage(user_id={self.user_id}, photos={self.photo_count}, bytes={self.bytes_used})>"
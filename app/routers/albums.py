@@ -1,11 +1,15 @@
 """
 Albums router for album management.
 """
-from typing import List
+import logging
+from typing import List, Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.database import get_db
 from app.models.user import User
 from app.schemas.album import (
@@ -13,12 +17,19 @@ from app.schemas.album import (
     AlbumResponse,
     AlbumUpdate,
     AlbumWithPhotos,
+    AlbumPage,
     AlbumPhotoAdd,
     AlbumPhotoRemove,
+    AlbumPhotoMove,
 )
+from app.schemas.photo import PhotoPage
 from app.schemas.share import ShareLinkCreate, ShareLinkResponse
-from app.services.album import AlbumService
+from app.services.album import AlbumService, compact_album_order
+from app.services.deletion import run_deletion_job
+from app.services.nhn_object_storage import get_storage_service
+from app.services.share_manifest import delete_share_manifest, manifest_url, publish_share_manifest
 from app.dependencies.auth import get_current_active_user
+from app.utils.zip_stream import StoredZipStream
 from app.utils.prometheus_metrics import (
     album_operations_total,
     album_photo_operations_total,
@@ -27,9 +38,42 @@ from app.utils.prometheus_metrics import (
     share_links_total,
 )
 
+logger = logging.getLogger("app.albums")
 router = APIRouter(prefix="/albums", tags=["Albums"])
 
 
+def album_zip_response(album_name: str, archive: StoredZipStream) -> StreamingResponse:
+    """
+    Stream an album archive as an attachment.
+    바이트는 Object Storage에서 청크 단위로 읽어 그대로 내보내므로 앨범 크기와 무관하게 메모리 사용량이 일정합니다.
+    """
+    storage = get_storage_service()
+    filename = f"{album_name or 'album'}.zip"
+    ascii_name = filename.encode("ascii", "replace").decode().replace("?", "_").replace('"', "_")
+    
+    async def _body():
+        try:
+            async for chunk in archive.stream(
+                lambda entry: storage.stream_file(entry.source),
+                prefetch=get_settings().zip_download_prefetch,
+            ):
+                yield chunk
+        except Exception as e:
+            # 헤더는 이미 전송됨: 연결을 끊어 클라이언트가 불완전한 파일임을 알 수 있게 함
+            logger.error("Album zip stream failed", exc_info=e, extra={"event": "album_zip", "album": album_name})
+            raise
+    
+    return StreamingResponse(
+        _body(),
+        media_type="application/zip",
+        headers={
+            "Content-Length": str(archive.content_length),
+            "Content-Disposition": f"attachment; filename=\"{ascii_name}\"; filename*=UTF-8''{quote(filename)}",
+            "Cache-Control": "private, no-store",
+        },
+    )
+
+
 @router.post(
     "/",
     response_model=AlbumResponse,
@@ -57,15 +101,14 @@ async def create_album(
         # 비즈니스 메트릭 실시간 업데이트: 앨범 수
         albums_total.labels(type="total").inc()
         
-        photo_count = await album_service.get_album_photo_count(album.id)
-        
+        # 새 앨범은 사진이 없으므로 추가 쿼리 없이 응답
         return AlbumResponse(
             id=album.id,
             owner_id=album.owner_id,
             name=album.name,
             description=album.description,
             cover_photo_id=album.cover_photo_id,
-            photo_count=photo_count,
+            photo_count=0,
             created_at=album.created_at,
             updated_at=album.updated_at,
         )
@@ -95,23 +138,40 @@ async def get_albums(
     limit = min(limit, 100)
     
     album_service = AlbumService(db)
-    albums = await album_service.get_user_albums(current_user.id, skip, limit)
+    return await album_service.get_user_albums(current_user.id, skip, limit)
+
+
+@router.get(
+    "/page",
+    response_model=AlbumPage,
+    summary="Get user's albums (cursor pagination)",
+)
+async def get_albums_page(
+    limit: int = 50,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> AlbumPage:
+    """
+    Get the current user's albums, newest first, with cursor pagination.
     
-    result = []
-    for album in albums:
-        photo_count = await album_service.get_album_photo_count(album.id)
-        result.append(AlbumResponse(
-            id=album.id,
-            owner_id=album.owner_id,
-            name=album.name,
-            description=album.description,
-            cover_photo_id=album.cover_photo_id,
-            photo_count=photo_count,
-            created_at=album.created_at,
-            updated_at=album.updated_at,
-        ))
+    - **limit**: Maximum number of albums to return (max 100)
+    - **cursor**: `next_cursor` from the previous response (omit for the first page)
     
-    return result
+    `next_cursor`가 null이면 마지막 페이지입니다.
+    """
+    limit = max(1, min(limit, 100))
+    
+    album_service = AlbumService(db)
+    try:
+        albums, next_cursor = await album_service.get_user_albums_page(current_user.id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return AlbumPage(
+        items=albums,
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
@@ -125,11 +185,12 @@ async def get_album(
     current_user: User = Depends(get_current_active_user),
 ) -> AlbumWithPhotos:
     """
-    Get a specific album with all its photos.
+    Get a specific album with the first page of its photos.
     
     - **album_id**: ID of the album to retrieve
     
-    Returns the album with all photos including secure CDN URLs.
+    Returns the album with up to `album_photos_page_size` photos including secure CDN URLs.
+    `next_cursor`가 있으면 `GET /albums/{album_id}/photos?cursor=`로 이어서 조회합니다.
     """
     album_service = AlbumService(db)
     album = await album_service.get_album_by_id(album_id, current_user.id)
@@ -143,6 +204,77 @@ async def get_album(
     return await album_service.get_album_with_photos(album)
 
 
+@router.get(
+    "/{album_id}/photos",
+    response_model=PhotoPage,
+    summary="Get album photos (cursor pagination)",
+)
+async def get_album_photos_page(
+    album_id: int,
+    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> PhotoPage:
+    """
+    Get an album's photos in album order, with cursor pagination.
+    
+    - **limit**: Maximum number of photos to return (max 500)
+    - **cursor**: `next_cursor` from the previous response (omit for the first page)
+    
+    `next_cursor`가 null이면 마지막 페이지입니다.
+    """
+    limit = max(1, min(limit, 500))
+    
+    album_service = AlbumService(db)
+    album = await album_service.get_album_by_id(album_id, current_user.id)
+    
+    if not album:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Album not found",
+        )
+    
+    try:
+        photos, next_cursor = await album_service.get_album_photos_page(album.id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return PhotoPage(
+        items=await album_service.photo_service.get_photos_with_urls(photos),
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/{album_id}/download.zip",
+    summary="Download all photos in an album as a ZIP",
+    response_class=StreamingResponse,
+)
+async def download_album_zip(
+    album_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """
+    Download an album as a ZIP (무압축 STORED, 앨범 순서).
+    
+    아카이브는 임시 파일 없이 즉석에서 생성되며 Content-Length가 미리 제공되어 진행률 표시가 가능합니다.
+    같은 파일명은 `name (1).jpg` 형태로 구분됩니다.
+    """
+    album_service = AlbumService(db)
+    album = await album_service.get_album_by_id(album_id, current_user.id)
+    
+    if not album:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Album not found",
+        )
+    
+    archive = await album_service.get_album_archive(album.id)
+    return album_zip_response(album.name, archive)
+
+
 @router.patch(
     "/{album_id}",
     response_model=AlbumResponse,
@@ -177,18 +309,7 @@ async def update_album(
         # 메트릭 수집: 앨범 수정 성공
         album_operations_total.labels(operation="update", result="success").inc()
         
-        photo_count = await album_service.get_album_photo_count(updated_album.id)
-        
-        return AlbumResponse(
-            id=updated_album.id,
-            owner_id=updated_album.owner_id,
-            name=updated_album.name,
-            description=updated_album.description,
-            cover_photo_id=updated_album.cover_photo_id,
-            photo_count=photo_count,
-            created_at=updated_album.created_at,
-            updated_at=updated_album.updated_at,
-        )
+        return await album_service.get_album_response(updated_album)
     except Exception as e:
         # 메트릭 수집: 앨범 수정 실패
         album_operations_total.labels(operation="update", result="failure").inc()
@@ -197,20 +318,22 @@ async def update_album(
 
 @router.delete(
     "/{album_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Delete album",
 )
 async def delete_album(
     album_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
-) -> None:
+) -> dict:
     """
     Delete an album.
     
     - **album_id**: ID of the album to delete
     
     Note: This only deletes the album, not the photos in it.
+    앨범은 즉시 목록·조회·공유에서 사라지고, 앨범 구성·공유 링크는 응답 후 백그라운드에서 청크 단위로 삭제됩니다.
     """
     album_service = AlbumService(db)
     album = await album_service.get_album_by_id(album_id, current_user.id)
@@ -222,18 +345,31 @@ async def delete_album(
         )
     
     try:
-        await album_service.delete_album(album)
+        job = await album_service.delete_album(album)
         # 메트릭 수집: 앨범 삭제 성공
         album_operations_total.labels(operation="delete", result="success").inc()
     except Exception as e:
         # 메트릭 수집: 앨범 삭제 실패
         album_operations_total.labels(operation="delete", result="failure").inc()
         raise
+    
+    # 커밋 후 실행 (실패·중단 시 deletion_worker_loop가 체크포인트부터 재개)
+    background_tasks.add_task(run_deletion_job, job.id)
+    return {"message": "Album deletion scheduled", "job_id": job.id}
 
 
 # ============== Album Photos ==============
 
 
+def _check_batch_size(photo_ids: List[int]) -> None:
+    max_ids = get_settings().photo_batch_max_ids
+    if len(photo_ids) > max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many photo IDs. Maximum: {max_ids}",
+        )
+
+
 @router.post(
     "/{album_id}/photos",
     status_code=status.HTTP_200_OK,
@@ -252,7 +388,9 @@ async def add_photos_to_album(
     - **photo_ids**: List of photo IDs to add
     
     Only photos owned by the current user can be added.
+    이미 앨범에 있는 사진은 건너뜁니다. 한 번에 최대 `photo_batch_max_ids`개.
     """
+    _check_batch_size(photo_data.photo_ids)
     album_service = AlbumService(db)
     album = await album_service.get_album_by_id(album_id, current_user.id)
     
@@ -295,7 +433,9 @@ async def remove_photos_from_album(
     - **photo_ids**: List of photo IDs to remove
     
     Note: This only removes photos from the album, not from the system.
+    한 번에 최대 `photo_batch_max_ids`개.
     """
+    _check_batch_size(photo_data.photo_ids)
     album_service = AlbumService(db)
     album = await album_service.get_album_by_id(album_id, current_user.id)
     
@@ -320,6 +460,54 @@ async def remove_photos_from_album(
         raise
 
 
+@router.put(
+    "/{album_id}/photos/{photo_id}/position",
+    status_code=status.HTTP_200_OK,
+    summary="Move a photo within an album",
+)
+async def move_album_photo(
+    album_id: int,
+    photo_id: int,
+    move_data: AlbumPhotoMove,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> dict:
+    """
+    Move a photo within an album.
+    
+    - **album_id**: ID of the album
+    - **photo_id**: ID of the photo to move
+    - **after_photo_id**: Place the photo right after this photo (null이면 맨 앞)
+    
+    이동하는 사진 1행만 갱신합니다. 간격이 좁아지면 응답 후 앨범 order를 재정렬합니다.
+    """
+    album_service = AlbumService(db)
+    album = await album_service.get_album_by_id(album_id, current_user.id)
+    
+    if not album:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Album not found",
+        )
+    
+    try:
+        order, needs_compaction = await album_service.move_photo(
+            album, photo_id, move_data.after_photo_id
+        )
+    except ValueError as e:
+        album_photo_operations_total.labels(operation="move", result="failure").inc()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    
+    if needs_compaction:
+        background_tasks.add_task(compact_album_order, album.id)
+    album_photo_operations_total.labels(operation="move", result="success").inc()
+    return {"message": "Photo moved", "order": order}
+
+
 # ============== Share Links ==============
 
 
@@ -332,6 +520,7 @@ async def remove_photos_from_album(
 async def create_share_link(
     album_id: int,
     request: Request,
+    background_tasks: BackgroundTasks,
     share_data: ShareLinkCreate = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -341,6 +530,7 @@ async def create_share_link(
     
     - **album_id**: ID of the album to share
     - **expires_in_days**: Number of days until the link expires (optional)
+    - **publish_manifest**: 앨범 매니페스트를 Object Storage에 게시해 CDN이 직접 제공 (`manifest_url`)
     
     Returns a share link that can be accessed without authentication.
     """
@@ -364,6 +554,9 @@ async def create_share_link(
     
     try:
         share_link = await album_service.create_share_link(album, share_data, base_url)
+        if share_link.publish_manifest:
+            # 응답(커밋) 후 매니페스트 게시
+            background_tasks.add_task(publish_share_manifest, share_link.id)
         
         # 메트릭 수집: 공유 링크 생성 성공
         share_link_creation_total.labels(result="success").inc()
@@ -382,7 +575,11 @@ async def create_share_link(
             view_count=share_link.view_count,
             created_at=share_link.created_at,
             share_url=f"{base_url}/share/{share_link.token}",
+            manifest_url=manifest_url(share_link.token) if share_link.publish_manifest else None,
         )
+    except ValueError as e:
+        share_link_creation_total.labels(result="failure").inc()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         # 메트릭 수집: 공유 링크 생성 실패
         share_link_creation_total.labels(result="failure").inc()
@@ -427,6 +624,7 @@ async def get_album_share_links(
             view_count=sl.view_count,
             created_at=sl.created_at,
             share_url=f"{base_url}/share/{sl.token}",
+            manifest_url=manifest_url(sl.token) if sl.publish_manifest else None,
         )
         for sl in share_links
     ]
@@ -440,6 +638,7 @@ async def get_album_share_links(
 async def delete_share_link(
     album_id: int,
     share_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> None:
@@ -468,3 +667,6 @@ async def delete_share_link(
         )
     
     await album_service.delete_share_link(share_link)
+    if share_link.publish_manifest:
+        # 응답(커밋) 후 CDN 매니페스트 오브젝트 삭제
+        background_tasks.add_task(delete_share_manifest, share_link.token)
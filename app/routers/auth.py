@@ -3,9 +3,10 @@ Authentication router for user registration and login.
 """
 import time
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.database import get_db
 from app.utils.prometheus_metrics import (
     login_duration_seconds,
@@ -14,8 +15,10 @@ from app.utils.prometheus_metrics import (
     user_login_total,
 )
 from app.models.user import User
-from app.schemas.user import UserCreate, UserResponse, UserLogin, Token
+from app.schemas.user import UserCreate, UserResponse, UserLogin, Token, UserUsageResponse
 from app.services.auth import AuthService
+from app.services.deletion import run_deletion_job
+from app.services.usage import UsageService
 from app.dependencies.auth import get_current_active_user
 from app.utils.logger import log_info, log_warning, log_error
 
@@ -132,3 +135,54 @@ async def get_me(
     Requires authentication via Bearer token.
     """
     return UserResponse.model_validate(current_user)
+
+
+@router.get(
+    "/me/usage",
+    response_model=UserUsageResponse,
+    summary="Get current user's storage usage and quota",
+)
+async def get_my_usage(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> UserUsageResponse:
+    """
+    Get the current user's photo count, album count and bytes used.
+    
+    업로드/삭제 시 함께 갱신되는 카운터를 읽으므로 사진 수와 무관하게 조회 비용이 일정합니다.
+    `quota_*`가 null이면 해당 한도가 없습니다.
+    """
+    settings = get_settings()
+    usage = await UsageService(db).get_usage(current_user.id)
+    return UserUsageResponse(
+        **usage,
+        quota_bytes=settings.user_quota_bytes or None,
+        quota_photos=settings.user_quota_photos or None,
+    )
+
+
+@router.delete(
+    "/me",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Delete current user account",
+)
+async def delete_me(
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> dict:
+    """
+    Delete the current user's account with all photos and albums.
+    
+    계정은 즉시 비활성화되어 더 이상 로그인할 수 없고, 데이터와 스토리지 오브젝트는
+    응답 후 백그라운드에서 청크 단위로 삭제됩니다.
+    """
+    job = await AuthService(db).delete_user(current_user)
+    background_tasks.add_task(run_deletion_job, job.id)
+    log_info(
+        "User deletion scheduled",
+        event="user_delete",
+        user_id=current_user.id,
+        job_id=job.id,
+    )
+    return {"message": "Account deletion scheduled", "job_id": job.id}
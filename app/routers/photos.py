@@ -1,11 +1,15 @@
 """
 Photos router for photo management.
 """
+import asyncio
+import hashlib
 import logging
 import mimetypes
-from typing import List
+import re
+from datetime import date
+from typing import List, Literal, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File, Form, Query, Request
 from fastapi.responses import RedirectResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,19 +23,30 @@ from app.schemas.photo import (
     PhotoResponse,
     PhotoUpdate,
     PhotoWithUrl,
+    PhotoPage,
     PhotoUploadResponse,
     PresignedUrlRequest,
     PresignedUrlResponse,
     PhotoUploadConfirmRequest,
     PhotoUploadConfirmResponse,
+    PhotoBatchDeleteRequest,
+    PhotoBatchDeleteResponse,
+    PhotoBatchUploadItem,
+    PhotoBatchUploadResponse,
+    PhotoTimeline,
+    SimilarPhoto,
+    TimelineBucket,
 )
 from app.services.photo import PhotoService
+from app.services.timeline import TimelineService
+from app.services.usage import QuotaExceededError, UsageService
 from app.dependencies.auth import get_current_active_user
 from app.utils.prometheus_metrics import (
     image_access_total,
     image_access_duration_seconds,
     photo_upload_total,
     photo_upload_file_size_bytes,
+    photo_upload_quota_exceeded_total,
     presigned_url_generation_total,
     photo_upload_confirm_total,
     object_storage_usage_bytes,
@@ -67,6 +82,80 @@ EXTENSION_TO_CONTENT_TYPE = {
 # Maximum file size (10MB)
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
+# 업로드 스트림을 읽는 단위 (읽으면서 SHA-256 계산)
+UPLOAD_READ_CHUNK_SIZE = 1024 * 1024
+
+SHA256_HEX_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+async def read_upload_with_hash(file: UploadFile) -> Tuple[bytes, str]:
+    """
+    Read an uploaded file in chunks, computing its SHA-256 on the way.
+    
+    크기 제한을 넘는 순간 중단하므로 초과 파일을 끝까지 읽지 않음.
+    
+    Returns:
+        (content, sha256 hex digest)
+    """
+    digest = hashlib.sha256()
+    chunks = []
+    async for chunk in _iter_upload_chunks(file):
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+
+async def hash_upload(file: UploadFile) -> Tuple[int, str]:
+    """
+    Stream an uploaded file once to get its size and SHA-256 without keeping the bytes.
+    
+    다중 업로드에서 검증·중복 확인용으로 사용하며, 읽은 뒤 처음 위치로 되돌려 다시 읽을 수 있게 합니다.
+    
+    Returns:
+        (size in bytes, sha256 hex digest)
+    """
+    digest = hashlib.sha256()
+    total = 0
+    async for chunk in _iter_upload_chunks(file):
+        digest.update(chunk)
+        total += len(chunk)
+    await file.seek(0)
+    return total, digest.hexdigest()
+
+
+async def _iter_upload_chunks(file: UploadFile):
+    """Yield the upload in UPLOAD_READ_CHUNK_SIZE chunks, raising 413 once MAX_FILE_SIZE is exceeded."""
+    total = 0
+    while True:
+        chunk = await file.read(UPLOAD_READ_CHUNK_SIZE)
+        if not chunk:
+            return
+        total += len(chunk)
+        if total > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large. Maximum size: {MAX_FILE_SIZE // (1024*1024)}MB",
+            )
+        yield chunk
+
+
+async def ensure_upload_quota(
+    db: AsyncSession,
+    user: User,
+    upload_method: str,
+    photos: int,
+    bytes_used: int,
+) -> None:
+    """Reject the upload with 413 when it would exceed the user's quota (user_usage 행 1개 조회)."""
+    try:
+        await UsageService(db).check_quota(user.id, photos=photos, bytes_used=bytes_used)
+    except QuotaExceededError as e:
+        photo_upload_quota_exceeded_total.labels(upload_method=upload_method).inc()
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
+
 
 def guess_content_type(filename: str, provided_type: str = None) -> str:
     """
@@ -174,6 +263,7 @@ async def get_presigned_upload_url(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Album with ID {request.album_id} not found or you don't have access to it.",
         )
+    await ensure_upload_quota(db, current_user, "presigned", photos=1, bytes_used=request.file_size)
     
     # Create metadata
     metadata = PhotoCreate(
@@ -239,6 +329,7 @@ async def get_presigned_upload_url(
 )
 async def confirm_photo_upload(
     request: PhotoUploadConfirmRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> PhotoUploadConfirmResponse:
@@ -253,13 +344,17 @@ async def confirm_photo_upload(
     photo_service = PhotoService(db)
     
     try:
-        photo = await photo_service.confirm_photo_upload(
+        photo, redundant_path = await photo_service.confirm_photo_upload(
             photo_id=request.photo_id,
             user_id=current_user.id,
         )
         
         await db.commit()
         
+        # 같은 바이트가 이미 저장돼 있던 경우: 커밋 후 방금 업로드된 사본 삭제
+        if redundant_path:
+            background_tasks.add_task(photo_service.storage.delete_files, [redundant_path])
+        
         # 메트릭 수집: 업로드 확인 성공
         photo_upload_confirm_total.labels(result="success").inc()
         photo_upload_total.labels(upload_method="presigned", result="success").inc()
@@ -299,6 +394,230 @@ async def confirm_photo_upload(
         )
 
 
+@router.head(
+    "/by-hash/{sha256}",
+    summary="Check whether the current user already has a photo with this content hash",
+)
+async def head_photo_by_hash(
+    sha256: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Response:
+    """
+    업로드 전 중복 확인. 클라이언트가 파일의 SHA-256(hex)을 계산해 호출합니다.
+    
+    - **200**: 현재 사용자가 같은 바이트의 사진을 이미 가지고 있음. `X-Photo-Id` 헤더로 ID 반환.
+      업로드 대신 `POST /albums/{album_id}/photos`로 기존 사진을 앨범에 추가하면 됩니다.
+    - **404**: 없음. 평소대로 업로드하세요.
+    
+    다른 사용자의 사진 존재 여부는 노출하지 않습니다 (사용자 범위로만 조회).
+    """
+    content_hash = sha256.lower()
+    if not SHA256_HEX_PATTERN.match(content_hash):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="sha256 must be a 64-character hex digest",
+        )
+    photo_service = PhotoService(db)
+    photo = await photo_service.get_user_photo_by_hash(current_user.id, content_hash)
+    if not photo:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo not found")
+    return Response(status_code=status.HTTP_200_OK, headers={"X-Photo-Id": str(photo.id)})
+
+
+@router.post(
+    "/batch-delete",
+    response_model=PhotoBatchDeleteResponse,
+    summary="Delete many photos in one request",
+)
+async def batch_delete_photos(
+    request: PhotoBatchDeleteRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> PhotoBatchDeleteResponse:
+    """
+    Delete up to `photo_batch_max_ids` photos at once.
+    
+    - **photo_ids**: IDs of the photos to delete
+    
+    소유권 확인 1회 + 집합 단위 DELETE로 처리하므로 요청 수·쿼리 수가 사진 수와 무관합니다.
+    Object Storage 오브젝트는 응답 후 백그라운드에서 동시성 제한(`storage_delete_concurrency`)을 두고 삭제됩니다.
+    존재하지 않거나 다른 사용자의 사진 ID는 `not_found_ids`로 반환됩니다.
+    """
+    settings = get_settings()
+    if len(request.photo_ids) > settings.photo_batch_max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many photo IDs. Maximum: {settings.photo_batch_max_ids}",
+        )
+    
+    photo_service = PhotoService(db)
+    result = await photo_service.delete_photos(current_user.id, request.photo_ids)
+    await db.commit()
+    
+    # DB 커밋 후 스토리지 정리 (실패해도 고아 파일만 남음)
+    if result["storage_paths"]:
+        background_tasks.add_task(photo_service.storage.delete_files, result["storage_paths"])
+    
+    logger.info(
+        "Photos batch deleted",
+        extra={
+            "event": "photo_batch_delete",
+            "user_id": current_user.id,
+            "deleted": len(result["deleted_ids"]),
+            "objects": len(result["storage_paths"]),
+        },
+    )
+    return PhotoBatchDeleteResponse(
+        deleted_ids=result["deleted_ids"],
+        not_found_ids=result["not_found_ids"],
+    )
+
+
+@router.post(
+    "/batch-upload",
+    response_model=PhotoBatchUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Upload many photos in one request",
+)
+async def batch_upload_photos(
+    files: List[UploadFile] = File(..., description="Photo files to upload"),
+    album_id: int = Form(..., description="Album ID to upload photos to"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> PhotoBatchUploadResponse:
+    """
+    Upload up to `photo_upload_batch_max_files` photos at once.
+    
+    - **files**: Image files (JPEG, PNG, GIF, WebP, HEIC supported, 각 10MB 이하)
+    - **album_id**: Album ID to upload photos to (required)
+    
+    앨범 확인·DB 기록·커밋은 요청당 1회이며, Object Storage 쓰기와 이미지 분석은
+    `storage_upload_concurrency` 만큼 병렬로 처리됩니다.
+    파일은 검증·해시 단계에서 바이트를 보관하지 않고 스트리밍으로 읽으며, 업로드 단계에서 동시 처리 중인
+    파일만 메모리에 올렸다가 PUT이 끝나면 해제하므로 메모리 사용량은 배치 크기가 아닌 동시성에 비례합니다.
+    파일별 결과는 요청 순서대로 `results`에 담기며, 일부 파일이 실패해도 나머지는 저장됩니다.
+    """
+    settings = get_settings()
+    if len(files) > settings.photo_upload_batch_max_files:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many files. Maximum: {settings.photo_upload_batch_max_files}",
+        )
+    
+    # Verify album exists and user has access
+    from app.services.album import AlbumService
+    album_service = AlbumService(db)
+    album = await album_service.get_album_by_id(album_id, current_user.id)
+    if not album:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Album with ID {album_id} not found or you don't have access to it.",
+        )
+    
+    # 파일별 검증: 실패한 파일은 결과에만 기록하고 나머지는 계속 처리 (크기·해시만 계산, 바이트는 보관하지 않음)
+    semaphore = asyncio.Semaphore(settings.storage_upload_concurrency)
+    
+    async def _inspect(file: UploadFile) -> Tuple[Optional[dict], Optional[str]]:
+        content_type = guess_content_type(file.filename or "", file.content_type)
+        if not content_type or content_type not in ALLOWED_CONTENT_TYPES:
+            return None, "File type not allowed. Allowed types: JPEG, PNG, GIF, WebP, HEIC."
+        async with semaphore:
+            try:
+                file_size, content_hash = await hash_upload(file)
+            except HTTPException as e:
+                return None, e.detail
+        return {
+            "read": file.read,
+            "file_size": file_size,
+            "filename": file.filename or "photo",
+            "content_type": content_type,
+            "content_hash": content_hash,
+        }, None
+    
+    errors: dict = {}
+    valid = []
+    inspected = await asyncio.gather(*(_inspect(file) for file in files))
+    for index, (item, error) in enumerate(inspected):
+        if error:
+            errors[index] = error
+        else:
+            valid.append((index, item))
+    if valid:
+        await ensure_upload_quota(
+            db, current_user, "batch",
+            photos=len(valid), bytes_used=sum(item["file_size"] for _, item in valid),
+        )
+    
+    photo_service = PhotoService(db)
+    try:
+        uploaded = await photo_service.upload_photos(
+            user=current_user,
+            album_id=album_id,
+            files=[item for _, item in valid],
+        )
+        photos = {}
+        for (index, _), outcome in zip(valid, uploaded):
+            if outcome["photo"] is None:
+                errors[index] = outcome["error"]
+            else:
+                photos[index] = outcome["photo"]
+        
+        if photos:
+            await album_service.add_photos_to_album(
+                album, [photo.id for photo in photos.values()], current_user.id
+            )
+        await db.commit()
+    except Exception as e:
+        photo_upload_total.labels(upload_method="batch", result="failure").inc(len(files))
+        logger.error("Photo batch upload failed", exc_info=e, extra={"event": "photo_upload", "user_id": current_user.id})
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="사진 업로드에 실패했습니다. 잠시 후 다시 시도해주세요.",
+        )
+    
+    # 메트릭 수집 및 비즈니스 메트릭 실시간 업데이트
+    total_size = sum(photo.file_size for photo in photos.values())
+    photo_upload_total.labels(upload_method="batch", result="success").inc(len(photos))
+    if errors:
+        photo_upload_total.labels(upload_method="batch", result="failure").inc(len(errors))
+    for photo in photos.values():
+        photo_upload_file_size_bytes.labels(upload_method="batch").observe(photo.file_size)
+    object_storage_usage_bytes.inc(total_size)
+    object_storage_usage_by_user_bytes.labels(user_id=str(current_user.id)).inc(total_size)
+    photo_upload_size_total.labels(user_id=str(current_user.id)).inc(total_size)
+    photos_total.inc(len(photos))
+    
+    results = []
+    for index, file in enumerate(files):
+        filename = file.filename or "photo"
+        photo = photos.get(index)
+        if photo is None:
+            results.append(PhotoBatchUploadItem(filename=filename, success=False, error=errors.get(index)))
+            continue
+        photo_with_url = await photo_service.get_photo_with_url(photo)
+        results.append(PhotoBatchUploadItem(
+            filename=filename,
+            success=True,
+            photo=PhotoUploadResponse(
+                id=photo.id,
+                filename=photo.filename,
+                original_filename=photo.original_filename,
+                content_type=photo.content_type,
+                file_size=photo.file_size,
+                url=photo_with_url.url,
+            ),
+        ))
+    
+    return PhotoBatchUploadResponse(
+        album_id=album_id,
+        uploaded=len(photos),
+        failed=len(files) - len(photos),
+        results=results,
+    )
+
+
 @router.post(
     "/",
     response_model=PhotoUploadResponse,
@@ -324,18 +643,12 @@ async def upload_photo(
     - **title**: Optional title for the photo
     - **description**: Optional description
     
-    The photo will be stored in NHN Cloud Object Storage with path: photo/photo/image/{album_id}/{filename}
+    The photo will be stored in NHN Cloud Object Storage with a content-addressed path:
+    photo/photo/image/sha256/{hash[:2]}/{hash}-{suffix}.{ext}. Identical bytes are stored only once.
     Maximum file size: 10MB
     """
-    # Read file content first (needed for validation)
-    content = await file.read()
-    
-    # Validate file size
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large. Maximum size: {MAX_FILE_SIZE // (1024*1024)}MB",
-        )
+    # Read file content first (needed for validation); size limit and SHA-256 are applied while reading
+    content, content_hash = await read_upload_with_hash(file)
     
     # Guess content type from filename if not provided or invalid
     content_type = guess_content_type(file.filename or "", file.content_type)
@@ -365,6 +678,8 @@ async def upload_photo(
         description=description.strip() if description and description.strip() else None,
     )
     
+    await ensure_upload_quota(db, current_user, "direct", photos=1, bytes_used=len(content))
+    
     # Upload photo
     photo_service = PhotoService(db)
     
@@ -376,6 +691,7 @@ async def upload_photo(
             filename=file.filename or "photo",
             content_type=content_type,
             metadata=metadata,
+            content_hash=content_hash,
         )
         
         # Add photo to album
@@ -450,6 +766,66 @@ async def get_photos(
     return await photo_service.get_photos_with_urls(photos)
 
 
+@router.get(
+    "/page",
+    response_model=PhotoPage,
+    summary="Get user's photos (cursor pagination)",
+)
+async def get_photos_page(
+    limit: int = 50,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> PhotoPage:
+    """
+    Get the current user's photos, newest first, with cursor pagination.
+    
+    - **limit**: Maximum number of photos to return (max 100)
+    - **cursor**: `next_cursor` from the previous response (omit for the first page)
+    
+    `skip` 방식과 달리 (created_at, id) 인덱스에서 바로 이어 읽으므로 몇 번째 페이지든 비용이 같습니다.
+    `next_cursor`가 null이면 마지막 페이지입니다.
+    """
+    limit = max(1, min(limit, 100))
+    
+    photo_service = PhotoService(db)
+    try:
+        photos, next_cursor = await photo_service.get_user_photos_page(current_user.id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return PhotoPage(
+        items=await photo_service.get_photos_with_urls(photos),
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/timeline",
+    response_model=PhotoTimeline,
+    summary="Photo counts per day or month",
+)
+async def get_photo_timeline(
+    granularity: Literal["day", "month"] = Query("month", description="Bucket size"),
+    start: Optional[date] = Query(None, description="First day to include (UTC, inclusive)"),
+    end: Optional[date] = Query(None, description="Last day to include (UTC, inclusive)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> PhotoTimeline:
+    """
+    Get the number of photos per day or month, newest first (스크러버/연·월 점프용).
+    
+    버킷은 사진 목록(`GET /photos/page`) 정렬 기준과 같은 업로드 시각(`created_at`, UTC)의 날짜입니다.
+    업로드/삭제 시 증분 갱신되는 롤업 테이블에서 읽으므로 사진 수와 무관하게 빠릅니다.
+    """
+    timeline = await TimelineService(db).get_timeline(current_user.id, granularity, start, end)
+    return PhotoTimeline(
+        granularity=granularity,
+        total=sum(count for _, count in timeline),
+        buckets=[TimelineBucket(bucket=bucket, count=count) for bucket, count in timeline],
+    )
+
+
 @router.get(
     "/{photo_id}/image",
     summary="Image access (JWT required); redirects to CDN when configured",
@@ -552,6 +928,42 @@ async def get_photo(
     return await photo_service.get_photo_with_url(photo)
 
 
+@router.get(
+    "/{photo_id}/similar",
+    response_model=List[SimilarPhoto],
+    summary="Find near-duplicate photos",
+)
+async def get_similar_photos(
+    photo_id: int,
+    max_distance: int = Query(10, ge=0, le=32, description="Maximum perceptual hash Hamming distance"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of results"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> List[SimilarPhoto]:
+    """
+    Find the current user's photos that look like this one (연사·재저장·리사이즈 사진 등).
+    
+    - **max_distance**: 64비트 dHash의 해밍 거리 상한 (0~5 거의 동일, ~10 근접 중복)
+    - **limit**: 최대 결과 수
+    
+    거리 오름차순으로 반환하며 기준 사진은 제외됩니다. 해시가 없는 사진(디코딩 불가 포맷 등)은 빈 목록을 반환합니다.
+    """
+    photo_service = PhotoService(db)
+    photo = await photo_service.get_photo_by_id(photo_id, current_user.id)
+    
+    if not photo:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Photo not found",
+        )
+    
+    similar = await photo_service.find_similar_photos(photo, max_distance=max_distance, limit=limit)
+    return [
+        SimilarPhoto(**(await photo_service.get_photo_with_url(match)).model_dump(), distance=distance)
+        for match, distance in similar
+    ]
+
+
 @router.patch(
     "/{photo_id}",
     response_model=PhotoResponse,
@@ -649,6 +1061,7 @@ async def download_photo(
 )
 async def delete_photo(
     photo_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> None:
@@ -668,4 +1081,9 @@ async def delete_photo(
             detail="Photo not found",
         )
     
-    await photo_service.delete_photo(photo)
+    path_to_delete = await photo_service.delete_photo(photo)
+    await db.commit()
+    
+    # DB 커밋 후 스토리지 정리 (실패해도 고아 파일만 남음)
+    if path_to_delete:
+        background_tasks.add_task(photo_service.storage.delete_files, [path_to_delete])
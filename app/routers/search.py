@@ -0,0 +1,66 @@
+"""
+Search router for full-text search over the user's photos and albums.
+"""
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.dependencies.auth import get_current_active_user
+from app.models.search_document import DOC_TYPE_PHOTO
+from app.models.user import User
+from app.schemas.search import SearchPage, SearchResult
+from app.services.search import SearchService
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get(
+    "",
+    response_model=SearchPage,
+    summary="Search photos and albums",
+)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    type: Optional[Literal["photo", "album"]] = Query(None, description="Restrict to photos or albums"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> SearchPage:
+    """
+    Search the current user's photos (제목, 설명, 원본 파일명) and albums (이름, 설명).
+    
+    - **q**: 검색어. 모든 단어가 포함된 항목만 반환되며 각 단어는 접두어로 일치합니다 (`bea` → beach).
+      한글은 2글자 단위(bigram)로 색인되어 띄어쓰기·조사와 무관하게 부분 일치합니다 (`제주` → 제주도에서).
+    - **type**: `photo` 또는 `album`으로 제한
+    - **cursor**: 이전 응답의 `next_cursor`
+    
+    결과는 관련도 순입니다.
+    """
+    search_service = SearchService(db)
+    try:
+        rows, next_cursor = await search_service.search(
+            current_user.id, q, doc_type=type, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    
+    return SearchPage(
+        items=[
+            SearchResult(
+                type=row["doc_type"],
+                id=row["doc_id"],
+                title=row["title"],
+                description=row["body"],
+                url=f"/photos/{row['doc_id']}/image" if row["doc_type"] == DOC_TYPE_PHOTO else None,
+                score=row["score"],
+            )
+            for row in rows
+        ],
+        next_cursor=next_cursor,
+    )
@@ -2,17 +2,26 @@
 Share router for public album access.
 """
 import logging
+import mimetypes
 import time
+from datetime import timezone
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import RedirectResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.database import get_db
+from app.routers.albums import album_zip_response
+from app.schemas.photo import PhotoPage
 from app.schemas.share import SharedAlbumResponse
 from app.services.album import AlbumService
+from app.services.nhn_cdn import get_cdn_service
+from app.services.nhn_object_storage import get_storage_service
 from app.services.photo import PhotoService
+from app.services.share_cache import CachedShareLink, get_share_cache
+from app.utils.security import verify_share_image_signature
 from app.middlewares.rate_limit_middleware import get_rate_limit_decorator, get_client_identifier
 from app.utils.prometheus_metrics import (
     share_link_access_total,
@@ -40,16 +49,20 @@ async def get_shared_album(
     token: str,
     request: Request,
     db: AsyncSession = Depends(get_db),
-) -> SharedAlbumResponse:
+) -> Response:
     """
     Access a shared album using a share link token.
     
     - **token**: The share link token (from the share URL)
     
     This endpoint does not require authentication.
-    Returns the album with all photos including secure CDN URLs.
+    Returns the album with the first page of photos including secure CDN URLs.
+    `next_cursor`가 있으면 `GET /share/{token}/photos?cursor=`로 이어서 조회합니다.
     
     The CDN URLs include auth tokens that expire after a configured time.
+    응답 본문은 앨범 version별로 직렬화된 바이트를 캐시해 그대로 반환합니다.
+    `ETag`(album version 기반)와 `Cache-Control: public, max-age, stale-while-revalidate`를 포함해
+    CDN·프록시가 캐시할 수 있고, `If-None-Match`가 일치하면 304를 반환합니다.
     """
     start_time = time.perf_counter()
     client_id = get_client_identifier(request)
@@ -61,7 +74,7 @@ async def get_shared_album(
     ).inc()
     
     album_service = AlbumService(db)
-    share_link = await album_service.get_share_link_by_token(token)
+    share_link = await get_share_cache().get_link(db, token)
     
     # 메트릭 수집: 토큰 상태 확인
     if not share_link:
@@ -86,7 +99,9 @@ async def get_shared_album(
         )
     
     # 유효한 토큰
-    shared_album = await album_service.get_shared_album(share_link)
+    shared_album = await album_service.get_shared_album(
+        token, share_link, request.headers.get("if-none-match")
+    )
     
     if not shared_album:
         share_link_access_total.labels(token_status="valid", result="denied").inc()
@@ -102,7 +117,78 @@ async def get_shared_album(
     duration = time.perf_counter() - start_time
     share_link_access_duration_seconds.labels(token_status="valid", result="success").observe(duration)
     
-    return shared_album
+    etag, url_expiry, body = shared_album
+    headers = {"ETag": etag, "Cache-Control": _shared_album_cache_control(share_link, url_expiry)}
+    if body is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _shared_album_cache_control(share_link: CachedShareLink, url_expiry: int) -> str:
+    """
+    공개 캐시 정책: CDN·프록시가 max-age 동안 캐시하고 stale-while-revalidate 동안 오래된 응답을 주며 재검증.
+    
+    - 캐시 기간은 공유 링크 만료 시각을 넘지 않습니다.
+    - stale 응답의 서명 이미지 URL이 로드 전에 만료되지 않도록 URL 만료 60초 전까지로 제한합니다.
+    """
+    settings = get_settings()
+    now = int(time.time())
+    max_age = settings.share_album_max_age_seconds
+    stale = settings.share_album_stale_while_revalidate_seconds
+    if share_link.expires_at:
+        remaining = int(share_link.expires_at.replace(tzinfo=timezone.utc).timestamp()) - now
+        max_age = min(max_age, remaining)
+        stale = min(stale, remaining - max_age)
+    max_age = max(0, min(max_age, url_expiry - now - 60))
+    stale = max(0, min(stale, url_expiry - now - 60 - max_age))
+    return f"public, max-age={max_age}, stale-while-revalidate={stale}"
+
+
+@router.get(
+    "/{token}/photos",
+    response_model=PhotoPage,
+    summary="Shared album photos (cursor pagination, no auth)",
+)
+@share_rate_limit
+async def get_shared_album_photos(
+    token: str,
+    request: Request,
+    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_db),
+) -> PhotoPage:
+    """
+    공유 앨범 사진을 앨범 순서로 페이지 단위 조회. **인증 불필요**. 조회수는 `GET /share/{token}`에서만 증가.
+    
+    - **limit**: Maximum number of photos to return (max 500)
+    - **cursor**: `next_cursor` from the previous response
+    """
+    rate_limit_requests_total.labels(
+        endpoint=request.url.path,
+        status="allowed",
+    ).inc()
+    limit = max(1, min(limit, 500))
+    
+    album_service = AlbumService(db)
+    share_link = await get_share_cache().get_link(db, token)
+    if not share_link:
+        share_link_access_total.labels(token_status="invalid", result="denied").inc()
+        share_link_brute_force_attempts.labels(client_id=get_client_identifier(request)[:16]).inc()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Share link not found")
+    if not share_link.is_valid:
+        share_link_access_total.labels(token_status="expired", result="denied").inc()
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Share link expired or inactive")
+    
+    try:
+        photos, next_cursor = await album_service.get_album_photos_page(share_link.album_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    share_link_access_total.labels(token_status="valid", result="success").inc()
+    return PhotoPage(
+        items=album_service.photos_to_share_urls(photos, token, share_link),
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
@@ -114,11 +200,18 @@ async def get_shared_album_image(
     token: str,
     photo_id: int,
     request: Request,
+    sid: Optional[int] = Query(None, description="Share link ID (signed URL)"),
+    key: Optional[str] = Query(None, description="Storage path (signed URL)"),
+    exp: Optional[int] = Query(None, description="Expiry, unix seconds (signed URL)"),
+    sig: Optional[str] = Query(None, description="HMAC signature (signed URL)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     공유 앨범 이미지 접근. **인증 불필요**. 공유 링크 유효 시 해당 앨범에 포함된 사진만 접근 가능.
     CDN 설정 시 짧은 유효기간 URL로 302 리다이렉트하여 트래픽이 LB를 거치지 않도록 함.
+    
+    공유 앨범 응답의 URL은 서명(`sid`, `key`, `exp`, `sig`)을 포함하며, 서명 URL은 HMAC 검증과
+    메모리 폐기 목록 확인만으로 DB 조회 없이 처리됩니다. 서명이 없는 URL은 토큰·앨범 구성을 확인합니다.
     """
     # 메트릭 수집: Rate limit 체크 요청 (허용됨)
     rate_limit_requests_total.labels(
@@ -126,27 +219,41 @@ async def get_shared_album_image(
         status="allowed",
     ).inc()
     
-    settings = get_settings()
-    album_service = AlbumService(db)
-    share_link = await album_service.get_share_link_by_token(token)
+    if sig is not None:
+        if sid is None or key is None or exp is None or not verify_share_image_signature(
+            token, sid, photo_id, key, exp, sig
+        ):
+            share_link_image_access_total.labels(token_status="invalid", photo_in_album="no").inc()
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid image signature")
+        if exp <= time.time() or get_share_cache().is_revoked(sid, photo_id):
+            share_link_image_access_total.labels(token_status="expired", photo_in_album="no").inc()
+            raise HTTPException(status_code=status.HTTP_410_GONE, detail="Image URL expired or revoked")
+        share_link_image_access_total.labels(token_status="signed", photo_in_album="yes").inc()
+        return await _shared_image_response(key, photo_id)
+
+    # 토큰·앨범 구성은 메모리 캐시에서 확인 (적중 시 권한 확인에 DB 왕복 없음)
+    share_cache = get_share_cache()
+    share_link = await share_cache.get_link(db, token)
     
     # 메트릭 수집: 토큰 상태
     token_status = "valid"
     if not share_link:
         token_status = "invalid"
         share_link_image_access_total.labels(token_status="invalid", photo_in_album="no").inc()
+        share_link_brute_force_attempts.labels(client_id=get_client_identifier(request)[:16]).inc()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Share link not found")
     if not share_link.is_valid:
         token_status = "expired"
         share_link_image_access_total.labels(token_status="expired", photo_in_album="no").inc()
         raise HTTPException(status_code=status.HTTP_410_GONE, detail="Share link expired or inactive")
-    
-    album = share_link.album
-    if not album:
-        share_link_image_access_total.labels(token_status=token_status, photo_in_album="no").inc()
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Album not found")
 
-    photo = await album_service.get_photo_in_album(album.id, photo_id)
+    if not await share_cache.album_contains(db, share_link.album_id, photo_id):
+        share_link_image_access_total.labels(token_status=token_status, photo_in_album="no").inc()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo not in this album")
+    
+    # 스토리지 경로는 기본 키 조회 1회 (캐시 이후 삭제된 사진은 여기서 걸러짐)
+    photo_service = PhotoService(db)
+    photo = await photo_service.get_photo_by_id(photo_id, share_link.owner_id)
     if not photo:
         share_link_image_access_total.labels(token_status=token_status, photo_in_album="no").inc()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo not in this album")
@@ -154,21 +261,71 @@ async def get_shared_album_image(
     # 성공: 해당 앨범에 포함된 사진
     share_link_image_access_total.labels(token_status=token_status, photo_in_album="yes").inc()
 
-    photo_service = PhotoService(db)
+    return await _shared_image_response(photo.storage_path, photo_id, photo.content_type)
+
+
+async def _shared_image_response(
+    storage_path: str,
+    photo_id: int,
+    content_type: Optional[str] = None,
+):
+    """CDN 리다이렉트 또는 스토리지에서 읽어 응답 (서명 URL 경로는 content type을 확장자로 추정)."""
+    settings = get_settings()
     if settings.nhn_cdn_domain and settings.nhn_cdn_app_key:
-        cdn_url = await photo_service.cdn.generate_auth_token_url(
-            photo.storage_path,
+        cdn_url = await get_cdn_service().generate_auth_token_url(
+            storage_path,
             expires_in=settings.image_token_expire_seconds,
         )
         if cdn_url:
             return RedirectResponse(url=cdn_url, status_code=status.HTTP_302_FOUND)
     try:
-        file_content = await photo_service.download_photo(photo)
+        file_content = await get_storage_service().download_file(storage_path)
     except Exception as e:
         logger.error("Shared photo stream failed", exc_info=e, extra={"event": "share_stream", "photo_id": photo_id})
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load photo")
+    if content_type is None:
+        content_type = mimetypes.guess_type(storage_path)[0]
     return Response(
         content=file_content,
-        media_type=photo.content_type or "application/octet-stream",
+        media_type=content_type or "application/octet-stream",
         headers={"Cache-Control": "private, max-age=60"},
     )
+
+
+@router.get(
+    "/{token}/download.zip",
+    summary="Download a shared album as a ZIP (no auth)",
+)
+@share_rate_limit
+async def download_shared_album_zip(
+    token: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    공유 앨범 전체를 ZIP으로 다운로드. **인증 불필요**. 공유 링크가 유효할 때만 허용.
+    무압축(STORED) 아카이브를 즉석에서 스트리밍하며 Content-Length를 미리 제공합니다.
+    """
+    rate_limit_requests_total.labels(
+        endpoint=request.url.path,
+        status="allowed",
+    ).inc()
+    
+    album_service = AlbumService(db)
+    share_link = await get_share_cache().get_link(db, token)
+    if not share_link:
+        share_link_access_total.labels(token_status="invalid", result="denied").inc()
+        share_link_brute_force_attempts.labels(client_id=get_client_identifier(request)[:16]).inc()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Share link not found")
+    if not share_link.is_valid:
+        share_link_access_total.labels(token_status="expired", result="denied").inc()
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Share link expired or inactive")
+    
+    album = await album_service.get_album_by_id(share_link.album_id)
+    if not album:
+        share_link_access_total.labels(token_status="valid", result="denied").inc()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Album not found")
+    
+    share_link_access_total.labels(token_status="valid", result="success").inc()
+    archive = await album_service.get_album_archive(album.id)
+    return album_zip_response(album.name, archive)
@@ -0,0 +1,314 @@
+"""
+Resumable uploads router (tus 방식 청크 업로드).
+"""
+import logging
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request, status
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import get_db
+from app.dependencies.auth import get_current_active_user
+from app.models.upload_session import UploadSession
+from app.models.user import User
+from app.routers.photos import ALLOWED_CONTENT_TYPES, MAX_FILE_SIZE, ensure_upload_quota, guess_content_type
+from app.schemas.photo import PhotoUploadResponse, UploadSessionCreate, UploadSessionResponse
+from app.services.photo import PhotoService
+from app.services.upload import UploadOffsetConflict, UploadService
+from app.utils.prometheus_metrics import (
+    photo_upload_total,
+    photo_upload_file_size_bytes,
+    object_storage_usage_bytes,
+    object_storage_usage_by_user_bytes,
+    photo_upload_size_total,
+    photos_total,
+)
+
+logger = logging.getLogger("app.uploads")
+
+router = APIRouter(prefix="/uploads", tags=["Uploads"])
+
+
+def _offset_headers(upload: UploadSession) -> dict:
+    return {
+        "Upload-Offset": str(upload.offset),
+        "Upload-Length": str(upload.total_size),
+        "Cache-Control": "no-store",
+    }
+
+
+def _to_response(upload: UploadSession) -> UploadSessionResponse:
+    return UploadSessionResponse(
+        upload_id=upload.id,
+        offset=upload.offset,
+        total_size=upload.total_size,
+        chunk_max_size=get_settings().upload_chunk_max_bytes,
+        expires_at=upload.expires_at,
+    )
+
+
+async def _get_upload_or_404(upload_service: UploadService, upload_id: str, user_id: int) -> UploadSession:
+    upload = await upload_service.get_session(upload_id, user_id)
+    if not upload:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload session not found or expired",
+        )
+    return upload
+
+
+@router.post(
+    "/",
+    response_model=UploadSessionResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Start a resumable upload",
+)
+async def create_upload(
+    request: UploadSessionCreate,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> UploadSessionResponse:
+    """
+    Start a resumable (chunked) upload.
+
+    **사용 방법:**
+    1. 이 엔드포인트로 세션을 만들고 `upload_id`를 받습니다.
+    2. `PATCH /uploads/{upload_id}`에 `Upload-Offset` 헤더와 함께 청크(최대 `chunk_max_size` 바이트)를 순서대로 보냅니다.
+    3. 연결이 끊기면 `HEAD /uploads/{upload_id}`로 `Upload-Offset`을 확인하고 그 위치부터 이어서 보냅니다.
+    4. 모든 바이트를 보낸 뒤 `POST /uploads/{upload_id}/complete`로 사진을 생성합니다.
+    """
+    if request.total_size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size: {MAX_FILE_SIZE // (1024*1024)}MB",
+        )
+    content_type = guess_content_type(request.filename, request.content_type)
+    if not content_type or content_type not in ALLOWED_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_CONTENT_TYPES)}",
+        )
+
+    from app.services.album import AlbumService
+    album = await AlbumService(db).get_album_by_id(request.album_id, current_user.id)
+    if not album:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Album with ID {request.album_id} not found or you don't have access to it.",
+        )
+    await ensure_upload_quota(db, current_user, "resumable", photos=1, bytes_used=request.total_size)
+
+    upload_service = UploadService(db)
+    upload = await upload_service.create_session(
+        user=current_user,
+        album_id=request.album_id,
+        filename=request.filename,
+        content_type=content_type,
+        total_size=request.total_size,
+    )
+    # 만료된 세션 정리는 세션 생성 시 함께 처리 (별도 스케줄러 없음)
+    expired_segments = await upload_service.purge_expired()
+    await db.commit()
+    if expired_segments:
+        background_tasks.add_task(upload_service.storage.delete_files, expired_segments)
+
+    response.headers["Location"] = f"/uploads/{upload.id}"
+    return _to_response(upload)
+
+
+@router.head(
+    "/{upload_id}",
+    summary="Get the current offset of a resumable upload",
+)
+async def head_upload(
+    upload_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Response:
+    """`Upload-Offset` 헤더로 서버가 받은 바이트 수를 반환합니다. 클라이언트는 이 위치부터 이어서 보냅니다."""
+    upload = await _get_upload_or_404(UploadService(db), upload_id, current_user.id)
+    return Response(status_code=status.HTTP_200_OK, headers=_offset_headers(upload))
+
+
+@router.get(
+    "/{upload_id}",
+    response_model=UploadSessionResponse,
+    summary="Get resumable upload state",
+)
+async def get_upload(
+    upload_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> UploadSessionResponse:
+    """HEAD와 같은 정보를 JSON으로 반환합니다."""
+    upload = await _get_upload_or_404(UploadService(db), upload_id, current_user.id)
+    return _to_response(upload)
+
+
+@router.patch(
+    "/{upload_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Append a chunk to a resumable upload",
+)
+async def patch_upload(
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(..., alias="Upload-Offset", ge=0),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Response:
+    """
+    Append the request body at `Upload-Offset`.
+
+    - 요청 본문: 원본 바이트 (`Content-Type: application/offset+octet-stream`)
+    - **204**: 저장 완료. 응답 `Upload-Offset`이 다음 청크의 시작 위치입니다.
+    - **409**: 오프셋 불일치. 응답 `Upload-Offset`부터 다시 보내세요.
+    """
+    upload_service = UploadService(db)
+    upload = await _get_upload_or_404(upload_service, upload_id, current_user.id)
+
+    # 오프셋이 어긋난 요청은 본문을 읽기 전에 거절 (이미 받은 바이트를 다시 받지 않음)
+    if upload_offset != upload.offset:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Upload offset mismatch. Current offset: {upload.offset}",
+            headers=_offset_headers(upload),
+        )
+
+    chunk_max = get_settings().upload_chunk_max_bytes
+    chunks = []
+    received = 0
+    async for part in request.stream():
+        received += len(part)
+        if received > chunk_max:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Chunk too large. Maximum size: {chunk_max} bytes",
+            )
+        chunks.append(part)
+
+    try:
+        await upload_service.append_chunk(upload, upload_offset, b"".join(chunks))
+        await db.commit()
+    except UploadOffsetConflict as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+            headers=_offset_headers(upload),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(
+            "Upload chunk failed",
+            exc_info=e,
+            extra={"event": "photo_upload_resumable", "upload_id": upload_id, "user_id": current_user.id},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="청크 저장에 실패했습니다. 같은 오프셋으로 다시 시도해주세요.",
+        )
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT, headers=_offset_headers(upload))
+
+
+@router.post(
+    "/{upload_id}/complete",
+    response_model=PhotoUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Finish a resumable upload and create the photo",
+)
+async def complete_upload(
+    upload_id: str,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> PhotoUploadResponse:
+    """
+    모든 바이트를 받은 세션을 사진으로 확정합니다.
+
+    세그먼트를 이어 붙여 일반 업로드와 같은 경로(콘텐츠 주소 저장, 중복 제거, 이미지 분석)로 Photo를 만들고
+    세션의 앨범에 추가합니다. 세그먼트 오브젝트는 응답 후 백그라운드에서 삭제됩니다.
+    """
+    upload_service = UploadService(db)
+    upload = await _get_upload_or_404(upload_service, upload_id, current_user.id)
+    if not upload.is_complete:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Upload incomplete: {upload.offset}/{upload.total_size} bytes received",
+            headers=_offset_headers(upload),
+        )
+
+    from app.services.album import AlbumService
+    album_service = AlbumService(db)
+    album = await album_service.get_album_by_id(upload.album_id, current_user.id)
+    if not album:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Album with ID {upload.album_id} not found or you don't have access to it.",
+        )
+    # 세션 생성 이후 다른 업로드로 한도에 도달했을 수 있음
+    await ensure_upload_quota(db, current_user, "resumable", photos=1, bytes_used=upload.total_size)
+
+    try:
+        photo, segments = await upload_service.complete(upload, current_user)
+        await album_service.add_photos_to_album(album, [photo.id], current_user.id)
+        await db.commit()
+    except ValueError as e:
+        photo_upload_total.labels(upload_method="resumable", result="failure").inc()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        photo_upload_total.labels(upload_method="resumable", result="failure").inc()
+        logger.error(
+            "Resumable upload completion failed",
+            exc_info=e,
+            extra={"event": "photo_upload_resumable", "upload_id": upload_id, "user_id": current_user.id},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="사진 업로드에 실패했습니다. 잠시 후 다시 시도해주세요.",
+        )
+
+    background_tasks.add_task(upload_service.storage.delete_files, segments)
+
+    # 메트릭 수집 및 비즈니스 메트릭 실시간 업데이트
+    photo_upload_total.labels(upload_method="resumable", result="success").inc()
+    photo_upload_file_size_bytes.labels(upload_method="resumable").observe(photo.file_size)
+    object_storage_usage_bytes.inc(photo.file_size)
+    object_storage_usage_by_user_bytes.labels(user_id=str(current_user.id)).inc(photo.file_size)
+    photo_upload_size_total.labels(user_id=str(current_user.id)).inc(photo.file_size)
+    photos_total.inc()
+
+    photo_with_url = await PhotoService(db).get_photo_with_url(photo)
+    return PhotoUploadResponse(
+        id=photo.id,
+        filename=photo.filename,
+        original_filename=photo.original_filename,
+        content_type=photo.content_type,
+        file_size=photo.file_size,
+        url=photo_with_url.url,
+    )
+
+
+@router.delete(
+    "/{upload_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Abort a resumable upload",
+)
+async def delete_upload(
+    upload_id: str,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Response:
+    """세션을 취소하고 저장된 세그먼트를 백그라운드에서 삭제합니다."""
+    upload_service = UploadService(db)
+    upload = await _get_upload_or_404(upload_service, upload_id, current_user.id)
+    segments = await upload_service.cancel(upload)
+    await db.commit()
+    if segments:
+        background_tasks.add_task(upload_service.storage.delete_files, segments)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -14,19 +14,27 @@ from app.schemas.photo import (
     PhotoResponse,
     PhotoUpdate,
     PhotoWithUrl,
+    PhotoPage,
 )
 from app.schemas.album import (
     AlbumCreate,
     AlbumResponse,
     AlbumUpdate,
     AlbumWithPhotos,
+    AlbumPage,
     AlbumPhotoAdd,
     AlbumPhotoRemove,
+    AlbumPhotoMove,
+)
+from app.schemas.search import (
+    SearchResult,
+    SearchPage,
 )
 from app.schemas.share import (
     ShareLinkCreate,
     ShareLinkResponse,
     SharedAlbumResponse,
+    ShareManifest,
 )
 
 __all__ = [
@@ -41,15 +49,22 @@ __all__ = [
     "PhotoResponse",
     "PhotoUpdate",
     "PhotoWithUrl",
+    "PhotoPage",
     # Album schemas
     "AlbumCreate",
     "AlbumResponse",
     "AlbumUpdate",
     "AlbumWithPhotos",
+    "AlbumPage",
     "AlbumPhotoAdd",
     "AlbumPhotoRemove",
+    "AlbumPhotoMove",
+    # Search schemas
+    "SearchResult",
+    "SearchPage",
     # Share schemas
     "ShareLinkCreate",
     "ShareLinkResponse",
     "SharedAlbumResponse",
+    "ShareManifest",
 ]
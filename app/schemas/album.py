@@ -36,17 +36,27 @@ class AlbumResponse(AlbumBase):
     id: int
     owner_id: int
     cover_photo_id: Optional[int] = None
+    cover_photo_url: Optional[str] = None  # 커버 미지정 시 앨범 첫 사진
     photo_count: int = 0
+    last_photo_added_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
     
     model_config = ConfigDict(from_attributes=True)
 
 
+class AlbumPage(BaseModel):
+    """Cursor-paginated album listing. Pass next_cursor back as `cursor` for the next page."""
+    
+    items: List[AlbumResponse]
+    next_cursor: Optional[str] = None  # None이면 마지막 페이지
+
+
 class AlbumWithPhotos(AlbumResponse):
-    """Schema for album response with photos included."""
+    """Schema for album response with the first page of photos included."""
     
     photos: List[PhotoWithUrl] = []
+    next_cursor: Optional[str] = None  # 이후 사진은 GET /albums/{id}/photos?cursor= (None이면 전부 포함)
 
 
 class AlbumPhotoAdd(BaseModel):
@@ -61,6 +71,15 @@ class AlbumPhotoRemove(BaseModel):
     photo_ids: List[int] = Field(..., min_length=1)
 
 
+class AlbumPhotoMove(BaseModel):
+    """Schema for moving one photo within an album."""
+    
+    after_photo_id: Optional[int] = Field(
+        default=None,
+        description="Place the photo right after this photo (null이면 맨 앞)",
+    )
+
+
 class AlbumPhotoReorder(BaseModel):
     """Schema for reordering photos in an album."""
     
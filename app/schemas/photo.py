@@ -1,8 +1,8 @@
 """
 Photo-related Pydantic schemas for request/response validation.
 """
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import List, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -35,6 +35,12 @@ class PhotoResponse(PhotoBase):
     original_filename: str
     content_type: str
     file_size: int
+    content_hash: Optional[str] = None  # SHA-256 (hex)
+    width: Optional[int] = None
+    height: Optional[int] = None
+    orientation: Optional[int] = None  # EXIF Orientation (1-8)
+    taken_at: Optional[datetime] = None  # EXIF DateTimeOriginal
+    camera: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     
@@ -48,6 +54,36 @@ class PhotoWithUrl(PhotoResponse):
     """
     
     url: str  # CDN URL with auth token
+    blurhash: Optional[str] = None  # 원본 로드 전 즉시 렌더링용 placeholder
+    dominant_color: Optional[str] = None  # 대표 색상 (#rrggbb)
+
+
+class SimilarPhoto(PhotoWithUrl):
+    """Photo that looks like the reference photo."""
+    
+    distance: int = Field(..., description="Perceptual hash 해밍 거리 (0 = 거의 동일)")
+
+
+class PhotoPage(BaseModel):
+    """Cursor-paginated photo listing. Pass next_cursor back as `cursor` for the next page."""
+    
+    items: List[PhotoWithUrl]
+    next_cursor: Optional[str] = None  # None이면 마지막 페이지
+
+
+class TimelineBucket(BaseModel):
+    """Photo count for one day or month."""
+    
+    bucket: date = Field(..., description="버킷 시작일 (월 단위는 해당 월 1일, UTC)")
+    count: int
+
+
+class PhotoTimeline(BaseModel):
+    """Photo counts per bucket, newest first."""
+    
+    granularity: str
+    total: int
+    buckets: List[TimelineBucket]
 
 
 class PhotoUploadResponse(BaseModel):
@@ -64,6 +100,24 @@ class PhotoUploadResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PhotoBatchUploadItem(BaseModel):
+    """Per-file result of a multi-file upload."""
+    
+    filename: str
+    success: bool
+    photo: Optional[PhotoUploadResponse] = None
+    error: Optional[str] = None
+
+
+class PhotoBatchUploadResponse(BaseModel):
+    """Schema for multi-file upload response (results are in request order)."""
+    
+    album_id: int
+    uploaded: int
+    failed: int
+    results: List[PhotoBatchUploadItem]
+
+
 class PresignedUrlRequest(BaseModel):
     """Schema for requesting a presigned URL."""
     
@@ -89,6 +143,25 @@ class PresignedUrlResponse(BaseModel):
     )
 
 
+class UploadSessionCreate(BaseModel):
+    """Schema for starting a resumable upload."""
+    
+    album_id: int = Field(..., description="Album ID to upload photo to")
+    filename: str = Field(..., description="Original filename", max_length=255)
+    content_type: str = Field(..., description="MIME type of the file")
+    total_size: int = Field(..., description="Total file size in bytes", gt=0)
+
+
+class UploadSessionResponse(BaseModel):
+    """Schema for resumable upload session state."""
+    
+    upload_id: str
+    offset: int = Field(..., description="Bytes received so far (다음 PATCH의 Upload-Offset)")
+    total_size: int
+    chunk_max_size: int = Field(..., description="PATCH 요청 1회당 최대 바이트 수")
+    expires_at: datetime
+
+
 class PhotoUploadConfirmRequest(BaseModel):
     """Schema for confirming photo upload completion."""
     
@@ -102,3 +175,16 @@ class PhotoUploadConfirmResponse(BaseModel):
     filename: str
     url: Optional[str] = None  # CDN URL with auth token
     message: str = "Photo upload confirmed successfully"
+
+
+class PhotoBatchDeleteRequest(BaseModel):
+    """Schema for deleting many photos in one request."""
+    
+    photo_ids: List[int] = Field(..., min_length=1, description="Photo IDs to delete (최대 photo_batch_max_ids개)")
+
+
+class PhotoBatchDeleteResponse(BaseModel):
+    """Schema for batch delete result."""
+    
+    deleted_ids: List[int]
+    not_found_ids: List[int] = []  # 존재하지 않거나 소유하지 않은 사진
@@ -0,0 +1,24 @@
+"""
+Search-related Pydantic schemas.
+"""
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel
+
+
+class SearchResult(BaseModel):
+    """One matching photo or album."""
+    
+    type: Literal["photo", "album"]
+    id: int
+    title: str
+    description: Optional[str] = None
+    url: Optional[str] = None  # 사진: /photos/{id}/image
+    score: float  # 관련도 (클수록 관련 높음, DB별 척도 다름)
+
+
+class SearchPage(BaseModel):
+    """Ranked, cursor-paginated search results. Pass next_cursor back as `cursor` for the next page."""
+    
+    items: List[SearchResult]
+    next_cursor: Optional[str] = None  # None이면 마지막 페이지
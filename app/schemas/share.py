@@ -19,6 +19,10 @@ class ShareLinkCreate(BaseModel):
         le=365,
         description="Number of days until the link expires (optional)"
     )
+    publish_manifest: bool = Field(
+        False,
+        description="앨범 매니페스트 JSON을 Object Storage에 게시해 CDN이 직접 제공 (SHARE_MANIFEST_ENABLED 필요)",
+    )
 
 
 class ShareLinkResponse(BaseModel):
@@ -32,6 +36,7 @@ class ShareLinkResponse(BaseModel):
     view_count: int
     created_at: datetime
     share_url: str  # Full URL for sharing
+    manifest_url: Optional[str] = None  # publish_manifest 링크의 CDN 매니페스트 URL
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -39,16 +44,29 @@ class ShareLinkResponse(BaseModel):
 class SharedAlbumResponse(BaseModel):
     """
     Schema for shared album response (public access).
-    Contains album info and photos with CDN URLs.
+    Contains album info and the first page of photos (나머지는 next_cursor로 조회).
     """
     
     album_name: str
     album_description: Optional[str] = None
     photo_count: int
     photos: List[PhotoWithUrl] = []
+    next_cursor: Optional[str] = None  # 이후 사진은 GET /share/{token}/photos?cursor= (None이면 전부 포함)
     created_at: datetime
 
 
+class ShareManifest(SharedAlbumResponse):
+    """
+    Static shared album manifest (Object Storage에 게시, CDN이 직접 제공).
+    사진 전체를 담고(next_cursor 없음) 사진 URL은 urls_expire_at까지 유효한 CDN 토큰 URL입니다.
+    비활성화·만료·삭제된 링크는 {"status": "gone"} tombstone으로 바뀝니다.
+    """
+    
+    status: str = "active"
+    urls_expire_at: datetime
+    generated_at: datetime
+
+
 class ShareLinkUpdate(BaseModel):
     """Schema for updating a share link."""
     
@@ -43,6 +43,16 @@ class UserUpdate(BaseModel):
     username: Optional[str] = Field(None, min_length=3, max_length=100)
 
 
+class UserUsageResponse(BaseModel):
+    """Schema for the current user's usage and quota."""
+    
+    photo_count: int
+    album_count: int
+    bytes_used: int
+    quota_bytes: Optional[int] = None  # None이면 무제한
+    quota_photos: Optional[int] = None  # None이면 무제한
+
+
 class Token(BaseModel):
     """Schema for JWT token response."""
     
@@ -2,27 +2,84 @@
 Album service for managing albums and shared links.
 """
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from urllib.parse import urlencode
 
-from sqlalchemy import select, func
+from sqlalchemy import and_, bindparam, delete, or_, select, func, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.album import Album, AlbumPhoto
+from app.models.deletion_job import JOB_KIND_ALBUM, DeletionJob
 from app.models.photo import Photo
+from app.models.search_document import DOC_TYPE_ALBUM
 from app.models.share import ShareLink
+from app.models.share_view import ShareLinkDailyView
 from app.models.user import User
-from app.schemas.album import AlbumCreate, AlbumUpdate, AlbumWithPhotos
+from app.schemas.album import AlbumCreate, AlbumResponse, AlbumUpdate, AlbumWithPhotos
 from app.schemas.photo import PhotoWithUrl
 from app.schemas.share import ShareLinkCreate, ShareLinkResponse, SharedAlbumResponse
+from app.services.deletion import DeletionService
 from app.services.photo import PhotoService
-from app.utils.security import generate_share_token
+from app.services.search import SearchService
+from app.services.share_cache import CachedShareLink, get_share_cache
+from app.services.shared_album_cache import bump_album_versions, etag_matches, get_shared_album_cache
+from app.services.usage import UsageService
+from app.services.view_counter import get_view_counter
+from app.utils.pagination import created_before, encode_cursor, encode_order_cursor, ordered_after
+from app.utils.security import generate_share_token, share_image_url_expiry, sign_share_image
+from app.utils.sql import insert_ignore
+from app.utils.zip_stream import StoredZipStream, ZipEntry, unique_entry_names
 from app.config import get_settings
 
 logger = logging.getLogger("app.album")
 settings = get_settings()
 
+# AlbumPhoto.order 간격: 이동 시 앞뒤 사진 사이 값을 골라 행 1개만 수정 (간격이 소진되면 재정렬)
+ORDER_GAP = 1024
+# 이동 후 남은 간격이 이보다 작으면 백그라운드 재정렬 예약
+ORDER_MIN_GAP = 8
+# Integer 컬럼 범위
+ORDER_MAX = 2**31 - 1
+ORDER_MIN = -(2**31)
+
+
+def _album_summary_columns() -> tuple:
+    """
+    Per-album correlated subqueries: photo_count, last_photo_added_at, cover_id.
+
+    목록 쿼리의 SELECT 절에 붙여 앨범 수와 무관하게 쿼리 1회로 처리합니다 (앨범별 COUNT 쿼리 없음).
+    각 서브쿼리는 ix_album_photos_album_order (album_id, order) 인덱스로 해당 앨범 행만 읽습니다.
+    cover_id는 지정된 커버가 없으면 앨범 순서상 첫 사진입니다.
+    """
+    photo_count = (
+        select(func.count(AlbumPhoto.id))
+        .where(AlbumPhoto.album_id == Album.id)
+        .correlate(Album)
+        .scalar_subquery()
+    )
+    last_photo_added_at = (
+        select(func.max(AlbumPhoto.added_at))
+        .where(AlbumPhoto.album_id == Album.id)
+        .correlate(Album)
+        .scalar_subquery()
+    )
+    first_photo_id = (
+        select(AlbumPhoto.photo_id)
+        .where(AlbumPhoto.album_id == Album.id)
+        .order_by(AlbumPhoto.order, AlbumPhoto.id)
+        .limit(1)
+        .correlate(Album)
+        .scalar_subquery()
+    )
+    return (
+        photo_count.label("photo_count"),
+        last_photo_added_at.label("last_photo_added_at"),
+        func.coalesce(Album.cover_photo_id, first_photo_id).label("cover_id"),
+    )
+
 
 class AlbumService:
     """
@@ -33,6 +90,8 @@ class AlbumService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.photo_service = PhotoService(db)
+        self.search = SearchService(db)
+        self.usage = UsageService(db)
     
     # ============== Album CRUD ==============
     
@@ -60,6 +119,8 @@ class AlbumService:
         self.db.add(album)
         await self.db.flush()
         await self.db.refresh(album)
+        await self.search.index_album(album)
+        await self.usage.apply(user.id, albums=1)
         return album
     
     async def get_album_by_id(
@@ -75,9 +136,9 @@ class AlbumService:
             user_id: If provided, only return if user owns the album
             
         Returns:
-            Album if found, None otherwise
+            Album if found, None otherwise (삭제 요청된 앨범 제외)
         """
-        query = select(Album).where(Album.id == album_id)
+        query = select(Album).where(Album.id == album_id, Album.deleted_at.is_(None))
         
         if user_id is not None:
             query = query.where(Album.owner_id == user_id)
@@ -85,12 +146,36 @@ class AlbumService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
+    @staticmethod
+    def build_album_response(row: Row) -> AlbumResponse:
+        """Build an AlbumResponse from a (Album, photo_count, last_photo_added_at, cover_id) row."""
+        album = row.Album
+        return AlbumResponse(
+            id=album.id,
+            owner_id=album.owner_id,
+            name=album.name,
+            description=album.description,
+            cover_photo_id=album.cover_photo_id,
+            cover_photo_url=f"/photos/{row.cover_id}/image" if row.cover_id else None,
+            photo_count=row.photo_count,
+            last_photo_added_at=row.last_photo_added_at,
+            created_at=album.created_at,
+            updated_at=album.updated_at,
+        )
+    
+    async def get_album_response(self, album: Album) -> AlbumResponse:
+        """Album response with photo count and cover (쿼리 1회)."""
+        result = await self.db.execute(
+            select(Album, *_album_summary_columns()).where(Album.id == album.id)
+        )
+        return self.build_album_response(result.one())
+    
     async def get_user_albums(
         self,
         user_id: int,
         skip: int = 0,
         limit: int = 50,
-    ) -> List[Album]:
+    ) -> List[AlbumResponse]:
         """
         Get all albums for a user.
         
@@ -100,16 +185,51 @@ class AlbumService:
             limit: Maximum number of records to return
             
         Returns:
-            List of Album models
+            List of AlbumResponse schemas (photo_count, 커버 포함, 쿼리 1회)
         """
         result = await self.db.execute(
-            select(Album)
-            .where(Album.owner_id == user_id)
+            select(Album, *_album_summary_columns())
+            .where(Album.owner_id == user_id, Album.deleted_at.is_(None))
             .order_by(Album.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return [self.build_album_response(row) for row in result.all()]
+    
+    async def get_user_albums_page(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AlbumResponse], Optional[str]]:
+        """
+        Get a page of a user's albums using keyset pagination on (created_at, id).
+        
+        Args:
+            user_id: User ID
+            limit: Maximum number of records to return
+            cursor: next_cursor from the previous page (None for the first page)
+            
+        Returns:
+            (albums, next_cursor) — next_cursor is None on the last page
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = select(Album, *_album_summary_columns()).where(
+            Album.owner_id == user_id, Album.deleted_at.is_(None)
+        )
+        if cursor:
+            query = query.where(created_before(Album.created_at, Album.id, cursor))
+        result = await self.db.execute(
+            query.order_by(Album.created_at.desc(), Album.id.desc()).limit(limit + 1)
+        )
+        rows = result.all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].Album.created_at, rows[-1].Album.id)
+        return [self.build_album_response(row) for row in rows], next_cursor
     
     async def get_album_photo_count(self, album_id: int) -> int:
         """Get the number of photos in an album."""
@@ -147,22 +267,31 @@ class AlbumService:
             album.cover_photo_id = update_data.cover_photo_id
         
         await self.db.flush()
+        await bump_album_versions(self.db, [album.id])
         await self.db.refresh(album)
+        await self.search.index_album(album)
         return album
     
-    async def delete_album(self, album: Album) -> bool:
+    async def delete_album(self, album: Album) -> DeletionJob:
         """
-        Delete an album.
+        Delete an album (soft delete + background job).
+        
+        앨범에 deleted_at만 표시해 조회·공유에서 즉시 제외하고, album_photos·share_links·앨범 행은
+        deletion_jobs 워커가 청크 단위로 지웁니다 (앨범 크기와 무관하게 요청 내 작업은 행 몇 개).
         
         Args:
             album: Album to delete
             
         Returns:
-            True if deletion was successful
+            Scheduled DeletionJob
         """
-        await self.db.delete(album)
-        await self.db.flush()
-        return True
+        album.deleted_at = datetime.utcnow()
+        await self.search.remove(DOC_TYPE_ALBUM, [album.id])
+        await self.usage.apply(album.owner_id, albums=-1)
+        get_share_cache().invalidate_album(album.id)
+        result = await self.db.execute(select(ShareLink.id).where(ShareLink.album_id == album.id))
+        get_share_cache().revoke_shares(result.scalars().all())
+        return await DeletionService(self.db).schedule(JOB_KIND_ALBUM, album.id)
     
     # ============== Album Photos ==============
     
@@ -175,6 +304,10 @@ class AlbumService:
         """
         Add photos to an album.
         
+        소유권 확인 SELECT 1회 + INSERT ... ON CONFLICT DO NOTHING 1회로 처리합니다.
+        이미 앨범에 있는 사진은 (album_id, photo_id) unique 제약으로 건너뛰므로 앨범의 기존 행을 읽지 않고,
+        동시 요청이 같은 사진을 추가해도 중복 행이 생기지 않습니다.
+        
         Args:
             album: Album to add photos to
             photo_ids: List of photo IDs to add
@@ -183,39 +316,29 @@ class AlbumService:
         Returns:
             Number of photos added
         """
-        # Get photos owned by user
+        requested_ids = list(dict.fromkeys(photo_ids))
         result = await self.db.execute(
-            select(Photo)
-            .where(Photo.id.in_(photo_ids))
+            select(Photo.id)
+            .where(Photo.id.in_(requested_ids))
             .where(Photo.owner_id == user_id)
         )
-        photos = list(result.scalars().all())
-        
-        if not photos:
+        owned = set(result.scalars().all())
+        if not owned:
             return 0
         
-        # Get existing album photos
-        existing = await self.db.execute(
-            select(AlbumPhoto.photo_id)
-            .where(AlbumPhoto.album_id == album.id)
-        )
-        existing_ids = set(row[0] for row in existing.all())
-        
-        # Add new photos
-        added = 0
+        # 요청 순서대로 앨범 끝에 ORDER_GAP 간격으로 배치 (건너뛴 사진 몫의 값은 비어 있어도 정렬에 영향 없음)
+        new_ids = [photo_id for photo_id in requested_ids if photo_id in owned]
         max_order = await self._get_max_order(album.id)
-        
-        for photo in photos:
-            if photo.id not in existing_ids:
-                album_photo = AlbumPhoto(
-                    album_id=album.id,
-                    photo_id=photo.id,
-                    order=max_order + added + 1,
-                )
-                self.db.add(album_photo)
-                added += 1
-        
-        await self.db.flush()
+        if max_order + ORDER_GAP * len(new_ids) > ORDER_MAX:
+            max_order = await self.compact_photo_order(album.id)
+        rows = [
+            {"album_id": album.id, "photo_id": photo_id, "order": max_order + ORDER_GAP * (index + 1), "added_at": datetime.utcnow()}
+            for index, photo_id in enumerate(new_ids)
+        ]
+        added = await insert_ignore(self.db, AlbumPhoto.__table__, ("album_id", "photo_id"), rows)
+        if added:
+            get_share_cache().invalidate_album(album.id)
+            await bump_album_versions(self.db, [album.id])
         return added
     
     async def remove_photos_from_album(
@@ -224,7 +347,7 @@ class AlbumService:
         photo_ids: List[int],
     ) -> int:
         """
-        Remove photos from an album.
+        Remove photos from an album with a single DELETE ... WHERE photo_id IN (...).
         
         Args:
             album: Album to remove photos from
@@ -234,17 +357,15 @@ class AlbumService:
             Number of photos removed
         """
         result = await self.db.execute(
-            select(AlbumPhoto)
+            delete(AlbumPhoto)
             .where(AlbumPhoto.album_id == album.id)
-            .where(AlbumPhoto.photo_id.in_(photo_ids))
+            .where(AlbumPhoto.photo_id.in_(list(set(photo_ids))))
+            .execution_options(synchronize_session=False)
         )
-        album_photos = list(result.scalars().all())
-        
-        for ap in album_photos:
-            await self.db.delete(ap)
-        
-        await self.db.flush()
-        return len(album_photos)
+        get_share_cache().invalidate_album(album.id)
+        if result.rowcount:
+            await bump_album_versions(self.db, [album.id])
+        return result.rowcount
     
     async def get_album_photos(self, album_id: int) -> List[Photo]:
         """
@@ -260,10 +381,69 @@ class AlbumService:
             select(Photo)
             .join(AlbumPhoto, AlbumPhoto.photo_id == Photo.id)
             .where(AlbumPhoto.album_id == album_id)
-            .order_by(AlbumPhoto.order)
+            .order_by(AlbumPhoto.order, AlbumPhoto.id)
         )
         return list(result.scalars().all())
 
+    async def get_album_photos_page(
+        self,
+        album_id: int,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Photo], Optional[str]]:
+        """
+        Get a page of an album's photos using keyset pagination on (order, id).
+        
+        앨범 크기와 무관하게 한 페이지만 읽으므로 응답 크기·메모리가 페이지 크기로 제한됩니다.
+        
+        Args:
+            album_id: Album ID
+            limit: Maximum number of photos to return
+            cursor: next_cursor from the previous page (None for the first page)
+            
+        Returns:
+            (photos, next_cursor) — next_cursor is None on the last page
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = (
+            select(Photo, AlbumPhoto.order, AlbumPhoto.id.label("album_photo_id"))
+            .join(AlbumPhoto, AlbumPhoto.photo_id == Photo.id)
+            .where(AlbumPhoto.album_id == album_id)
+        )
+        if cursor:
+            query = query.where(ordered_after(AlbumPhoto.order, AlbumPhoto.id, cursor))
+        result = await self.db.execute(
+            query.order_by(AlbumPhoto.order, AlbumPhoto.id).limit(limit + 1)
+        )
+        rows = result.all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_order_cursor(rows[-1].order, rows[-1].album_photo_id)
+        return [row.Photo for row in rows], next_cursor
+
+    async def get_album_archive(self, album_id: int) -> StoredZipStream:
+        """
+        Build a streaming stored-ZIP of all photos in an album (앨범 순서).
+        
+        필요한 컬럼만 조회하며, Content-Length는 Photo.file_size로 미리 계산됩니다.
+        바이트는 응답 시 Object Storage에서 스트리밍하므로 DB 세션이 필요 없습니다.
+        """
+        result = await self.db.execute(
+            select(Photo.original_filename, Photo.file_size, Photo.created_at, Photo.storage_path)
+            .join(AlbumPhoto, AlbumPhoto.photo_id == Photo.id)
+            .where(AlbumPhoto.album_id == album_id)
+            .order_by(AlbumPhoto.order, AlbumPhoto.id)
+        )
+        rows = result.all()
+        names = unique_entry_names([row.original_filename for row in rows])
+        return StoredZipStream([
+            ZipEntry(name=name, size=row.file_size, modified=row.created_at, source=row.storage_path)
+            for name, row in zip(names, rows)
+        ])
+
     async def get_photo_in_album(self, album_id: int, photo_id: int) -> Optional[Photo]:
         """앨범에 포함된 사진만 반환. 공유 링크로 이미지 접근 시 검증용."""
         result = await self.db.execute(
@@ -273,6 +453,124 @@ class AlbumService:
         )
         return result.scalar_one_or_none()
     
+    async def move_photo(
+        self,
+        album: Album,
+        photo_id: int,
+        after_photo_id: Optional[int],
+    ) -> Tuple[int, bool]:
+        """
+        Move a photo right after `after_photo_id` (None이면 맨 앞).
+        
+        앞뒤 사진의 order 사이 값(중간값)을 골라 이동하는 행 1개만 UPDATE합니다.
+        정렬은 (order, id) 기준이므로 이웃은 (album_id, order) 인덱스에서 바로 찾습니다 (앨범 크기와 무관).
+        사이에 빈 값이 없으면 앨범 전체를 ORDER_GAP 간격으로 다시 매긴 뒤 이동합니다 (드묾).
+        
+        Returns:
+            (new order, needs_compaction) — needs_compaction이면 남은 간격이 작아 재정렬 예약 권장
+        
+        Raises:
+            ValueError: If either photo is not in the album
+        """
+        moving = await self._get_album_photo(album.id, photo_id)
+        if moving is None:
+            raise ValueError("Photo is not in this album")
+        if after_photo_id == photo_id:
+            return moving.order, False
+        
+        # 이웃을 읽기 전에 앨범 행을 먼저 갱신(version 증가)해 잠금: 같은 앨범의 이동·재정렬과 직렬화
+        await bump_album_versions(self.db, [album.id])
+        for attempt in range(2):
+            if after_photo_id is None:
+                prev_order = None
+                next_row = await self._next_album_photo(album.id, None, exclude_id=moving.id)
+            else:
+                after = await self._get_album_photo(album.id, after_photo_id)
+                if after is None:
+                    raise ValueError("Target photo is not in this album")
+                prev_order = after.order
+                next_row = await self._next_album_photo(album.id, after, exclude_id=moving.id)
+            
+            if prev_order is None and next_row is None:
+                return moving.order, False  # 앨범에 사진이 하나뿐
+            if prev_order is None:
+                new_order = next_row.order - ORDER_GAP
+                gap = ORDER_GAP
+            elif next_row is None:
+                new_order = prev_order + ORDER_GAP
+                gap = ORDER_GAP
+            else:
+                new_order = (prev_order + next_row.order) // 2
+                gap = min(new_order - prev_order, next_row.order - new_order)
+            
+            if gap >= 1 and ORDER_MIN <= new_order <= ORDER_MAX:
+                moving.order = new_order
+                await self.db.flush()
+                return new_order, gap < ORDER_MIN_GAP
+            if attempt == 0:
+                # 간격 소진: 재정렬 후 다시 계산
+                await self.compact_photo_order(album.id)
+                await self.db.refresh(moving)
+        raise ValueError("Could not reorder photo")
+    
+    async def compact_photo_order(self, album_id: int) -> int:
+        """
+        Renumber an album's photos as ORDER_GAP, 2*ORDER_GAP, ... in current (order, id) order.
+        
+        앨범 크기에 비례하는 유일한 작업으로, 간격이 소진됐을 때만 실행됩니다.
+        
+        order를 읽기 전에 앨범 version을 올립니다. 앨범 행 잠금으로 move_photo와 직렬화되어
+        읽은 뒤 커밋된 이동을 덮어쓰지 않고, 이전 번호로 만든 공유 응답 캐시·next_cursor가 무효화됩니다.
+        
+        Returns:
+            New maximum order
+        """
+        await bump_album_versions(self.db, [album_id])
+        result = await self.db.execute(
+            select(AlbumPhoto.id)
+            .where(AlbumPhoto.album_id == album_id)
+            .order_by(AlbumPhoto.order, AlbumPhoto.id)
+        )
+        row_ids = list(result.scalars().all())
+        if not row_ids:
+            return 0
+        table = AlbumPhoto.__table__
+        await self.db.execute(
+            update(table)
+            .where(table.c.id == bindparam("row_id"))
+            .values(order=bindparam("new_order")),
+            [{"row_id": row_id, "new_order": ORDER_GAP * (index + 1)} for index, row_id in enumerate(row_ids)],
+        )
+        logger.info(
+            "Album photo order compacted",
+            extra={"event": "album_reorder", "album_id": album_id, "photos": len(row_ids)},
+        )
+        return ORDER_GAP * len(row_ids)
+    
+    async def _get_album_photo(self, album_id: int, photo_id: int) -> Optional[AlbumPhoto]:
+        result = await self.db.execute(
+            select(AlbumPhoto).where(AlbumPhoto.album_id == album_id, AlbumPhoto.photo_id == photo_id)
+        )
+        return result.scalar_one_or_none()
+    
+    async def _next_album_photo(
+        self,
+        album_id: int,
+        after: Optional[AlbumPhoto],
+        exclude_id: int,
+    ) -> Optional[AlbumPhoto]:
+        """First album photo after `after` in (order, id) order (after가 None이면 첫 사진)."""
+        query = select(AlbumPhoto).where(AlbumPhoto.album_id == album_id, AlbumPhoto.id != exclude_id)
+        if after is not None:
+            query = query.where(
+                or_(
+                    AlbumPhoto.order > after.order,
+                    and_(AlbumPhoto.order == after.order, AlbumPhoto.id > after.id),
+                )
+            )
+        result = await self.db.execute(query.order_by(AlbumPhoto.order, AlbumPhoto.id).limit(1))
+        return result.scalar_one_or_none()
+    
     async def _get_max_order(self, album_id: int) -> int:
         """Get the maximum order value in an album."""
         result = await self.db.execute(
@@ -283,28 +581,22 @@ class AlbumService:
     
     async def get_album_with_photos(self, album: Album) -> AlbumWithPhotos:
         """
-        Get album with photos including CDN URLs.
+        Get album with the first page of photos including CDN URLs.
         
         Args:
             album: Album model
             
         Returns:
-            AlbumWithPhotos schema
+            AlbumWithPhotos schema (photo_count는 전체 수, 나머지 사진은 next_cursor로 조회)
         """
-        photos = await self.get_album_photos(album.id)
+        summary = await self.get_album_response(album)
+        photos, next_cursor = await self.get_album_photos_page(album.id, settings.album_photos_page_size)
         photos_with_urls = await self.photo_service.get_photos_with_urls(photos)
-        photo_count = len(photos)
         
         return AlbumWithPhotos(
-            id=album.id,
-            owner_id=album.owner_id,
-            name=album.name,
-            description=album.description,
-            cover_photo_id=album.cover_photo_id,
-            photo_count=photo_count,
-            created_at=album.created_at,
-            updated_at=album.updated_at,
+            **summary.model_dump(),
             photos=photos_with_urls,
+            next_cursor=next_cursor,
         )
     
     # ============== Share Links ==============
@@ -325,7 +617,13 @@ class AlbumService:
             
         Returns:
             Created ShareLink model
+            
+        Raises:
+            ValueError: If publish_manifest is requested while manifests are disabled
         """
+        if share_data.publish_manifest and not settings.share_manifest_enabled:
+            raise ValueError("Static share manifests are disabled")
+        
         # Generate unique token
         token = generate_share_token()
         
@@ -338,11 +636,13 @@ class AlbumService:
             album_id=album.id,
             token=token,
             expires_at=expires_at,
+            publish_manifest=share_data.publish_manifest,
         )
         
         self.db.add(share_link)
         await self.db.flush()
         await self.db.refresh(share_link)
+        get_share_cache().add_token(token)
         # 공유링크 생성은 INFO (중요 비즈니스 이벤트)
         logger.info("Share link created", extra={"event": "share_link_create", "share_id": share_link.id, "album_id": album.id})
         return share_link
@@ -358,11 +658,13 @@ class AlbumService:
             token: Share link token
             
         Returns:
-            ShareLink if found, None otherwise
+            ShareLink if found, None otherwise (삭제 요청된 앨범·계정의 링크 제외)
         """
         result = await self.db.execute(
             select(ShareLink)
-            .where(ShareLink.token == token)
+            .join(Album, Album.id == ShareLink.album_id)
+            .join(User, User.id == Album.owner_id)
+            .where(ShareLink.token == token, Album.deleted_at.is_(None), User.deleted_at.is_(None))
             .options(selectinload(ShareLink.album))
         )
         return result.scalar_one_or_none()
@@ -402,6 +704,8 @@ class AlbumService:
         """
         share_link.is_active = False
         await self.db.flush()
+        get_share_cache().invalidate_link(share_link.token)
+        get_share_cache().revoke_shares([share_link.id])
         await self.db.refresh(share_link)
         return share_link
     
@@ -418,73 +722,111 @@ class AlbumService:
         Returns:
             True if deletion was successful
         """
+        await self.db.execute(
+            delete(ShareLinkDailyView)
+            .where(ShareLinkDailyView.share_link_id == share_link.id)
+            .execution_options(synchronize_session=False)
+        )
         await self.db.delete(share_link)
         await self.db.flush()
+        get_share_cache().remove_token(share_link.token)
+        get_share_cache().revoke_shares([share_link.id])
         return True
     
-    async def increment_view_count(
-        self,
-        share_link: ShareLink,
-    ) -> None:
-        """Increment the view count of a share link."""
-        share_link.view_count += 1
-        await self.db.flush()
-    
-    def _photos_to_share_urls(
+    def photos_to_share_urls(
         self,
         photos: List[Photo],
         share_token: str,
+        share_link: CachedShareLink,
+        expires: Optional[int] = None,
     ) -> List[PhotoWithUrl]:
-        """공유 앨범용: 인증 없이 접근 가능한 이미지 URL 목록 생성."""
+        """
+        공유 앨범용: 인증 없이 접근 가능한 서명된 이미지 URL 목록 생성.
+        
+        URL에 (share id, storage path, 만료 시각, 토큰까지 묶은 HMAC 서명)을 담아 이미지 요청은 DB 조회 없이 검증됩니다.
+        만료 시각은 공유 링크 만료 시각을 넘지 않습니다.
+        """
+        if expires is None:
+            expires = share_image_url_expiry()
+        if share_link.expires_at:
+            expires = min(expires, int(share_link.expires_at.replace(tzinfo=timezone.utc).timestamp()))
         return [
-            PhotoWithUrl(
-                id=p.id,
-                owner_id=p.owner_id,
-                filename=p.filename,
-                original_filename=p.original_filename,
-                content_type=p.content_type,
-                file_size=p.file_size,
-                title=p.title,
-                description=p.description,
-                created_at=p.created_at,
-                updated_at=p.updated_at,
-                url=f"/share/{share_token}/photos/{p.id}/image",
+            PhotoService.build_photo_with_url(
+                p,
+                f"/share/{share_token}/photos/{p.id}/image?" + urlencode({
+                    "sid": share_link.share_id,
+                    "key": p.storage_path,
+                    "exp": expires,
+                    "sig": sign_share_image(share_token, share_link.share_id, p.id, p.storage_path, expires),
+                }),
             )
             for p in photos
         ]
 
     async def get_shared_album(
         self,
-        share_link: ShareLink,
-    ) -> Optional[SharedAlbumResponse]:
+        token: str,
+        share_link: CachedShareLink,
+        if_none_match: Optional[str] = None,
+    ) -> Optional[Tuple[str, int, Optional[bytes]]]:
         """
-        Get shared album data for public access.
+        Get the serialized shared album response for public access.
+        
+        응답은 (token, album version) 키로 직렬화된 JSON 바이트를 캐시하므로, 앨범이 바뀌지 않았다면
+        사진 조회·PhotoWithUrl 생성·직렬화 없이 캐시된 바이트를 그대로 돌려줍니다.
+        ETag는 (album version, 서명 URL 만료 시각)에서 만들므로 `If-None-Match`가 일치하면 본문 없이 끝납니다.
         
         Args:
-            share_link: ShareLink model
+            token: Share link token (사진 URL에 포함)
+            share_link: Resolved share link (유효성은 호출자가 확인)
+            if_none_match: If-None-Match header (일치하면 본문 None)
             
         Returns:
-            SharedAlbumResponse if valid, None otherwise
+            (ETag, 서명 URL 만료 시각, JSON bytes 또는 None) if the album exists, None otherwise
         """
-        if not share_link.is_valid:
-            # 만료/비활성 링크 접근 시도 → WARNING
-            logger.warning("Share access denied", extra={"event": "share_access", "share_id": share_link.id})
-            return None
-        
-        # Get album
-        album = share_link.album
-        if not album:
+        cache = get_shared_album_cache()
+        version = await cache.get_album_version(self.db, share_link.album_id)
+        if version is None:
             return None
         
-        # Get photos with share image URLs (인증 없이 접근 가능한 /share/{token}/photos/{id}/image)
-        photos = await self.get_album_photos(album.id)
-        photos_with_urls = self._photos_to_share_urls(photos, share_link.token)
-        
-        await self.increment_view_count(share_link)
-        return SharedAlbumResponse(
-            album_name=album.name,
-            album_description=album.description,
-            photo_count=len(photos),
-            photos=photos_with_urls,
-            created_at=album.created_at,
-        )
+        # 서명 URL 만료 구간이 바뀌면 응답도 다시 생성 (응답 속 URL이 최소 TTL/2 유효)
+        url_expiry = share_image_url_expiry()
+        etag = f'"v{version}-{url_expiry}"'
+        # 조회수는 메모리에 누적 후 주기적으로 일괄 반영 (공유 조회 요청은 DB에 쓰지 않음)
+        get_view_counter().record(share_link.share_id)
+        if etag_matches(if_none_match, etag):
+            return etag, url_expiry, None
+        
+        body = cache.get(token, version, url_expiry)
+        if body is None:
+            album = await self.db.get(Album, share_link.album_id)
+            if album is None:
+                return None
+            # 첫 페이지 사진만 공유 이미지 URL로 (인증 없이 접근 가능한 /share/{token}/photos/{id}/image)
+            photo_count = await self.get_album_photo_count(album.id)
+            photos, next_cursor = await self.get_album_photos_page(album.id, settings.album_photos_page_size)
+            response = SharedAlbumResponse(
+                album_name=album.name,
+                album_description=album.description,
+                photo_count=photo_count,
+                photos=self.photos_to_share_urls(photos, token, share_link, url_expiry),
+                next_cursor=next_cursor,
+                created_at=album.created_at,
+            )
+            body = response.model_dump_json().encode()
+            cache.put(token, album.id, version, url_expiry, body)
+        return etag, url_expiry, body
+
+
+async def compact_album_order(album_id: int) -> None:
+    """
+    Background task: 응답 후 별도 세션에서 앨범 사진 order 간격을 다시 벌립니다.
+    """
+    from app.database import async_session_maker
+
+    try:
+        async with async_session_maker() as session:
+            await AlbumService(session).compact_photo_order(album_id)
+            await session.commit()
+    except Exception as e:
+        logger.warning("Album order compaction failed: %s", e, exc_info=False)
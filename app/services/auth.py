@@ -2,13 +2,19 @@
 Authentication service for user management.
 """
 import logging
+from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.album import Album
+from app.models.deletion_job import JOB_KIND_USER, DeletionJob
+from app.models.share import ShareLink
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, Token
+from app.services.deletion import DeletionService
+from app.services.share_cache import get_share_cache
 from app.utils.security import hash_password, verify_password, create_access_token
 
 logger = logging.getLogger("app.auth")
@@ -104,6 +110,29 @@ class AuthService:
         access_token = create_access_token(user.id)
         return Token(access_token=access_token)
     
+    async def delete_user(self, user: User) -> DeletionJob:
+        """
+        Delete a user account (soft delete + background job).
+        
+        계정을 비활성화해 즉시 로그인·API 접근을 막고, 사진·앨범·스토리지 오브젝트는
+        deletion_jobs 워커가 청크 단위로 삭제한 뒤 마지막에 사용자 행을 지웁니다.
+        
+        Args:
+            user: User to delete
+            
+        Returns:
+            Scheduled DeletionJob
+        """
+        user.is_active = False
+        user.deleted_at = datetime.utcnow()
+        get_share_cache().invalidate_owner(user.id)
+        result = await self.db.execute(
+            select(ShareLink.id).join(Album, Album.id == ShareLink.album_id).where(Album.owner_id == user.id)
+        )
+        get_share_cache().revoke_shares(result.scalars().all())
+        logger.info("User deletion requested", extra={"event": "auth", "user_id": user.id})
+        return await DeletionService(self.db).schedule(JOB_KIND_USER, user.id)
+    
     async def get_user_by_id(self, user_id: int) -> Optional[User]:
         """
         Get user by ID.
@@ -0,0 +1,297 @@
+"""
+Background deletion of albums and user accounts.
+
+삭제 요청은 대상에 deleted_at을 표시하고 deletion_jobs 행을 넣은 뒤 바로 202로 응답합니다.
+워커(run_deletion_job)는 단계(stage)별로 연관 행을 deletion_chunk_size개씩 지우고, 청크마다
+삭제와 체크포인트(stage, processed)를 한 트랜잭션으로 커밋합니다.
+- 요청 트랜잭션은 대상 행 몇 개만 수정하므로 잠금·메모리가 앨범/계정 크기와 무관합니다.
+- 청크 삭제는 "남은 행 중 N개"를 지우는 멱등 작업이라 중단 후 재시도해도 안전합니다.
+- 스토리지 오브젝트는 청크 커밋 후 delete_files로 정리합니다 (실패 시 고아 파일만 남음).
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.album import Album, AlbumPhoto
+from app.models.deletion_job import (
+    JOB_KIND_ALBUM,
+    JOB_KIND_USER,
+    JOB_STATUS_DONE,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_PENDING,
+    JOB_STATUS_RUNNING,
+    DeletionJob,
+)
+from app.models.photo import Photo
+from app.models.photo_timeline import PhotoTimelineBucket
+from app.models.search_document import SearchDocument
+from app.models.share import ShareLink
+from app.models.share_view import ShareLinkDailyView
+from app.models.upload_session import UploadSession
+from app.models.user import User
+from app.models.user_usage import UserUsage
+from app.services.photo import PhotoService
+from app.services.share_manifest import manifest_path
+from app.utils.prometheus_metrics import deletion_jobs_total, deletion_rows_deleted_total
+
+logger = logging.getLogger("app.deletion")
+
+# 작업 종류별 단계 (마지막 단계는 대상 행 자체를 지우고 작업 완료)
+STAGES = {
+    JOB_KIND_ALBUM: ("album_photos", "share_links", "upload_sessions", "album"),
+    JOB_KIND_USER: ("photos", "album_photos", "share_links", "upload_sessions", "albums", "user"),
+}
+
+
+class DeletionService:
+    """
+    Service for scheduling and running deletion jobs.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def schedule(self, kind: str, target_id: int) -> DeletionJob:
+        """Insert a pending deletion job (호출자 트랜잭션과 함께 커밋)."""
+        job = DeletionJob(kind=kind, target_id=target_id, status=JOB_STATUS_PENDING, processed=0, attempts=0)
+        self.db.add(job)
+        await self.db.flush()
+        logger.info(
+            "Deletion scheduled",
+            extra={"event": "deletion_job", "job_id": job.id, "kind": kind, "target_id": target_id},
+        )
+        return job
+
+    async def claim(self, job_id: int) -> bool:
+        """
+        Take the job lease. 대기 중이거나 임대가 만료된 실행 중 작업만 가져올 수 있습니다
+        (여러 워커가 같은 작업을 동시에 실행하지 않도록 조건부 UPDATE 한 문장).
+        """
+        settings = get_settings()
+        now = datetime.utcnow()
+        result = await self.db.execute(
+            update(DeletionJob)
+            .where(
+                DeletionJob.id == job_id,
+                or_(
+                    DeletionJob.status == JOB_STATUS_PENDING,
+                    and_(DeletionJob.status == JOB_STATUS_RUNNING, DeletionJob.locked_until < now),
+                ),
+            )
+            .values(
+                status=JOB_STATUS_RUNNING,
+                locked_until=now + timedelta(seconds=settings.deletion_job_lease_seconds),
+                attempts=DeletionJob.attempts + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    async def run_chunk(self, job: DeletionJob, stage: str, limit: int) -> Tuple[int, List[str]]:
+        """
+        Delete up to `limit` rows for one stage.
+
+        Returns:
+            (deleted rows, storage paths to delete after commit). 0행이면 해당 단계 완료
+        """
+        target_id = job.target_id
+        if job.kind == JOB_KIND_ALBUM:
+            album_ids = [target_id]
+            if stage == "album":
+                return await self._delete_target(Album, target_id), []
+        else:
+            album_ids = select(Album.id).where(Album.owner_id == target_id).scalar_subquery()
+            if stage == "photos":
+                result = await self.db.execute(
+                    select(Photo.id).where(Photo.owner_id == target_id).order_by(Photo.id).limit(limit)
+                )
+                photo_ids = list(result.scalars().all())
+                if not photo_ids:
+                    return 0, []
+                deleted = await PhotoService(self.db).delete_photos(target_id, photo_ids)
+                return len(deleted["deleted_ids"]), deleted["storage_paths"]
+            if stage == "upload_sessions":
+                return await self._delete_chunk(UploadSession, UploadSession.owner_id == target_id, limit), []
+            if stage == "albums":
+                return await self._delete_chunk(Album, Album.owner_id == target_id, limit), []
+            if stage == "user":
+                for model, column in (
+                    (SearchDocument, SearchDocument.owner_id),
+                    (PhotoTimelineBucket, PhotoTimelineBucket.owner_id),
+                    (UserUsage, UserUsage.user_id),
+                ):
+                    await self.db.execute(
+                        delete(model).where(column == target_id).execution_options(synchronize_session=False)
+                    )
+                return await self._delete_target(User, target_id), []
+
+        if stage == "album_photos":
+            return await self._delete_chunk(AlbumPhoto, AlbumPhoto.album_id.in_(album_ids), limit), []
+        if stage == "share_links":
+            return await self._delete_share_links(ShareLink.album_id.in_(album_ids), limit)
+        if stage == "upload_sessions":
+            return await self._delete_chunk(UploadSession, UploadSession.album_id.in_(album_ids), limit), []
+        raise ValueError(f"Unknown deletion stage: {stage}")
+
+    async def _delete_share_links(self, condition, limit: int) -> Tuple[int, List[str]]:
+        """
+        Delete up to `limit` share links with their daily view rows (SQLite는 FK CASCADE 미적용).
+        게시된 매니페스트 오브젝트 경로를 함께 반환해 커밋 후 스토리지에서 지웁니다.
+        """
+        result = await self.db.execute(
+            select(ShareLink.id, ShareLink.token, ShareLink.manifest_version).where(condition).limit(limit)
+        )
+        rows = result.all()
+        if not rows:
+            return 0, []
+        ids = [row.id for row in rows]
+        await self.db.execute(
+            delete(ShareLinkDailyView)
+            .where(ShareLinkDailyView.share_link_id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(
+            delete(ShareLink).where(ShareLink.id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        return len(ids), [manifest_path(row.token) for row in rows if row.manifest_version is not None]
+
+    async def _delete_chunk(self, model, condition, limit: int) -> int:
+        """
+        Delete up to `limit` rows matching `condition`.
+        MySQL은 IN 서브쿼리에 LIMIT을 허용하지 않아 ID를 먼저 조회한 뒤 삭제합니다.
+        """
+        result = await self.db.execute(select(model.id).where(condition).limit(limit))
+        ids = list(result.scalars().all())
+        if not ids:
+            return 0
+        await self.db.execute(
+            delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        return len(ids)
+
+    async def _delete_target(self, model, target_id: int) -> int:
+        """Delete the soft-deleted target row itself (마지막 단계)."""
+        result = await self.db.execute(
+            delete(model)
+            .where(model.id == target_id, model.deleted_at.is_not(None))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+
+async def run_deletion_job(job_id: int) -> None:
+    """
+    Run a deletion job to completion, one committed chunk at a time.
+
+    임대를 얻지 못하면(다른 워커가 실행 중이거나 이미 완료) 아무것도 하지 않습니다.
+    실패하면 pending으로 되돌려 다음 폴링에서 마지막 체크포인트부터 재시도하고,
+    deletion_job_max_attempts를 넘으면 failed로 남깁니다.
+    """
+    from app.database import async_session_maker
+    from app.services.nhn_object_storage import get_storage_service
+
+    settings = get_settings()
+    async with async_session_maker() as session:
+        if not await DeletionService(session).claim(job_id):
+            return
+        await session.commit()
+
+    kind = None
+    processed = 0
+    try:
+        while True:
+            async with async_session_maker() as session:
+                job = await session.get(DeletionJob, job_id)
+                kind = job.kind
+                stages = STAGES[job.kind]
+                stage = job.stage or stages[0]
+                deleted, storage_paths = await DeletionService(session).run_chunk(
+                    job, stage, settings.deletion_chunk_size
+                )
+                finished = False
+                if stage == stages[-1]:
+                    job.status = JOB_STATUS_DONE
+                    job.finished_at = datetime.utcnow()
+                    job.locked_until = None
+                    finished = True
+                elif deleted == 0:
+                    job.stage = stages[stages.index(stage) + 1]
+                else:
+                    job.stage = stage
+                job.processed += deleted
+                processed = job.processed
+                if not finished:
+                    job.locked_until = datetime.utcnow() + timedelta(seconds=settings.deletion_job_lease_seconds)
+                await session.commit()
+
+            if deleted:
+                deletion_rows_deleted_total.labels(stage=stage).inc(deleted)
+            if storage_paths:
+                await get_storage_service().delete_files(storage_paths)
+            if finished:
+                break
+    except Exception as e:
+        async with async_session_maker() as session:
+            job = await session.get(DeletionJob, job_id)
+            attempts = job.attempts
+            failed = attempts >= settings.deletion_job_max_attempts
+            job.status = JOB_STATUS_FAILED if failed else JOB_STATUS_PENDING
+            job.locked_until = None
+            job.last_error = str(e)[:1000]
+            await session.commit()
+        deletion_jobs_total.labels(kind=kind or "unknown", result="failed" if failed else "retry").inc()
+        logger.warning(
+            "Deletion job failed: %s",
+            e,
+            exc_info=False,
+            extra={"event": "deletion_job", "job_id": job_id, "attempts": attempts, "final": failed},
+        )
+        return
+
+    deletion_jobs_total.labels(kind=kind, result="done").inc()
+    logger.info(
+        "Deletion job finished",
+        extra={"event": "deletion_job", "job_id": job_id, "kind": kind, "processed": processed},
+    )
+
+
+async def process_deletion_jobs(batch_size: int = 100) -> None:
+    """Run pending jobs and jobs whose lease expired (워커 중단 후 재개)."""
+    from app.database import async_session_maker
+
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(DeletionJob.id)
+            .where(
+                or_(
+                    DeletionJob.status == JOB_STATUS_PENDING,
+                    and_(DeletionJob.status == JOB_STATUS_RUNNING, DeletionJob.locked_until < datetime.utcnow()),
+                )
+            )
+            .order_by(DeletionJob.id)
+            .limit(batch_size)
+        )
+        job_ids = list(result.scalars().all())
+    for job_id in job_ids:
+        await run_deletion_job(job_id)
+
+
+async def deletion_worker_loop() -> None:
+    """
+    백그라운드 루프: deletion_job_poll_seconds마다 대기 중인 삭제 작업 실행.
+    삭제 요청 직후에는 BackgroundTasks로 바로 실행되므로, 이 루프는 재시도와 중단된 작업 재개용입니다.
+    """
+    interval = get_settings().deletion_job_poll_seconds
+    while True:
+        try:
+            await process_deletion_jobs()
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning("Deletion worker failed: %s", e, exc_info=False)
+        await asyncio.sleep(interval)
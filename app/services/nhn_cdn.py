@@ -149,11 +149,11 @@ class NHNCDNService:
         else:
             cdn_path = f"/{container}/{object_path}"
         
-        # 캐시 확인
+        # 캐시 확인: 요청한 유효 시간의 절반(최소 1분) 이상 남은 토큰만 재사용
         cache_key = cdn_path
         if cache_key in self._token_cache:
             cached_token, expire_time = self._token_cache[cache_key]
-            if time.time() < expire_time - 60:  # 1분 여유
+            if expire_time - time.time() >= max(60, expires_in // 2):
                 return f"https://{self.settings.nhn_cdn_domain}{cdn_path}?token={cached_token}"
         
         # Auth Token 생성 (CDN API 호출)
@@ -10,7 +10,7 @@ import hashlib
 import hmac
 import logging
 import time as _time
-from typing import Optional, Dict
+from typing import AsyncIterator, Optional, Dict, List
 from urllib.parse import urlparse
 from datetime import datetime, timedelta
 
@@ -426,6 +426,40 @@ class NHNObjectStorageService:
             logger.error("File download failed", exc_info=e, extra={"event": "storage_download", "object": object_name})
             raise
     
+    async def stream_file(self, object_name: str, chunk_size: int = 256 * 1024) -> AsyncIterator[bytes]:
+        """
+        Stream an object in chunks without buffering the whole file.
+        
+        download_file과 같은 경로 규칙을 사용합니다. 대용량 응답(ZIP 내보내기 등)에서 메모리를 일정하게 유지.
+        
+        Args:
+            object_name: The name/path of the object in storage
+            chunk_size: Bytes per yielded chunk
+            
+        Yields:
+            File content chunks
+        """
+        token = await self._get_auth_token()
+        storage_url = self._get_storage_url()
+        container = self.settings.nhn_storage_container
+        
+        if object_name.startswith(f"{container}/"):
+            url = f"{storage_url}/{object_name}"
+        else:
+            url = f"{storage_url}/{container}/{object_name}"
+        
+        async with record_external_request("obs_api_server"):
+            async with httpx.AsyncClient(timeout=self.settings.storage_download_timeout) as client:
+                async with client.stream("GET", url, headers={"X-Auth-Token": token}) as response:
+                    if response.status_code != 200:
+                        logger.error(
+                            "File stream failed",
+                            extra={"event": "storage_download", "status": response.status_code, "object": object_name},
+                        )
+                        raise Exception(f"File download failed: HTTP {response.status_code}")
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        yield chunk
+    
     async def delete_file(self, object_name: str) -> bool:
         """
         Delete a file from Object Storage.
@@ -476,6 +510,58 @@ class NHNObjectStorageService:
             logger.error("File deletion failed", exc_info=e, extra={"event": "storage_delete", "object": object_name})
             return False
     
+    async def delete_files(self, object_names: List[str], concurrency: Optional[int] = None) -> int:
+        """
+        Delete many objects with bounded concurrency over a single HTTP client.
+        
+        delete_file과 같은 경로 규칙을 사용하며, 실패한 오브젝트는 로깅만 하고 계속 진행합니다
+        (DB 행은 이미 삭제된 상태이므로 남은 오브젝트는 고아 파일로 허용).
+        
+        Args:
+            object_names: Object names (container/object 형식)
+            concurrency: 동시 DELETE 요청 수 (기본: storage_delete_concurrency)
+            
+        Returns:
+            Number of objects deleted (404 포함)
+        """
+        if not object_names:
+            return 0
+        token = await self._get_auth_token()
+        storage_url = self._get_storage_url()
+        container = self.settings.nhn_storage_container
+        semaphore = asyncio.Semaphore(concurrency or self.settings.storage_delete_concurrency)
+        
+        async def _delete(client: httpx.AsyncClient, object_name: str) -> bool:
+            if "/" in object_name:
+                url = f"{storage_url}/{object_name}"
+            else:
+                url = f"{storage_url}/{container}/{object_name}"
+            async with semaphore:
+                try:
+                    async with record_external_request("obs_api_server"):
+                        response = await client.delete(url, headers={"X-Auth-Token": token})
+                except Exception as e:
+                    logger.error("File deletion failed", exc_info=e, extra={"event": "storage_delete", "object": object_name})
+                    return False
+            if response.status_code not in (204, 404):
+                logger.error(
+                    "File deletion failed",
+                    extra={"event": "storage_delete", "status": response.status_code, "object": object_name},
+                )
+                return False
+            return True
+        
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            results = await asyncio.gather(*(_delete(client, name) for name in object_names))
+        
+        deleted = sum(results)
+        if deleted < len(object_names):
+            logger.warning(
+                "Batch file deletion incomplete",
+                extra={"event": "storage_delete", "requested": len(object_names), "deleted": deleted},
+            )
+        return deleted
+    
     async def file_exists(self, object_name: str) -> bool:
         """
         Check if a file exists in Object Storage.
@@ -515,6 +601,37 @@ class NHNObjectStorageService:
             logger.error("File exists check failed", exc_info=e, extra={"event": "storage_exists", "object": object_name})
             return False
     
+    async def get_container_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Get container usage reported by Swift.
+        
+        API 문서: 컨테이너 정보 조회 (HEAD 메서드)
+        https://docs.nhncloud.com/ko/Storage/Object%20Storage/ko/api-guide/#_11
+        
+        Returns:
+            {"bytes_used": X-Container-Bytes-Used, "object_count": X-Container-Object-Count}, 실패 시 None
+        """
+        token = await self._get_auth_token()
+        url = f"{self._get_storage_url()}/{self.settings.nhn_storage_container}"
+        
+        try:
+            async with record_external_request("obs_api_server"):
+                async with httpx.AsyncClient(timeout=10.0) as client:
+                    response = await client.head(url, headers={"X-Auth-Token": token})
+            if response.status_code not in (200, 204):
+                logger.warning(
+                    "Container stats unavailable",
+                    extra={"event": "storage_container_stats", "status": response.status_code},
+                )
+                return None
+            return {
+                "bytes_used": int(response.headers.get("X-Container-Bytes-Used", 0)),
+                "object_count": int(response.headers.get("X-Container-Object-Count", 0)),
+            }
+        except Exception as e:
+            logger.error("Container stats failed", exc_info=e, extra={"event": "storage_container_stats"})
+            return None
+    
     def _get_s3_client(self) -> boto3.client:
         """
         Get or create S3 client for presigned URL generation.
@@ -1,22 +1,83 @@
 """
 Photo service for managing photos.
 """
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict, Tuple
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
+from app.models.album import Album, AlbumPhoto
 from app.models.photo import Photo
+from app.models.search_document import DOC_TYPE_PHOTO
+from app.models.stored_object import StoredObject
 from app.models.user import User
 from app.schemas.photo import PhotoCreate, PhotoUpdate, PhotoWithUrl
 from app.services.nhn_object_storage import get_storage_service
 from app.services.nhn_cdn import get_cdn_service
+from app.services.search import SearchService
+from app.services.share_cache import get_share_cache
+from app.services.similarity_index import get_similarity_index
+from app.services.shared_album_cache import bump_photo_album_versions
+from app.services.timeline import TimelineService
+from app.services.usage import UsageService
+from app.utils.image_metadata import HEADER_BYTES, extract_image_metadata
+from app.utils.image_placeholder import PLACEHOLDER_DECODE_SIZE, compute_placeholder, decode_image
+from app.utils.perceptual_hash import DHASH_DECODE_SIZE, compute_dhash
+from app.utils.pagination import created_before, encode_cursor
+from app.utils.prometheus_metrics import photo_upload_dedup_total
 logger = logging.getLogger("app.photo")
 
 
+# 분석용 디코딩 크기: 플레이스홀더와 dHash 모두에 충분한 크기로 한 번만 축소 디코딩
+ANALYSIS_DECODE_SIZE = tuple(max(a, b) for a, b in zip(PLACEHOLDER_DECODE_SIZE, DHASH_DECODE_SIZE))
+
+
+def _analyze_image(content: bytes) -> Dict[str, Any]:
+    """
+    이미지 분석 (blocking, 스레드 풀에서 실행).
+    Photo 컬럼에 그대로 넣을 값을 반환: placeholder + 헤더 메타데이터 + perceptual hash.
+    픽셀은 한 번만 디코딩해 placeholder와 perceptual hash가 공유하고,
+    메타데이터는 앞부분 HEADER_BYTES만 읽으며 픽셀을 디코딩하지 않음.
+    """
+    image = decode_image(content, ANALYSIS_DECODE_SIZE)
+    placeholder = compute_placeholder(image)
+    metadata = extract_image_metadata(content[:HEADER_BYTES])
+    return {
+        "blurhash": placeholder.blurhash if placeholder else None,
+        "dominant_color": placeholder.dominant_color if placeholder else None,
+        "width": metadata.width,
+        "height": metadata.height,
+        "orientation": metadata.orientation,
+        "taken_at": metadata.taken_at,
+        "camera": metadata.camera,
+        "phash": compute_dhash(image),
+    }
+
+
+# 이미지 분석으로 채워지는 Photo 컬럼 (중복 업로드 시 기존 Photo에서 복사)
+ANALYSIS_FIELDS = ("blurhash", "dominant_color", "width", "height", "orientation", "taken_at", "camera", "phash")
+
+
+def content_addressed_path(content_hash: str, filename: str) -> str:
+    """
+    Content-addressed storage path: photo/photo/image/sha256/{hash[:2]}/{hash}-{uuid}.{ext}
+    같은 바이트는 stored_objects 행 하나(참조 카운트)로 공유하되, 경로에는 업로드마다 다른 접미사를 붙임.
+    마지막 참조 삭제 후 커밋 뒤에 실행되는 스토리지 삭제가, 그 사이 같은 바이트로 새로 등록된
+    오브젝트를 지우지 않도록 각 stored_objects 행이 자기 경로를 소유합니다.
+    """
+    file_ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    name = f"{content_hash}-{uuid.uuid4().hex[:12]}"
+    if file_ext:
+        name = f"{name}.{file_ext}"
+    return f"photo/photo/image/sha256/{content_hash[:2]}/{name}"
+
+
 class PhotoService:
     """
     Service for handling photo operations.
@@ -27,6 +88,9 @@ class PhotoService:
         self.db = db
         self.storage = get_storage_service()
         self.cdn = get_cdn_service()
+        self.search = SearchService(db)
+        self.timeline = TimelineService(db)
+        self.usage = UsageService(db)
     
     async def upload_photo(
         self,
@@ -36,10 +100,14 @@ class PhotoService:
         filename: str,
         content_type: str,
         metadata: Optional[PhotoCreate] = None,
+        content_hash: Optional[str] = None,
     ) -> Photo:
         """
         Upload a photo to Object Storage and save metadata to database.
         
+        Objects are content-addressed: identical bytes are stored once and
+        shared between photos via a reference count.
+        
         Args:
             user: Owner of the photo
             album_id: Album ID to upload photo to
@@ -47,48 +115,226 @@ class PhotoService:
             filename: Original filename
             content_type: MIME type of the file
             metadata: Optional photo metadata
+            content_hash: SHA-256 (hex) of file_content if already computed while reading
             
         Returns:
             Created Photo model
         """
-        # Generate unique filename for storage
-        file_ext = filename.rsplit(".", 1)[-1] if "." in filename else ""
-        unique_filename = f"{uuid.uuid4().hex}.{file_ext}" if file_ext else uuid.uuid4().hex
-        # Storage path: photo/photo/image/{album_id}/{filename} (컨테이너 내 경로)
-        storage_path = f"photo/photo/image/{album_id}/{unique_filename}"
+        if content_hash is None:
+            content_hash = await self._hash_content(file_content)
         
-        try:
-            await self.storage.upload_file(
-                file_content=file_content,
-                object_name=storage_path,
-                content_type=content_type,
-            )
-        except Exception as e:
-            logger.error(
-                "Photo upload failed",
-                exc_info=e,
-                extra={"event": "photo_upload", "user_id": user.id, "path": storage_path},
+        # 같은 바이트가 이미 저장돼 있으면 업로드 생략 (참조 카운트만 증가)
+        stored = await self._acquire_stored_object(content_hash)
+        if stored:
+            photo_upload_dedup_total.labels(upload_method="direct").inc()
+            analysis = await self._find_existing_analysis(content_hash)
+            if analysis is None:
+                analysis = await self._analyze_image(file_content)
+        else:
+            storage_path = content_addressed_path(content_hash, filename)
+            # 이미지 분석(placeholder, 메타데이터)은 스레드 풀에서 업로드와 동시에 진행
+            analysis_task = asyncio.create_task(self._analyze_image(file_content))
+            try:
+                await self.storage.upload_file(
+                    file_content=file_content,
+                    object_name=storage_path,
+                    content_type=content_type,
+                )
+            except Exception as e:
+                analysis_task.cancel()
+                logger.error(
+                    "Photo upload failed",
+                    exc_info=e,
+                    extra={"event": "photo_upload", "user_id": user.id, "path": storage_path},
+                )
+                raise ValueError("사진 업로드에 실패했습니다. 잠시 후 다시 시도해주세요.")
+            
+            analysis = await analysis_task
+            stored = await self._register_stored_object(
+                content_hash, storage_path, len(file_content), content_type
             )
-            raise ValueError("사진 업로드에 실패했습니다. 잠시 후 다시 시도해주세요.")
+            if stored.storage_path != storage_path:
+                # 동시 업로드가 먼저 등록함: 방금 올린 사본은 불필요
+                await self._delete_storage_object(storage_path)
         
         photo = Photo(
             owner_id=user.id,
-            filename=unique_filename,
+            filename=stored.storage_path.rsplit("/", 1)[-1],
             original_filename=filename,
             content_type=content_type,
             file_size=len(file_content),
-            storage_path=storage_path,
+            storage_path=stored.storage_path,
+            content_hash=content_hash,
             title=metadata.title if metadata else None,
             description=metadata.description if metadata else None,
+            **analysis,
         )
         
         self.db.add(photo)
         await self.db.flush()
         await self.db.refresh(photo)
+        get_similarity_index().add(user.id, photo.id, photo.phash)
+        await self.search.index_photos([photo])
+        await self.timeline.add(user.id, [photo.created_at])
+        await self.usage.apply(user.id, photos=1, bytes_used=photo.file_size)
         # 업로드 성공은 INFO (중요 비즈니스 이벤트)
         logger.info("Photo uploaded", extra={"event": "photo_upload", "photo_id": photo.id, "user_id": user.id})
         return photo
     
+    async def upload_photos(
+        self,
+        user: User,
+        album_id: int,
+        files: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload many photos in one call.
+        
+        DB 작업은 해시 단위로 묶어 몇 개의 문장으로 처리하고, 스토리지 쓰기와 이미지 분석은
+        `storage_upload_concurrency`로 동시성을 제한하여 병렬 실행 (세션은 동시 사용하지 않음).
+        배치 안에서 같은 바이트가 여러 번 나와도 한 번만 업로드합니다.
+        파일 바이트는 작업자 안에서 `read()`로 읽고 PUT이 끝나면 해제하므로, 메모리에는
+        동시 처리 중인 파일만 올라갑니다. 업로드·분석이 필요 없는 중복 파일은 읽지 않습니다.
+        
+        Args:
+            user: Owner of the photos
+            album_id: Album ID (storage path와 무관, 로깅용)
+            files: Dicts with read (async, returns the bytes), file_size, filename, content_type, content_hash
+            
+        Returns:
+            Per-file results in input order: {"photo": Photo | None, "error": str | None}
+        """
+        if not files:
+            return []
+        hashes = list({f["content_hash"] for f in files})
+        
+        # 1) 이미 저장된 오브젝트와 재사용 가능한 분석 결과 조회 (각 1회)
+        result = await self.db.execute(
+            select(StoredObject.content_hash, StoredObject.storage_path)
+            .where(StoredObject.content_hash.in_(hashes))
+        )
+        stored_paths: Dict[str, str] = dict(result.all())
+        analyses = await self._find_existing_analyses(hashes)
+        
+        # 2) 해시별 대표 파일 1개만 업로드/분석 (병렬, 동시성 제한)
+        representatives: Dict[str, Dict[str, Any]] = {}
+        for f in files:
+            representatives.setdefault(f["content_hash"], f)
+        new_paths = {
+            h: content_addressed_path(h, f["filename"])
+            for h, f in representatives.items()
+            if h not in stored_paths
+        }
+        semaphore = asyncio.Semaphore(get_settings().storage_upload_concurrency)
+        
+        async def _process(content_hash: str, f: Dict[str, Any]) -> Optional[str]:
+            if content_hash in analyses and content_hash in stored_paths:
+                return None
+            async with semaphore:
+                try:
+                    content = await f["read"]()
+                except Exception as e:
+                    logger.error(
+                        "Photo upload read failed",
+                        exc_info=e,
+                        extra={"event": "photo_upload", "user_id": user.id},
+                    )
+                    return "사진 업로드에 실패했습니다."
+                if content_hash not in analyses:
+                    analyses[content_hash] = await self._analyze_image(content)
+                if content_hash in stored_paths:
+                    return None
+                storage_path = new_paths[content_hash]
+                try:
+                    await self.storage.upload_file(
+                        file_content=content,
+                        object_name=storage_path,
+                        content_type=f["content_type"],
+                    )
+                except Exception as e:
+                    logger.error(
+                        "Photo upload failed",
+                        exc_info=e,
+                        extra={"event": "photo_upload", "user_id": user.id, "path": storage_path},
+                    )
+                    return "사진 업로드에 실패했습니다."
+                return None
+        
+        outcomes = await asyncio.gather(*(_process(h, f) for h, f in representatives.items()))
+        errors = {h: err for h, err in zip(representatives, outcomes) if err}
+        
+        # 3) 참조 카운트 반영: 기존 오브젝트는 CASE로 한 번에 증가, 새 오브젝트는 일괄 등록
+        counts: Dict[str, int] = {}
+        for f in files:
+            if f["content_hash"] not in errors:
+                counts[f["content_hash"]] = counts.get(f["content_hash"], 0) + 1
+        existing = {h: n for h, n in counts.items() if h in stored_paths}
+        if existing:
+            photo_upload_dedup_total.labels(upload_method="batch").inc(sum(existing.values()))
+            await self.db.execute(
+                update(StoredObject)
+                .where(StoredObject.content_hash.in_(list(existing)))
+                .values(ref_count=StoredObject.ref_count + case(existing, value=StoredObject.content_hash))
+                .execution_options(synchronize_session=False)
+            )
+        new_hashes = [h for h in counts if h not in stored_paths]
+        if new_hashes:
+            stored_paths.update(await self._register_stored_objects(
+                [
+                    StoredObject(
+                        content_hash=h,
+                        storage_path=new_paths[h],
+                        file_size=representatives[h]["file_size"],
+                        content_type=representatives[h]["content_type"],
+                        ref_count=counts[h],
+                    )
+                    for h in new_hashes
+                ]
+            ))
+        
+        # 4) Photo 행 일괄 INSERT
+        results: List[Dict[str, Any]] = []
+        photos: List[Photo] = []
+        for f in files:
+            content_hash = f["content_hash"]
+            if content_hash in errors:
+                results.append({"photo": None, "error": errors[content_hash]})
+                continue
+            storage_path = stored_paths[content_hash]
+            photo = Photo(
+                owner_id=user.id,
+                filename=storage_path.rsplit("/", 1)[-1],
+                original_filename=f["filename"],
+                content_type=f["content_type"],
+                file_size=f["file_size"],
+                storage_path=storage_path,
+                content_hash=content_hash,
+                **analyses[content_hash],
+            )
+            photos.append(photo)
+            results.append({"photo": photo, "error": None})
+        
+        if photos:
+            self.db.add_all(photos)
+            await self.db.flush()
+            similarity_index = get_similarity_index()
+            for photo in photos:
+                similarity_index.add(user.id, photo.id, photo.phash)
+            await self.search.index_photos(photos)
+            await self.timeline.add(user.id, [photo.created_at for photo in photos])
+            await self.usage.apply(user.id, photos=len(photos), bytes_used=sum(photo.file_size for photo in photos))
+        logger.info(
+            "Photos uploaded",
+            extra={
+                "event": "photo_upload",
+                "user_id": user.id,
+                "album_id": album_id,
+                "uploaded": len(photos),
+                "failed": len(files) - len(photos),
+            },
+        )
+        return results
+    
     async def get_photo_by_id(
         self,
         photo_id: int,
@@ -138,6 +384,76 @@ class PhotoService:
         )
         return list(result.scalars().all())
     
+    async def get_user_photos_page(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Photo], Optional[str]]:
+        """
+        Get a page of a user's photos using keyset pagination on (created_at, id).
+        
+        Args:
+            user_id: User ID
+            limit: Maximum number of records to return
+            cursor: next_cursor from the previous page (None for the first page)
+            
+        Returns:
+            (photos, next_cursor) — next_cursor is None on the last page
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = select(Photo).where(Photo.owner_id == user_id)
+        if cursor:
+            query = query.where(created_before(Photo.created_at, Photo.id, cursor))
+        # limit + 1개를 읽어 다음 페이지 존재 여부 확인 (COUNT 쿼리 없음)
+        result = await self.db.execute(
+            query.order_by(Photo.created_at.desc(), Photo.id.desc()).limit(limit + 1)
+        )
+        photos = list(result.scalars().all())
+        if len(photos) <= limit:
+            return photos, None
+        photos = photos[:limit]
+        return photos, encode_cursor(photos[-1].created_at, photos[-1].id)
+    
+    async def find_similar_photos(
+        self,
+        photo: Photo,
+        max_distance: int,
+        limit: int,
+    ) -> List[Tuple[Photo, int]]:
+        """
+        Find the owner's photos that look like `photo` (perceptual hash 해밍 거리 기준).
+        
+        후보는 사용자별 메모리 해시 인덱스(multi-index hashing)에서 찾고, DB에서는 후보 ID만 조회합니다 (전체 스캔 없음).
+        
+        Args:
+            photo: Reference photo (phash가 없으면 빈 결과)
+            max_distance: Maximum Hamming distance (0-64, 작을수록 엄격)
+            limit: Maximum number of results
+            
+        Returns:
+            (Photo, distance) pairs, nearest first (기준 사진 제외)
+        """
+        if photo.phash is None:
+            return []
+        matches = await get_similarity_index().search(
+            self.db, photo.owner_id, photo.phash, max_distance
+        )
+        matches = [(distance, photo_id) for distance, photo_id in matches if photo_id != photo.id][:limit]
+        if not matches:
+            return []
+        result = await self.db.execute(
+            select(Photo).where(
+                Photo.owner_id == photo.owner_id,
+                Photo.id.in_([photo_id for _, photo_id in matches]),
+            )
+        )
+        photos = {p.id: p for p in result.scalars().all()}
+        # 다른 워커에서 삭제된 사진은 DB 조회 결과에서 빠짐
+        return [(photos[photo_id], distance) for distance, photo_id in matches if photo_id in photos]
+    
     async def update_photo(
         self,
         photo: Photo,
@@ -159,32 +475,103 @@ class PhotoService:
             photo.description = update_data.description
         
         await self.db.flush()
+        await bump_photo_album_versions(self.db, [photo.id])
         await self.db.refresh(photo)
+        await self.search.index_photos([photo])
         return photo
     
-    async def delete_photo(self, photo: Photo) -> bool:
+    async def delete_photo(self, photo: Photo) -> Optional[str]:
         """
-        Delete a photo from storage and database.
+        Delete a photo from the database.
+        
+        스토리지 오브젝트는 여기서 지우지 않고 경로만 반환 (호출자가 DB 커밋 후 삭제).
+        커밋 전에 지우면 롤백 시 stored_objects 행은 남고 바이트만 사라지기 때문.
         
         Args:
             photo: Photo to delete
             
         Returns:
-            True if deletion was successful
+            Storage path to delete after commit (다른 사진이 같은 오브젝트를 참조하면 None)
         """
-        try:
-            await self.storage.delete_file(photo.storage_path)
-        except Exception as e:
-            # 스토리지 삭제 실패해도 DB에서는 삭제 (고아 파일 허용)
-            logger.error(
-                "Photo storage delete failed",
-                exc_info=e,
-                extra={"event": "photo_delete", "photo_id": photo.id},
-            )
+        if photo.content_hash:
+            # 공유 오브젝트: 마지막 참조일 때만 스토리지에서 삭제
+            path_to_delete = await self._release_stored_object(photo.content_hash)
+        else:
+            path_to_delete = photo.storage_path
+        await bump_photo_album_versions(self.db, [photo.id])
         await self.db.delete(photo)
         await self.db.flush()
+        get_similarity_index().remove(photo.owner_id, [photo.id])
+        get_share_cache().revoke_photos([photo.id])
+        await self.search.remove(DOC_TYPE_PHOTO, [photo.id])
+        await self.timeline.remove(photo.owner_id, [photo.created_at])
+        await self.usage.apply(photo.owner_id, photos=-1, bytes_used=-photo.file_size)
         # 삭제 성공은 로깅 안 함 (운영 노이즈 최소화)
-        return True
+        return path_to_delete
+    
+    async def delete_photos(self, user_id: int, photo_ids: List[int]) -> Dict[str, Any]:
+        """
+        Delete many photos with set-based statements.
+        
+        소유권은 한 번의 SELECT로 확인하고, 앨범 연결/커버/사진 행은 각각 `WHERE ... IN (...)` 한 문장으로 삭제.
+        스토리지 오브젝트는 여기서 지우지 않고 삭제 대상 경로만 반환 (호출자가 DB 커밋 후
+        `storage.delete_files`로 동시성 제한을 두고 정리).
+        
+        Args:
+            user_id: Owner user ID (다른 사용자의 사진 ID는 무시)
+            photo_ids: Photo IDs to delete
+            
+        Returns:
+            Dictionary with deleted_ids, not_found_ids, file_size (삭제된 사진 크기 합),
+            and storage_paths (마지막 참조가 사라져 스토리지에서 지워야 하는 오브젝트)
+        """
+        requested_ids = list(dict.fromkeys(photo_ids))
+        result = await self.db.execute(
+            select(Photo.id, Photo.storage_path, Photo.content_hash, Photo.file_size, Photo.created_at)
+            .where(Photo.owner_id == user_id, Photo.id.in_(requested_ids))
+        )
+        rows = result.all()
+        deleted_ids = [row.id for row in rows]
+        found = set(deleted_ids)
+        not_found_ids = [photo_id for photo_id in requested_ids if photo_id not in found]
+        if not deleted_ids:
+            return {"deleted_ids": [], "not_found_ids": not_found_ids, "file_size": 0, "storage_paths": []}
+        
+        # content_hash 없는 사진(레거시/확인 전 presigned)은 개별 오브젝트이므로 바로 삭제 대상
+        storage_paths = [row.storage_path for row in rows if not row.content_hash]
+        content_hashes = list({row.content_hash for row in rows if row.content_hash})
+        if content_hashes:
+            storage_paths += await self._release_stored_objects(deleted_ids, content_hashes)
+        
+        await bump_photo_album_versions(self.db, deleted_ids)
+        await self.db.execute(
+            delete(AlbumPhoto)
+            .where(AlbumPhoto.photo_id.in_(deleted_ids))
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(
+            update(Album)
+            .where(Album.cover_photo_id.in_(deleted_ids))
+            .values(cover_photo_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(
+            delete(Photo)
+            .where(Photo.id.in_(deleted_ids))
+            .execution_options(synchronize_session=False)
+        )
+        get_similarity_index().remove(user_id, deleted_ids)
+        get_share_cache().revoke_photos(deleted_ids)
+        await self.search.remove(DOC_TYPE_PHOTO, deleted_ids)
+        await self.timeline.remove(user_id, [row.created_at for row in rows])
+        await self.usage.apply(user_id, photos=-len(rows), bytes_used=-sum(row.file_size for row in rows))
+        
+        return {
+            "deleted_ids": deleted_ids,
+            "not_found_ids": not_found_ids,
+            "file_size": sum(row.file_size for row in rows),
+            "storage_paths": storage_paths,
+        }
     
     async def download_photo(self, photo: Photo) -> bytes:
         """
@@ -212,7 +599,11 @@ class PhotoService:
         URL은 항상 /photos/{id}/image. 실제 이미지 접근 시 JWT 필요하며,
         서버가 권한 확인 후 CDN으로 302 리다이렉트하므로 트래픽은 LB를 거치지 않음.
         """
-        url = f"/photos/{photo.id}/image"
+        return self.build_photo_with_url(photo, f"/photos/{photo.id}/image")
+    
+    @staticmethod
+    def build_photo_with_url(photo: Photo, url: str) -> PhotoWithUrl:
+        """Build a PhotoWithUrl response from a Photo model and its view URL."""
         return PhotoWithUrl(
             id=photo.id,
             owner_id=photo.owner_id,
@@ -220,11 +611,19 @@ class PhotoService:
             original_filename=photo.original_filename,
             content_type=photo.content_type,
             file_size=photo.file_size,
+            content_hash=photo.content_hash,
+            width=photo.width,
+            height=photo.height,
+            orientation=photo.orientation,
+            taken_at=photo.taken_at,
+            camera=photo.camera,
             title=photo.title,
             description=photo.description,
             created_at=photo.created_at,
             updated_at=photo.updated_at,
             url=url,
+            blurhash=photo.blurhash,
+            dominant_color=photo.dominant_color,
         )
     
     async def get_photos_with_urls(
@@ -293,6 +692,10 @@ class PhotoService:
                 object_name=storage_path,
                 content_type=content_type,
             )
+            # 목록(GET /photos/)에 확인 전 사진도 보이므로 타임라인도 생성 시점에 집계
+            await self.timeline.add(user.id, [photo.created_at])
+            # 확인 시 실제 오브젝트 크기로 보정
+            await self.usage.apply(user.id, photos=1, bytes_used=file_size)
             
             logger.info(
                 "Temp upload URL generated",
@@ -322,7 +725,7 @@ class PhotoService:
         self,
         photo_id: int,
         user_id: int,
-    ) -> Photo:
+    ) -> Tuple[Photo, Optional[str]]:
         """
         Confirm that a photo upload is complete by verifying the file exists in storage.
         
@@ -331,7 +734,7 @@ class PhotoService:
             user_id: User ID (for ownership verification)
             
         Returns:
-            Confirmed Photo model
+            (Confirmed Photo model, 커밋 후 삭제할 중복 사본 경로 또는 None)
             
         Raises:
             ValueError: If photo not found, not owned by user, or file doesn't exist
@@ -351,12 +754,20 @@ class PhotoService:
                 )
                 raise ValueError("업로드된 파일을 찾을 수 없습니다. 업로드를 다시 시도해주세요.")
             
+            redundant_path = None
+            if photo.content_hash is None:
+                redundant_path = await self._finalize_uploaded_object(photo)
+                # 크기·해상도 등 확정된 값을 공유 앨범 응답에 반영
+                await bump_photo_album_versions(self.db, [photo.id])
+            # presigned 업로드는 확인 시점에 검색 색인에 추가
+            await self.search.index_photos([photo])
+            
             logger.info(
                 "Photo upload confirmed",
                 extra={"event": "photo_upload_confirm", "photo_id": photo_id, "user_id": user_id}
             )
             
-            return photo
+            return photo, redundant_path
             
         except ValueError:
             raise
@@ -366,4 +777,250 @@ class PhotoService:
                 exc_info=e,
                 extra={"event": "photo_upload_confirm", "photo_id": photo_id, "user_id": user_id}
             )
-            raise ValueError("파일 확인 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.")
\ No newline at end of file
+            raise ValueError("파일 확인 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.")
+    
+    async def _analyze_image(self, content: bytes) -> Dict[str, Any]:
+        """Run image analysis (placeholder + header metadata + perceptual hash) off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _analyze_image, content)
+    
+    async def get_user_photo_by_hash(self, user_id: int, content_hash: str) -> Optional[Photo]:
+        """Return one of the user's photos with the given SHA-256, if any."""
+        result = await self.db.execute(
+            select(Photo)
+            .where(Photo.owner_id == user_id, Photo.content_hash == content_hash)
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+    
+    async def _hash_content(self, content: bytes) -> str:
+        """SHA-256 (hex) off the event loop (hashlib releases the GIL for large buffers)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: hashlib.sha256(content).hexdigest())
+    
+    async def _acquire_stored_object(self, content_hash: str) -> Optional[StoredObject]:
+        """Increment the reference count of an existing object. Returns None if not stored yet."""
+        result = await self.db.execute(
+            update(StoredObject)
+            .where(StoredObject.content_hash == content_hash)
+            .values(ref_count=StoredObject.ref_count + 1)
+        )
+        if result.rowcount == 0:
+            return None
+        result = await self.db.execute(
+            select(StoredObject).where(StoredObject.content_hash == content_hash)
+        )
+        return result.scalar_one()
+    
+    async def _register_stored_object(
+        self,
+        content_hash: str,
+        storage_path: str,
+        file_size: int,
+        content_type: str,
+    ) -> StoredObject:
+        """
+        Register a newly written object (ref_count=1).
+        동시 업로드가 먼저 등록한 경우(unique 위반) 해당 오브젝트의 참조를 증가시켜 반환.
+        """
+        stored = StoredObject(
+            content_hash=content_hash,
+            storage_path=storage_path,
+            file_size=file_size,
+            content_type=content_type,
+            ref_count=1,
+        )
+        try:
+            async with self.db.begin_nested():
+                self.db.add(stored)
+            return stored
+        except IntegrityError:
+            existing = await self._acquire_stored_object(content_hash)
+            if existing is None:
+                raise
+            return existing
+    
+    async def _register_stored_objects(self, stored_objects: List[StoredObject]) -> Dict[str, str]:
+        """
+        Register many new objects in one flush. 동시 업로드와 충돌하면 개별 등록으로 폴백.
+        
+        Returns:
+            {content_hash: storage_path} (충돌 시 먼저 등록된 오브젝트의 경로)
+        """
+        try:
+            async with self.db.begin_nested():
+                self.db.add_all(stored_objects)
+            return {obj.content_hash: obj.storage_path for obj in stored_objects}
+        except IntegrityError:
+            pass
+        
+        paths: Dict[str, str] = {}
+        for obj in stored_objects:
+            ref_count = obj.ref_count
+            registered = await self._register_stored_object(
+                obj.content_hash, obj.storage_path, obj.file_size, obj.content_type
+            )
+            if ref_count > 1:
+                await self.db.execute(
+                    update(StoredObject)
+                    .where(StoredObject.content_hash == obj.content_hash)
+                    .values(ref_count=StoredObject.ref_count + (ref_count - 1))
+                )
+            if registered.storage_path != obj.storage_path:
+                # 동시 업로드가 먼저 등록함: 방금 올린 사본은 불필요
+                await self._delete_storage_object(obj.storage_path)
+            paths[obj.content_hash] = registered.storage_path
+        return paths
+    
+    async def _release_stored_object(self, content_hash: str) -> Optional[str]:
+        """
+        Decrement the reference count. Returns the storage path to delete
+        when this was the last reference, otherwise None.
+        """
+        await self.db.execute(
+            update(StoredObject)
+            .where(StoredObject.content_hash == content_hash)
+            .values(ref_count=StoredObject.ref_count - 1)
+        )
+        result = await self.db.execute(
+            select(StoredObject.storage_path).where(StoredObject.content_hash == content_hash)
+        )
+        storage_path = result.scalar_one_or_none()
+        if storage_path is None:
+            return None
+        # 조건부 삭제: 그 사이 다른 업로드가 참조를 늘렸다면 삭제되지 않음
+        result = await self.db.execute(
+            delete(StoredObject).where(
+                StoredObject.content_hash == content_hash,
+                StoredObject.ref_count <= 0,
+            )
+        )
+        return storage_path if result.rowcount else None
+    
+    async def _release_stored_objects(self, photo_ids: List[int], content_hashes: List[str]) -> List[str]:
+        """
+        Set-based version of _release_stored_object for a batch of photos being deleted.
+        참조 카운트를 삭제되는 사진 수만큼 한 문장으로 감소시키고, 0이 된 오브젝트 경로를 반환.
+        """
+        released = (
+            select(func.count(Photo.id))
+            .where(Photo.content_hash == StoredObject.content_hash, Photo.id.in_(photo_ids))
+            .scalar_subquery()
+        )
+        await self.db.execute(
+            update(StoredObject)
+            .where(StoredObject.content_hash.in_(content_hashes))
+            .values(ref_count=StoredObject.ref_count - released)
+            .execution_options(synchronize_session=False)
+        )
+        orphaned = StoredObject.content_hash.in_(content_hashes) & (StoredObject.ref_count <= 0)
+        result = await self.db.execute(
+            select(StoredObject.content_hash, StoredObject.storage_path).where(orphaned)
+        )
+        candidates = dict(result.all())
+        if not candidates:
+            return []
+        await self.db.execute(
+            delete(StoredObject).where(orphaned).execution_options(synchronize_session=False)
+        )
+        # 그 사이 다른 업로드가 참조를 늘려 삭제되지 않은 행은 스토리지에서도 유지
+        result = await self.db.execute(
+            select(StoredObject.content_hash).where(StoredObject.content_hash.in_(list(candidates)))
+        )
+        survivors = set(result.scalars().all())
+        return [path for content_hash, path in candidates.items() if content_hash not in survivors]
+    
+    async def _delete_storage_object(self, storage_path: str) -> None:
+        """Best-effort delete of a redundant copy (failure leaves an orphan, not an error)."""
+        try:
+            await self.storage.delete_file(storage_path)
+        except Exception as e:
+            logger.warning(
+                "Redundant object delete failed",
+                extra={"event": "photo_dedup", "path": storage_path, "error": str(e)[:200]},
+            )
+    
+    async def _find_existing_analysis(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Reuse analysis columns from another photo with the same bytes (skips decoding)."""
+        result = await self.db.execute(
+            select(*[getattr(Photo, field) for field in ANALYSIS_FIELDS])
+            .where(
+                Photo.content_hash == content_hash,
+                (Photo.width.is_not(None)) | (Photo.blurhash.is_not(None)),
+            )
+            .limit(1)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return dict(zip(ANALYSIS_FIELDS, row))
+    
+    async def _find_existing_analyses(self, content_hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Batch version of _find_existing_analysis: {content_hash: analysis columns}."""
+        result = await self.db.execute(
+            select(Photo.content_hash, *[getattr(Photo, field) for field in ANALYSIS_FIELDS])
+            .where(
+                Photo.content_hash.in_(content_hashes),
+                (Photo.width.is_not(None)) | (Photo.blurhash.is_not(None)),
+            )
+        )
+        analyses: Dict[str, Dict[str, Any]] = {}
+        for content_hash, *values in result.all():
+            analyses.setdefault(content_hash, dict(zip(ANALYSIS_FIELDS, values)))
+        return analyses
+    
+    async def _finalize_uploaded_object(self, photo: Photo) -> Optional[str]:
+        """
+        Presigned 업로드 확인 시: 업로드된 오브젝트를 1회 내려받아 해시·이미지 분석 결과를 저장.
+        같은 바이트가 이미 저장돼 있으면 기존 오브젝트를 참조하고, 방금 업로드된 사본의 경로를 반환
+        (호출자가 DB 커밋 후 삭제).
+        다운로드에 실패해도 업로드 확인은 성공 처리 (중복 제거·분석 결과는 부가 정보).
+        
+        동시에 들어온 확인 요청은 `content_hash IS NULL` 조건부 UPDATE로 한 요청만 확정하므로
+        참조 카운트·사용량이 두 번 반영되지 않습니다.
+        """
+        try:
+            content = await self.storage.download_file(photo.storage_path)
+        except Exception as e:
+            logger.warning(
+                "Upload finalization skipped - download failed",
+                extra={"event": "photo_upload_confirm", "photo_id": photo.id, "error": str(e)[:200]},
+            )
+            return None
+        
+        content_hash = await self._hash_content(content)
+        result = await self.db.execute(
+            update(Photo)
+            .where(Photo.id == photo.id, Photo.content_hash.is_(None))
+            .values(content_hash=content_hash)
+        )
+        if result.rowcount == 0:
+            # 다른 확인 요청이 먼저 확정함
+            await self.db.refresh(photo)
+            return None
+        
+        # 클라이언트가 신고한 크기 대신 실제 오브젝트 크기로 보정
+        await self.usage.apply(photo.owner_id, bytes_used=len(content) - photo.file_size)
+        photo.file_size = len(content)
+        
+        redundant_path = None
+        stored = await self._acquire_stored_object(content_hash)
+        if stored is None:
+            stored = await self._register_stored_object(
+                content_hash, photo.storage_path, len(content), photo.content_type
+            )
+        if stored.storage_path != photo.storage_path:
+            photo_upload_dedup_total.labels(upload_method="presigned").inc()
+            redundant_path = photo.storage_path
+            photo.storage_path = stored.storage_path
+            photo.filename = stored.storage_path.rsplit("/", 1)[-1]
+        photo.content_hash = content_hash
+        
+        analysis = await self._find_existing_analysis(content_hash)
+        if analysis is None:
+            analysis = await self._analyze_image(content)
+        for field, value in analysis.items():
+            setattr(photo, field, value)
+        await self.db.flush()
+        get_similarity_index().add(photo.owner_id, photo.id, photo.phash)
+        return redundant_path
@@ -0,0 +1,179 @@
+"""
+Full-text search service for photos and albums.
+
+색인은 search_documents 테이블 하나로 관리하며, 사진·앨범의 생성/수정/삭제 시
+PhotoService·AlbumService가 같은 트랜잭션 안에서 갱신합니다.
+질의는 DB 방언별로 실행합니다:
+- SQLite: FTS5 MATCH + bm25 순위
+- PostgreSQL: tsvector @@ tsquery (GIN) + ts_rank 순위
+- 그 외: tokens LIKE 검색 (순위 없음, 최신순)
+"""
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.album import Album
+from app.models.photo import Photo
+from app.models.search_document import DOC_TYPE_ALBUM, DOC_TYPE_PHOTO, SearchDocument
+from app.utils.pagination import decode_score_cursor, encode_score_cursor
+from app.utils.search_tokens import document_tokens, query_tokens
+
+logger = logging.getLogger("app.search")
+
+TITLE_MAX_LENGTH = 255
+
+
+def photo_document(photo: Photo) -> Dict[str, Any]:
+    """search_documents row values for a photo."""
+    return {
+        "owner_id": photo.owner_id,
+        "doc_type": DOC_TYPE_PHOTO,
+        "doc_id": photo.id,
+        "title": (photo.title or photo.original_filename)[:TITLE_MAX_LENGTH],
+        "body": photo.description,
+        "tokens": document_tokens(photo.title, photo.description, photo.original_filename),
+    }
+
+
+def album_document(album: Album) -> Dict[str, Any]:
+    """search_documents row values for an album."""
+    return {
+        "owner_id": album.owner_id,
+        "doc_type": DOC_TYPE_ALBUM,
+        "doc_id": album.id,
+        "title": album.name[:TITLE_MAX_LENGTH],
+        "body": album.description,
+        "tokens": document_tokens(album.name, album.description),
+    }
+
+
+class SearchService:
+    """
+    Service for keeping the search index in sync and querying it.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def index_photos(self, photos: Iterable[Photo]) -> None:
+        """Add or refresh photos in the index."""
+        await self._replace([photo_document(photo) for photo in photos])
+
+    async def index_album(self, album: Album) -> None:
+        """Add or refresh an album in the index."""
+        await self._replace([album_document(album)])
+
+    async def remove(self, doc_type: str, doc_ids: List[int]) -> None:
+        """Remove documents (사진/앨범 삭제 시)."""
+        if not doc_ids:
+            return
+        await self.db.execute(
+            delete(SearchDocument)
+            .where(SearchDocument.doc_type == doc_type, SearchDocument.doc_id.in_(doc_ids))
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _replace(self, documents: List[Dict[str, Any]]) -> None:
+        """
+        Delete-then-insert by (doc_type, doc_id), one statement each.
+        같은 문서를 동시에 갱신해 unique 제약에 걸리면 한 번 더 시도 (상대 트랜잭션이 넣은 행을 지우고 다시 삽입).
+        """
+        if not documents:
+            return
+        for attempt in range(2):
+            try:
+                async with self.db.begin_nested():
+                    for doc_type in {doc["doc_type"] for doc in documents}:
+                        await self.remove(
+                            doc_type, [doc["doc_id"] for doc in documents if doc["doc_type"] == doc_type]
+                        )
+                    await self.db.execute(insert(SearchDocument), documents)
+                return
+            except IntegrityError:
+                if attempt:
+                    raise
+
+    async def search(
+        self,
+        user_id: int,
+        query: str,
+        doc_type: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Search the user's photos and albums.
+
+        Args:
+            user_id: Owner user ID (다른 사용자 문서는 검색되지 않음)
+            query: Search text (모든 토큰이 prefix로 일치해야 함)
+            doc_type: "photo" | "album" | None (둘 다)
+            limit: Page size
+            cursor: Opaque cursor from the previous page
+
+        Returns:
+            (results, next_cursor). results는 doc_type, doc_id, title, body, score 키를 가진 dict
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        tokens = query_tokens(query)
+        if not tokens:
+            return [], None
+
+        params: Dict[str, Any] = {"owner_id": user_id, "limit": limit + 1}
+        filters = []
+        if doc_type:
+            filters.append("doc_type = :doc_type")
+            params["doc_type"] = doc_type
+        if cursor:
+            params["cursor_score"], params["cursor_id"] = decode_score_cursor(cursor)
+            filters.append("(score < :cursor_score OR (score = :cursor_score AND id < :cursor_id))")
+
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "sqlite":
+            # 토큰은 [^\W_]+ 로만 구성되어 따옴표 이스케이프 불필요
+            params["match"] = f'owner_key:"u{user_id}" AND tokens:(' + " AND ".join(
+                f'"{token}"*' for token in tokens
+            ) + ")"
+            # owner_key 컬럼 가중치 0: 순위는 tokens만으로 계산 (bm25는 작을수록 관련도 높음)
+            source = (
+                "SELECT d.id, d.doc_type, d.doc_id, d.title, d.body, "
+                "-bm25(search_documents_fts, 0.0, 1.0) AS score "
+                "FROM search_documents_fts JOIN search_documents d ON d.id = search_documents_fts.rowid "
+                "WHERE search_documents_fts MATCH :match AND d.owner_id = :owner_id"
+            )
+        elif dialect == "postgresql":
+            params["tsquery"] = " & ".join(f"'{token}':*" for token in tokens)
+            source = (
+                "SELECT d.id, d.doc_type, d.doc_id, d.title, d.body, "
+                "ts_rank(to_tsvector('simple', d.tokens), q) AS score "
+                "FROM search_documents d, to_tsquery('simple', :tsquery) q "
+                "WHERE d.owner_id = :owner_id AND to_tsvector('simple', d.tokens) @@ q"
+            )
+        else:
+            # 전문 인덱스가 없는 DB: 토큰 부분 일치 (owner_id 인덱스로 사용자 범위만 스캔)
+            conditions = []
+            for i, token in enumerate(tokens):
+                params[f"token_{i}"] = f"%{token}%"
+                conditions.append(f"d.tokens LIKE :token_{i}")
+            source = (
+                "SELECT d.id, d.doc_type, d.doc_id, d.title, d.body, 0.0 AS score "
+                "FROM search_documents d WHERE d.owner_id = :owner_id AND " + " AND ".join(conditions)
+            )
+
+        sql = f"SELECT * FROM ({source}) ranked"
+        if filters:
+            sql += " WHERE " + " AND ".join(filters)
+        sql += " ORDER BY score DESC, id DESC LIMIT :limit"
+
+        result = await self.db.execute(text(sql), params)
+        rows = [dict(row._mapping) for row in result.all()]
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_score_cursor(float(rows[-1]["score"]), rows[-1]["id"])
+        return rows, next_cursor
@@ -0,0 +1,348 @@
+"""
+Share link resolution cache (공유 링크 토큰·앨범 구성 메모리 캐시).
+
+공유 앨범 이미지 요청마다 토큰 조회 + 앨범 포함 여부 확인을 DB에서 하면 사진 300장짜리 앨범 하나를
+보는 데 수백 번의 쿼리가 듭니다. 여기서는
+- 토큰 → (share id, album id, owner id, is_active, expires_at)를 캐시해 유효성을 메모리에서 판단하고,
+- 앨범 구성은 정렬된 photo_id 배열(array('q'), 사진당 8바이트)로 캐시해 이진 탐색으로 확인합니다.
+따라서 캐시 적중 시 공유 이미지 권한 확인은 DB 왕복 없이 끝납니다.
+
+- 비활성화/삭제/앨범 변경 시 같은 프로세스의 항목은 즉시 무효화합니다.
+- 프로세스(워커)별 캐시이므로 다른 워커의 변경은 TTL(share_cache_ttl_seconds) 이내에 반영됩니다.
+- 캐시 크기는 share_cache_max_links / share_cache_max_albums로 제한 (LRU).
+
+없는 토큰(무작위 토큰 스캔)은 DB에 닿기 전에 걸러냅니다.
+- 유효 토큰 Bloom filter: 시작 시 전체 토큰으로 생성하고 생성 시 추가합니다. 필터에 없는 토큰은 확실히 없는
+  토큰이므로 DB 조회 없이 거절합니다. 다른 워커가 만든 토큰은 필터에 없는 토큰이 들어왔을 때
+  share_token_filter_sync_seconds에 한 번만 최근 ID 구간을 읽어 반영합니다 (스캔 속도와 무관한 상한).
+- 음성 캐시: 필터를 통과했지만 DB에 없는 토큰(오탐·삭제된 링크)을 share_negative_cache_seconds 동안 기억합니다.
+
+서명된 공유 이미지 URL은 DB를 보지 않고 검증하므로, 링크 비활성화·삭제와 사진 삭제는 폐기 목록(deny set)에
+share_image_url_ttl_seconds 동안 기록해 막습니다 (그 뒤에는 발급된 URL이 모두 만료됨).
+"""
+import asyncio
+import logging
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.album import Album, AlbumPhoto
+from app.models.share import ShareLink
+from app.models.user import User
+from app.utils.bloom import BloomFilter
+from app.utils.prometheus_metrics import share_cache_requests_total
+
+# 필터 동기화 시 다시 읽는 최근 ID 구간 (다른 워커 트랜잭션이 ID 순서와 다르게 커밋되는 경우 대비)
+logger = logging.getLogger("app.share")
+
+TOKEN_FILTER_ID_LOOKBACK = 100
+TOKEN_FILTER_MIN_CAPACITY = 10000
+
+
+@dataclass(frozen=True)
+class CachedShareLink:
+    """Resolved share link fields needed for access checks."""
+
+    share_id: int
+    album_id: int
+    owner_id: int
+    is_active: bool
+    expires_at: Optional[datetime]
+
+    @property
+    def is_valid(self) -> bool:
+        """ShareLink.is_valid와 같은 판단 (만료 시각은 조회 시점 기준)."""
+        if not self.is_active:
+            return False
+        if self.expires_at and datetime.utcnow() > self.expires_at:
+            return False
+        return True
+
+
+class ShareLinkCache:
+    """Token and album membership caches with TTL, LRU eviction and explicit invalidation."""
+
+    def __init__(
+        self,
+        max_links: int,
+        max_albums: int,
+        ttl_seconds: int,
+        revoke_seconds: int,
+        negative_ttl_seconds: int,
+        max_missing: int,
+        filter_sync_seconds: int,
+        filter_rebuild_seconds: int,
+    ):
+        self.max_links = max_links
+        self.max_albums = max_albums
+        self.ttl_seconds = ttl_seconds
+        self.revoke_seconds = revoke_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_missing = max_missing
+        self.filter_sync_seconds = filter_sync_seconds
+        self.filter_rebuild_seconds = filter_rebuild_seconds
+        # 유효 토큰 Bloom filter (None이면 아직 생성 전: 모든 토큰을 DB에서 확인)
+        self._token_filter: Optional[BloomFilter] = None
+        self._token_filter_max_id = 0
+        self._token_filter_built = 0.0
+        self._token_filter_synced = 0.0
+        self._token_filter_lock = asyncio.Lock()
+        # 재생성 중 추가된 토큰 (생성 완료 후 새 필터에 반영)
+        self._token_filter_pending: Optional[list] = None
+        # 없는 토큰 음성 캐시: token -> 기록 시각
+        self._missing: "OrderedDict[str, float]" = OrderedDict()
+        # 서명된 이미지 URL 폐기 목록: ("share" | "photo", id) -> 기록 시각 (revoke_seconds 후 제거)
+        self._revoked: Dict[Tuple[str, int], float] = {}
+        self._links: "OrderedDict[str, Tuple[CachedShareLink, float]]" = OrderedDict()
+        self._albums: "OrderedDict[int, Tuple[array, float]]" = OrderedDict()
+        self._locks: Dict[int, asyncio.Lock] = {}
+        # 조회 중인 앨범의 무효화 횟수: 조회 중 무효화되면 조회 결과를 캐시에 넣지 않음
+        self._loading: Dict[int, int] = {}
+
+    async def get_link(self, db: AsyncSession, token: str) -> Optional[CachedShareLink]:
+        """
+        Resolve a token (삭제 요청된 앨범·계정의 링크는 None).
+        없는 토큰은 Bloom filter와 음성 캐시로 걸러 DB에 닿지 않게 합니다.
+        """
+        entry = self._links.get(token)
+        if entry and time.monotonic() - entry[1] < self.ttl_seconds:
+            self._links.move_to_end(token)
+            share_cache_requests_total.labels(cache="link", result="hit").inc()
+            return entry[0]
+
+        missing_at = self._missing.get(token)
+        if missing_at is not None:
+            if time.monotonic() - missing_at < self.negative_ttl_seconds:
+                share_cache_requests_total.labels(cache="negative", result="hit").inc()
+                return None
+            del self._missing[token]
+
+        if self._token_filter is not None and token not in self._token_filter:
+            await self._sync_token_filter(db)
+            if token not in self._token_filter:
+                share_cache_requests_total.labels(cache="token_filter", result="reject").inc()
+                return None
+
+        share_cache_requests_total.labels(cache="link", result="miss").inc()
+        result = await db.execute(
+            select(ShareLink.id, ShareLink.album_id, Album.owner_id, ShareLink.is_active, ShareLink.expires_at)
+            .join(Album, Album.id == ShareLink.album_id)
+            .join(User, User.id == Album.owner_id)
+            .where(ShareLink.token == token, Album.deleted_at.is_(None), User.deleted_at.is_(None))
+        )
+        row = result.first()
+        if row is None:
+            self._links.pop(token, None)
+            self._remember_missing(token)
+            return None
+        link = CachedShareLink(
+            share_id=row.id,
+            album_id=row.album_id,
+            owner_id=row.owner_id,
+            is_active=row.is_active,
+            expires_at=row.expires_at,
+        )
+        self._links[token] = (link, time.monotonic())
+        self._links.move_to_end(token)
+        while len(self._links) > self.max_links:
+            self._links.popitem(last=False)
+        return link
+
+    async def album_contains(self, db: AsyncSession, album_id: int, photo_id: int) -> bool:
+        """Whether the photo is in the album (정렬 배열 이진 탐색)."""
+        photo_ids = await self._get_album(db, album_id)
+        index = bisect_left(photo_ids, photo_id)
+        return index < len(photo_ids) and photo_ids[index] == photo_id
+
+    async def _get_album(self, db: AsyncSession, album_id: int) -> array:
+        entry = self._albums.get(album_id)
+        if entry and time.monotonic() - entry[1] < self.ttl_seconds:
+            self._albums.move_to_end(album_id)
+            share_cache_requests_total.labels(cache="album", result="hit").inc()
+            return entry[0]
+
+        lock = self._locks.setdefault(album_id, asyncio.Lock())
+        async with lock:
+            entry = self._albums.get(album_id)
+            if entry and time.monotonic() - entry[1] < self.ttl_seconds:
+                return entry[0]
+
+            share_cache_requests_total.labels(cache="album", result="miss").inc()
+            self._loading[album_id] = 0
+            try:
+                # (album_id, photo_id) unique 인덱스 순서 그대로 읽어 정렬 없이 배열 생성
+                result = await db.execute(
+                    select(AlbumPhoto.photo_id)
+                    .where(AlbumPhoto.album_id == album_id)
+                    .order_by(AlbumPhoto.photo_id)
+                )
+                photo_ids = array("q", result.scalars().all())
+            finally:
+                invalidated = self._loading.pop(album_id)
+            if not invalidated:
+                self._albums[album_id] = (photo_ids, time.monotonic())
+                self._albums.move_to_end(album_id)
+                while len(self._albums) > self.max_albums:
+                    evicted, _ = self._albums.popitem(last=False)
+                    self._locks.pop(evicted, None)
+            return photo_ids
+
+    def _remember_missing(self, token: str) -> None:
+        self._missing[token] = time.monotonic()
+        self._missing.move_to_end(token)
+        while len(self._missing) > self.max_missing:
+            self._missing.popitem(last=False)
+
+    def add_token(self, token: str) -> None:
+        """Register a new share token (생성 시, 같은 프로세스에서는 즉시 필터 통과)."""
+        self._missing.pop(token, None)
+        if self._token_filter is not None:
+            self._token_filter.add(token)
+        if self._token_filter_pending is not None:
+            self._token_filter_pending.append(token)
+
+    async def rebuild_token_filter(self, db: AsyncSession) -> None:
+        """
+        Build the valid-token Bloom filter from every share link.
+        지워진 링크의 토큰도 재생성 전까지는 필터에 남으므로 share_token_filter_rebuild_seconds마다 다시 만듭니다.
+        """
+        self._token_filter_pending = []
+        try:
+            result = await db.execute(select(ShareLink.id, ShareLink.token))
+            rows = result.all()
+            capacity = max(TOKEN_FILTER_MIN_CAPACITY, len(rows) * 2)
+            # 해시 계산은 CPU 작업: 이벤트 루프를 막지 않도록 스레드 풀에서
+            token_filter = await asyncio.get_running_loop().run_in_executor(
+                None, BloomFilter, capacity, 0.01, [row.token for row in rows]
+            )
+        finally:
+            pending, self._token_filter_pending = self._token_filter_pending, None
+        for token in pending:
+            token_filter.add(token)
+        self._token_filter = token_filter
+        self._token_filter_max_id = max((row.id for row in rows), default=0)
+        self._token_filter_built = self._token_filter_synced = time.monotonic()
+        logger.info(
+            "Share token filter built",
+            extra={"event": "share_token_filter", "tokens": len(rows), "bytes": (token_filter.size_bits + 7) // 8},
+        )
+
+    async def _sync_token_filter(self, db: AsyncSession) -> None:
+        """
+        Add tokens created by other workers (최근 ID 구간만 조회, filter_sync_seconds에 최대 1회).
+        필터가 오래됐거나 용량을 넘으면 다시 생성합니다.
+        """
+        if time.monotonic() - self._token_filter_synced < self.filter_sync_seconds:
+            return
+        async with self._token_filter_lock:
+            now = time.monotonic()
+            if now - self._token_filter_synced < self.filter_sync_seconds:
+                return
+            self._token_filter_synced = now
+            token_filter = self._token_filter
+            if (
+                now - self._token_filter_built >= self.filter_rebuild_seconds
+                or token_filter.count > token_filter.capacity
+            ):
+                await self.rebuild_token_filter(db)
+                return
+            result = await db.execute(
+                select(ShareLink.id, ShareLink.token)
+                .where(ShareLink.id > self._token_filter_max_id - TOKEN_FILTER_ID_LOOKBACK)
+                .order_by(ShareLink.id)
+            )
+            for row in result.all():
+                if row.token not in token_filter:
+                    token_filter.add(row.token)
+                self._token_filter_max_id = max(self._token_filter_max_id, row.id)
+
+    def remove_token(self, token: str) -> None:
+        """Forget a deleted token (필터에서는 뺄 수 없으므로 음성 캐시에 기록)."""
+        self._links.pop(token, None)
+        self._remember_missing(token)
+
+    def invalidate_link(self, token: str) -> None:
+        """Drop a token (비활성화·삭제 시)."""
+        self._links.pop(token, None)
+
+    def invalidate_album(self, album_id: int) -> None:
+        """Drop an album's membership and its links (사진 추가/제거, 앨범 삭제 시)."""
+        if album_id in self._loading:
+            self._loading[album_id] += 1
+        self._albums.pop(album_id, None)
+        for token in [token for token, (link, _) in self._links.items() if link.album_id == album_id]:
+            del self._links[token]
+
+    def invalidate_owner(self, owner_id: int) -> None:
+        """Drop every cached link and album of a user (계정 삭제 시)."""
+        for token, (link, _) in list(self._links.items()):
+            if link.owner_id == owner_id:
+                self.invalidate_album(link.album_id)
+
+    def revoke_shares(self, share_ids: Iterable[int]) -> None:
+        """Reject signed image URLs of these share links (비활성화·삭제, 앨범·계정 삭제 시)."""
+        self._revoke("share", share_ids)
+
+    def revoke_photos(self, photo_ids: Iterable[int]) -> None:
+        """Reject signed image URLs of these photos in every share (사진 삭제 시)."""
+        self._revoke("photo", photo_ids)
+
+    def is_revoked(self, share_id: int, photo_id: int) -> bool:
+        """Whether a signed image URL was revoked in this process."""
+        if not self._revoked:
+            return False
+        return ("share", share_id) in self._revoked or ("photo", photo_id) in self._revoked
+
+    def _revoke(self, kind: str, ids: Iterable[int]) -> None:
+        now = time.monotonic()
+        # 만료된 항목 정리 (폐기는 드물어 기록 시점에 한 번 훑어도 충분)
+        for key in [key for key, at in self._revoked.items() if now - at >= self.revoke_seconds]:
+            del self._revoked[key]
+        for id_ in ids:
+            self._revoked[(kind, id_)] = now
+
+
+_share_cache: Optional[ShareLinkCache] = None
+
+
+def get_share_cache() -> ShareLinkCache:
+    """Get the process-wide share link cache."""
+    global _share_cache
+    if _share_cache is None:
+        settings = get_settings()
+        _share_cache = ShareLinkCache(
+            max_links=settings.share_cache_max_links,
+            max_albums=settings.share_cache_max_albums,
+            ttl_seconds=settings.share_cache_ttl_seconds,
+            # 매니페스트의 서명 URL 대체 경로는 share_manifest_token_seconds까지 유효
+            revoke_seconds=max(
+                settings.share_image_url_ttl_seconds,
+                settings.share_manifest_token_seconds if settings.share_manifest_enabled else 0,
+            ),
+            negative_ttl_seconds=settings.share_negative_cache_seconds,
+            max_missing=settings.share_negative_cache_max_tokens,
+            filter_sync_seconds=settings.share_token_filter_sync_seconds,
+            filter_rebuild_seconds=settings.share_token_filter_rebuild_seconds,
+        )
+    return _share_cache
+
+
+async def build_share_token_filter() -> None:
+    """
+    Startup: 유효 토큰 Bloom filter 생성. 실패하면 필터 없이(모든 토큰 DB 확인) 동작합니다.
+    """
+    from app.database import async_session_maker
+
+    try:
+        async with async_session_maker() as session:
+            await get_share_cache().rebuild_token_filter(session)
+    except Exception as e:
+        logger.warning("Share token filter build failed: %s", e, exc_info=False)
@@ -0,0 +1,276 @@
+"""
+Static shared album manifests (CDN이 직접 제공하는 공유 앨범 JSON).
+
+publish_manifest 링크는 앨범 정보와 전체 사진 목록(사진별 CDN 토큰 URL)을 담은 매니페스트 JSON을
+Object Storage의 share/manifests/{token}.json에 기록합니다. 공유 페이지는 이 파일을 CDN에서 바로 읽으므로
+공개 조회 트래픽이 API를 거치지 않습니다.
+
+- 링크 생성 직후 백그라운드 작업으로 게시하고, 이후 share_manifest_loop가 다음 경우 다시 게시합니다.
+  - 앨범 version이 게시된 version과 다름 (앨범 정보·구성·포함 사진 변경)
+  - 매니페스트 속 CDN 토큰의 남은 시간이 share_manifest_token_seconds의 1/4 미만
+- 비활성화·만료·앨범/계정 삭제 요청된 링크는 {"status": "gone"} tombstone으로 덮어쓰고,
+  삭제된 링크의 매니페스트는 오브젝트를 지웁니다.
+- 반영 지연은 루프 주기(share_manifest_refresh_seconds) + CDN 캐시 TTL입니다.
+  CDN의 매니페스트 캐시 TTL은 토큰 유효 시간의 1/4보다 짧게 설정해야 합니다.
+"""
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+from urllib.parse import urlencode
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.album import Album, AlbumPhoto
+from app.models.photo import Photo
+from app.models.share import ShareLink
+from app.models.user import User
+from app.schemas.photo import PhotoWithUrl
+from app.schemas.share import ShareManifest
+from app.services.nhn_cdn import get_cdn_service
+from app.services.nhn_object_storage import get_storage_service
+from app.services.photo import PhotoService
+from app.utils.prometheus_metrics import share_manifest_publish_total
+from app.utils.security import sign_share_image
+
+logger = logging.getLogger("app.share_manifest")
+
+MANIFEST_PREFIX = "share/manifests"
+TOMBSTONE = json.dumps({"status": "gone"}).encode()
+# 매니페스트 생성 시 CDN 토큰 API 동시 호출 수
+CDN_TOKEN_CONCURRENCY = 8
+# 갱신 루프 한 번에 처리하는 링크 수
+REFRESH_BATCH_SIZE = 100
+
+
+def manifest_path(token: str) -> str:
+    """Object Storage path of a share link's manifest."""
+    return f"{MANIFEST_PREFIX}/{token}.json"
+
+
+def manifest_url(token: str) -> Optional[str]:
+    """Public (CDN) URL of a share link's manifest. 제공 경로가 설정되지 않았으면 None."""
+    settings = get_settings()
+    base = settings.share_manifest_base_url
+    if not base and settings.nhn_cdn_domain:
+        base = f"https://{settings.nhn_cdn_domain}/{settings.nhn_storage_container}"
+    if not base:
+        return None
+    return f"{base.rstrip('/')}/{manifest_path(token)}"
+
+
+class ShareManifestService:
+    """
+    Service for publishing and retiring static share manifests.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.storage = get_storage_service()
+        self.cdn = get_cdn_service()
+
+    async def publish(self, share_link: ShareLink, album: Album) -> None:
+        """
+        Write the manifest for an active link and record the published album version.
+
+        version을 사진보다 먼저 읽으므로, 읽는 사이 앨범이 바뀌면 다음 루프에서 다시 게시됩니다.
+        """
+        settings = get_settings()
+        version = album.version
+        result = await self.db.execute(
+            select(Photo)
+            .join(AlbumPhoto, AlbumPhoto.photo_id == Photo.id)
+            .where(AlbumPhoto.album_id == album.id)
+            .order_by(AlbumPhoto.order, AlbumPhoto.id)
+        )
+        photos = list(result.scalars().all())
+
+        now = datetime.utcnow()
+        token_seconds = settings.share_manifest_token_seconds
+        # CDN 토큰 캐시 적중 시 남은 시간이 절반까지 줄 수 있으므로 보장 가능한 하한만 기록
+        urls_expire_at = now + timedelta(seconds=token_seconds // 2)
+        if share_link.expires_at:
+            urls_expire_at = min(urls_expire_at, share_link.expires_at)
+        manifest = ShareManifest(
+            album_name=album.name,
+            album_description=album.description,
+            photo_count=len(photos),
+            photos=await self._photo_urls(share_link, photos, token_seconds),
+            created_at=album.created_at,
+            urls_expire_at=urls_expire_at,
+            generated_at=now,
+        )
+        await self.storage.upload_file(
+            file_content=manifest.model_dump_json().encode(),
+            object_name=manifest_path(share_link.token),
+            content_type="application/json",
+        )
+        share_link.manifest_version = version
+        share_link.manifest_expires_at = urls_expire_at
+        share_manifest_publish_total.labels(result="published").inc()
+
+    async def retire(self, share_link: ShareLink) -> None:
+        """Overwrite the manifest with a tombstone (비활성화·만료·삭제 요청)."""
+        await self.storage.upload_file(
+            file_content=TOMBSTONE,
+            object_name=manifest_path(share_link.token),
+            content_type="application/json",
+        )
+        share_link.manifest_version = None
+        share_link.manifest_expires_at = None
+        share_manifest_publish_total.labels(result="tombstoned").inc()
+
+    async def _photo_urls(
+        self,
+        share_link: ShareLink,
+        photos: List[Photo],
+        token_seconds: int,
+    ) -> List[PhotoWithUrl]:
+        """
+        사진별 CDN 토큰 URL. CDN 미설정·토큰 발급 실패 시 서명된 API 이미지 URL로 대체
+        (이 경우 이미지 요청은 API를 거치지만 DB 조회는 없음).
+        """
+        expires = int(time.time()) + token_seconds
+        semaphore = asyncio.Semaphore(CDN_TOKEN_CONCURRENCY)
+
+        async def _url(photo: Photo) -> str:
+            async with semaphore:
+                url = await self.cdn.generate_auth_token_url(photo.storage_path, expires_in=token_seconds)
+            if url:
+                return url
+            return f"/share/{share_link.token}/photos/{photo.id}/image?" + urlencode({
+                "sid": share_link.id,
+                "key": photo.storage_path,
+                "exp": expires,
+                "sig": sign_share_image(
+                    share_link.token, share_link.id, photo.id, photo.storage_path, expires
+                ),
+            })
+
+        urls = await asyncio.gather(*(_url(photo) for photo in photos))
+        return [PhotoService.build_photo_with_url(photo, url) for photo, url in zip(photos, urls)]
+
+
+async def publish_share_manifest(share_id: int) -> None:
+    """
+    Background task: 링크 생성 직후 매니페스트 게시 (실패하면 갱신 루프가 재시도).
+    """
+    from app.database import async_session_maker
+
+    try:
+        async with async_session_maker() as session:
+            share_link = await session.get(ShareLink, share_id)
+            if share_link is None or not share_link.is_valid:
+                return
+            album = await session.get(Album, share_link.album_id)
+            if album is None or album.deleted_at is not None:
+                return
+            await ShareManifestService(session).publish(share_link, album)
+            await session.commit()
+    except Exception as e:
+        share_manifest_publish_total.labels(result="failure").inc()
+        logger.warning("Share manifest publish failed: %s", e, exc_info=False)
+
+
+async def delete_share_manifest(token: str) -> None:
+    """Background task: 삭제된 링크의 매니페스트 오브젝트 삭제."""
+    try:
+        await get_storage_service().delete_file(manifest_path(token))
+    except Exception as e:
+        logger.warning("Share manifest delete failed: %s", e, exc_info=False)
+
+
+async def refresh_share_manifests() -> int:
+    """
+    Republish stale manifests and tombstone retired ones (링크마다 커밋).
+
+    Returns:
+        Number of manifests written
+    """
+    from app.database import async_session_maker
+
+    settings = get_settings()
+    now = datetime.utcnow()
+    refresh_before = now + timedelta(seconds=settings.share_manifest_token_seconds // 4)
+    live = and_(
+        ShareLink.is_active.is_(True),
+        or_(ShareLink.expires_at.is_(None), ShareLink.expires_at > now),
+        Album.deleted_at.is_(None),
+        User.deleted_at.is_(None),
+    )
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(ShareLink.id)
+            .join(Album, Album.id == ShareLink.album_id)
+            .join(User, User.id == Album.owner_id)
+            .where(
+                ShareLink.publish_manifest.is_(True),
+                or_(
+                    and_(
+                        live,
+                        or_(
+                            ShareLink.manifest_version.is_(None),
+                            ShareLink.manifest_version != Album.version,
+                            ShareLink.manifest_expires_at < refresh_before,
+                        ),
+                    ),
+                    and_(~live, ShareLink.manifest_version.is_not(None)),
+                ),
+            )
+            .order_by(ShareLink.id)
+            .limit(REFRESH_BATCH_SIZE)
+        )
+        share_ids = list(result.scalars().all())
+
+    written = 0
+    for share_id in share_ids:
+        try:
+            async with async_session_maker() as session:
+                share_link = await session.get(ShareLink, share_id)
+                if share_link is None:
+                    continue
+                album = await session.get(Album, share_link.album_id)
+                owner = await session.get(User, album.owner_id) if album else None
+                service = ShareManifestService(session)
+                if (
+                    share_link.is_valid
+                    and album is not None
+                    and album.deleted_at is None
+                    and owner is not None
+                    and owner.deleted_at is None
+                ):
+                    await service.publish(share_link, album)
+                elif share_link.manifest_version is not None:
+                    await service.retire(share_link)
+                else:
+                    continue
+                await session.commit()
+                written += 1
+        except Exception as e:
+            share_manifest_publish_total.labels(result="failure").inc()
+            logger.warning(
+                "Share manifest refresh failed: %s", e, exc_info=False,
+                extra={"event": "share_manifest", "share_id": share_id},
+            )
+    if written:
+        logger.info("Share manifests refreshed", extra={"event": "share_manifest", "written": written})
+    return written
+
+
+async def share_manifest_loop() -> None:
+    """
+    백그라운드 루프: share_manifest_refresh_seconds마다 매니페스트 갱신·tombstone 처리.
+    """
+    interval = get_settings().share_manifest_refresh_seconds
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_share_manifests()
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning("Share manifest loop failed: %s", e, exc_info=False)
@@ -0,0 +1,145 @@
+"""
+Serialized shared-album response cache (공유 앨범 응답 JSON 바이트 캐시).
+
+인기 공유 링크는 조회마다 같은 사진 목록을 읽어 PhotoWithUrl을 만들고 같은 JSON을 다시 직렬화합니다.
+앨범에 version 카운터를 두고(앨범 정보·구성·포함 사진 변경 시 증가), 직렬화된 응답 바이트를
+(token, album version) 키로 캐시해 적중 시 딕셔너리 조회만으로 응답합니다.
+응답 ETag도 album version에서 만들어지므로 재검증(If-None-Match)은 본문 없이 처리됩니다.
+
+- 앨범 version은 프로세스 메모리에 share_cache_ttl_seconds 동안 보관합니다. 같은 프로세스의 변경은
+  bump_album_versions에서 즉시 반영되고, 다른 워커의 변경은 TTL 이내에 반영됩니다.
+- 응답 캐시는 바이트 합계(shared_album_cache_max_bytes) 기준 LRU입니다.
+"""
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.album import Album, AlbumPhoto
+from app.utils.prometheus_metrics import share_cache_requests_total
+
+
+class SharedAlbumCache:
+    """Album versions with TTL and serialized responses with a byte budget."""
+
+    def __init__(self, max_bytes: int, max_albums: int, ttl_seconds: int):
+        self.max_bytes = max_bytes
+        self.max_albums = max_albums
+        self.ttl_seconds = ttl_seconds
+        self._versions: "OrderedDict[int, Tuple[int, float]]" = OrderedDict()
+        # (token, version) -> (album_id, url_expiry, body)
+        self._responses: "OrderedDict[Tuple[str, int], Tuple[int, int, bytes]]" = OrderedDict()
+        self._bytes = 0
+
+    async def get_album_version(self, db: AsyncSession, album_id: int) -> Optional[int]:
+        """Current album version (TTL 이내면 메모리, 아니면 기본 키 조회 1회). 앨범이 없으면 None."""
+        entry = self._versions.get(album_id)
+        if entry and time.monotonic() - entry[1] < self.ttl_seconds:
+            self._versions.move_to_end(album_id)
+            return entry[0]
+        result = await db.execute(
+            select(Album.version).where(Album.id == album_id, Album.deleted_at.is_(None))
+        )
+        version = result.scalar_one_or_none()
+        if version is None:
+            self._versions.pop(album_id, None)
+            return None
+        self._versions[album_id] = (version, time.monotonic())
+        self._versions.move_to_end(album_id)
+        while len(self._versions) > self.max_albums:
+            self._versions.popitem(last=False)
+        return version
+
+    def get(self, token: str, version: int, url_expiry: int) -> Optional[bytes]:
+        """
+        Cached response body.
+        응답 속 서명 URL의 만료 시각(url_expiry)이 다르면 오래된 응답이므로 버리고 None.
+        """
+        key = (token, version)
+        entry = self._responses.get(key)
+        if entry is not None and entry[1] != url_expiry:
+            self._bytes -= len(self._responses.pop(key)[2])
+            entry = None
+        if entry is None:
+            share_cache_requests_total.labels(cache="response", result="miss").inc()
+            return None
+        self._responses.move_to_end(key)
+        share_cache_requests_total.labels(cache="response", result="hit").inc()
+        return entry[2]
+
+    def put(self, token: str, album_id: int, version: int, url_expiry: int, body: bytes) -> None:
+        """Store a serialized response. 예산보다 큰 응답은 저장하지 않음."""
+        if len(body) > self.max_bytes:
+            return
+        key = (token, version)
+        previous = self._responses.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous[2])
+        self._responses[key] = (album_id, url_expiry, body)
+        self._bytes += len(body)
+        while self._bytes > self.max_bytes:
+            _, (_, _, evicted) = self._responses.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def invalidate_albums(self, album_ids: Iterable[int]) -> None:
+        """Forget versions and cached responses of changed albums."""
+        album_ids = set(album_ids)
+        for album_id in album_ids:
+            self._versions.pop(album_id, None)
+        for key in [key for key, entry in self._responses.items() if entry[0] in album_ids]:
+            self._bytes -= len(self._responses.pop(key)[2])
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 (여러 값·`*`·약한 비교 `W/` 허용)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+async def bump_album_versions(db: AsyncSession, album_ids: Iterable[int]) -> None:
+    """Increment Album.version (공유 응답 캐시 무효화). 앨범 정보·구성 변경과 같은 트랜잭션에서 호출."""
+    album_ids = list(set(album_ids))
+    if not album_ids:
+        return
+    await db.execute(
+        update(Album)
+        .where(Album.id.in_(album_ids))
+        .values(version=Album.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    get_shared_album_cache().invalidate_albums(album_ids)
+
+
+async def bump_photo_album_versions(db: AsyncSession, photo_ids: Iterable[int]) -> None:
+    """Increment the version of every album containing any of the photos (사진 수정·삭제 시)."""
+    photo_ids = list(photo_ids)
+    if not photo_ids:
+        return
+    result = await db.execute(
+        select(AlbumPhoto.album_id).where(AlbumPhoto.photo_id.in_(photo_ids)).distinct()
+    )
+    await bump_album_versions(db, result.scalars().all())
+
+
+_shared_album_cache: Optional[SharedAlbumCache] = None
+
+
+def get_shared_album_cache() -> SharedAlbumCache:
+    """Get the process-wide shared album response cache."""
+    global _shared_album_cache
+    if _shared_album_cache is None:
+        settings = get_settings()
+        _shared_album_cache = SharedAlbumCache(
+            max_bytes=settings.shared_album_cache_max_bytes,
+            max_albums=settings.share_cache_max_albums,
+            ttl_seconds=settings.share_cache_ttl_seconds,
+        )
+    return _shared_album_cache
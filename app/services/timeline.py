@@ -0,0 +1,101 @@
+"""
+Photo timeline service (일/월 단위 사진 수).
+
+photo_timeline_buckets 롤업을 사진 업로드/삭제와 같은 트랜잭션에서 증분 갱신하고,
+조회는 롤업 행만 읽습니다. 월 단위는 일 버킷을 합산합니다 (사용자당 행 수 = 사진이 있는 날 수).
+"""
+from collections import Counter
+from datetime import date, datetime
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.photo_timeline import PhotoTimelineBucket
+from app.utils.sql import upsert_increment
+
+GRANULARITY_DAY = "day"
+GRANULARITY_MONTH = "month"
+
+
+class TimelineService:
+    """
+    Service for maintaining and reading the photo timeline rollup.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def add(self, owner_id: int, created_ats: Iterable[datetime]) -> None:
+        """Count new photos (created_at 날짜별로 +1)."""
+        counts = Counter(created_at.date() for created_at in created_ats)
+        await upsert_increment(
+            self.db,
+            PhotoTimelineBucket.__table__,
+            ("owner_id", "bucket"),
+            ("photo_count",),
+            [{"owner_id": owner_id, "bucket": bucket, "photo_count": n} for bucket, n in counts.items()],
+        )
+
+    async def remove(self, owner_id: int, created_ats: Iterable[datetime]) -> None:
+        """Uncount deleted photos. 0이 된 버킷은 삭제."""
+        counts = Counter(created_at.date() for created_at in created_ats)
+        if not counts:
+            return
+        for bucket, n in sorted(counts.items()):
+            await self.db.execute(
+                update(PhotoTimelineBucket)
+                .where(PhotoTimelineBucket.owner_id == owner_id, PhotoTimelineBucket.bucket == bucket)
+                .values(photo_count=PhotoTimelineBucket.photo_count - n)
+                .execution_options(synchronize_session=False)
+            )
+        await self.db.execute(
+            delete(PhotoTimelineBucket)
+            .where(
+                PhotoTimelineBucket.owner_id == owner_id,
+                PhotoTimelineBucket.bucket.in_(list(counts)),
+                PhotoTimelineBucket.photo_count <= 0,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_timeline(
+        self,
+        user_id: int,
+        granularity: str = GRANULARITY_MONTH,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> List[Tuple[date, int]]:
+        """
+        Photo counts per bucket, newest first.
+
+        Args:
+            user_id: Owner user ID
+            granularity: "day" or "month" (월 버킷은 해당 월 1일로 표시)
+            start: First day to include (inclusive)
+            end: Last day to include (inclusive)
+
+        Returns:
+            (bucket, count) pairs
+        """
+        query = select(PhotoTimelineBucket.bucket, PhotoTimelineBucket.photo_count).where(
+            PhotoTimelineBucket.owner_id == user_id,
+            PhotoTimelineBucket.photo_count > 0,
+        )
+        if start:
+            query = query.where(PhotoTimelineBucket.bucket >= start)
+        if end:
+            query = query.where(PhotoTimelineBucket.bucket <= end)
+        result = await self.db.execute(query.order_by(PhotoTimelineBucket.bucket.desc()))
+        rows = [(row.bucket, row.photo_count) for row in result.all()]
+        if granularity == GRANULARITY_DAY:
+            return rows
+
+        months: List[Tuple[date, int]] = []
+        for bucket, count in rows:
+            month = bucket.replace(day=1)
+            if months and months[-1][0] == month:
+                months[-1] = (month, months[-1][1] + count)
+            else:
+                months.append((month, count))
+        return months
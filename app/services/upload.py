@@ -0,0 +1,196 @@
+"""
+Resumable upload service (tus 방식: 생성 → 오프셋 지정 PATCH 반복 → 완료).
+
+청크는 받는 즉시 Object Storage 세그먼트 오브젝트로 저장하고 진행 상태는 upload_sessions에 기록하므로,
+연결이 끊겨도 클라이언트는 HEAD로 현재 오프셋을 확인하고 남은 바이트만 다시 보내면 됩니다.
+완료 시 세그먼트를 순서대로 이어 붙여 기존 PhotoService.upload_photo 경로로 Photo를 생성합니다.
+"""
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.photo import Photo
+from app.models.upload_session import UploadSession
+from app.models.user import User
+from app.services.nhn_object_storage import get_storage_service
+from app.services.photo import PhotoService
+
+logger = logging.getLogger("app.upload")
+
+SEGMENT_PREFIX = "photo/photo/upload"
+
+
+class UploadOffsetConflict(ValueError):
+    """Raised when a chunk does not start at the session's current offset."""
+
+    def __init__(self, current_offset: int):
+        super().__init__(f"Upload offset mismatch. Current offset: {current_offset}")
+        self.current_offset = current_offset
+
+
+class UploadService:
+    """
+    Service for resumable chunked uploads.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.storage = get_storage_service()
+
+    async def create_session(
+        self,
+        user: User,
+        album_id: int,
+        filename: str,
+        content_type: str,
+        total_size: int,
+    ) -> UploadSession:
+        """Create a new upload session (bytes are sent later with append_chunk)."""
+        session_id = uuid.uuid4().hex
+        upload = UploadSession(
+            id=session_id,
+            owner_id=user.id,
+            album_id=album_id,
+            filename=filename,
+            content_type=content_type,
+            total_size=total_size,
+            offset=0,
+            segment_count=0,
+            segment_prefix=f"{SEGMENT_PREFIX}/{session_id}",
+            expires_at=datetime.utcnow() + timedelta(seconds=get_settings().upload_session_ttl_seconds),
+        )
+        self.db.add(upload)
+        await self.db.flush()
+        return upload
+
+    async def get_session(self, session_id: str, user_id: int) -> Optional[UploadSession]:
+        """Get an unexpired upload session owned by the user."""
+        result = await self.db.execute(
+            select(UploadSession).where(
+                UploadSession.id == session_id,
+                UploadSession.owner_id == user_id,
+                UploadSession.expires_at > datetime.utcnow(),
+            )
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def segment_names(upload: UploadSession) -> List[str]:
+        """Object names of the stored segments, in byte order."""
+        return [f"{upload.segment_prefix}/{index:06d}" for index in range(upload.segment_count)]
+
+    async def append_chunk(self, upload: UploadSession, offset: int, chunk: bytes) -> int:
+        """
+        Store one chunk as the next segment and advance the offset.
+
+        오프셋 확보(조건부 UPDATE)를 먼저 하므로 같은 오프셋의 동시 PATCH는 하나만 성공하고
+        나머지는 커밋까지 대기 후 UploadOffsetConflict가 됩니다. 세그먼트 저장 실패 시 예외가 전파되어
+        트랜잭션이 롤백되고 오프셋은 그대로 남습니다 (같은 오프셋으로 재시도 가능).
+
+        Returns:
+            New offset
+        """
+        if offset != upload.offset:
+            raise UploadOffsetConflict(upload.offset)
+        if not chunk:
+            raise ValueError("Empty chunk")
+        if offset + len(chunk) > upload.total_size:
+            raise ValueError("Chunk exceeds declared upload length")
+
+        segment_index = upload.segment_count
+        result = await self.db.execute(
+            update(UploadSession)
+            .where(UploadSession.id == upload.id, UploadSession.offset == offset)
+            .values(
+                offset=UploadSession.offset + len(chunk),
+                segment_count=UploadSession.segment_count + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            await self.db.refresh(upload)
+            raise UploadOffsetConflict(upload.offset)
+
+        await self.storage.upload_file(
+            file_content=chunk,
+            object_name=f"{upload.segment_prefix}/{segment_index:06d}",
+            content_type="application/octet-stream",
+        )
+        upload.offset = offset + len(chunk)
+        upload.segment_count = segment_index + 1
+        return upload.offset
+
+    async def complete(self, upload: UploadSession, user: User) -> Tuple[Photo, List[str]]:
+        """
+        Assemble the segments and create the Photo through PhotoService.upload_photo.
+
+        세그먼트는 storage_upload_concurrency만큼 병렬로 내려받아 순서대로 이어 붙입니다.
+        세션 행은 삭제되며, 세그먼트 오브젝트는 커밋 후 호출자가 정리합니다.
+
+        Returns:
+            (created Photo, segment object names to delete)
+        """
+        if not upload.is_complete:
+            raise ValueError(f"Upload incomplete: {upload.offset}/{upload.total_size} bytes received")
+
+        segments = self.segment_names(upload)
+        semaphore = asyncio.Semaphore(get_settings().storage_upload_concurrency)
+
+        async def _download(name: str) -> bytes:
+            async with semaphore:
+                return await self.storage.download_file(name)
+
+        try:
+            parts = await asyncio.gather(*(_download(name) for name in segments))
+        except Exception as e:
+            logger.error(
+                "Upload segments download failed",
+                exc_info=e,
+                extra={"event": "photo_upload_resumable", "upload_id": upload.id, "user_id": user.id},
+            )
+            raise ValueError("업로드 조각을 읽지 못했습니다. 잠시 후 다시 시도해주세요.")
+        content = b"".join(parts)
+        if len(content) != upload.total_size:
+            raise ValueError("Assembled upload size does not match declared length")
+
+        photo = await PhotoService(self.db).upload_photo(
+            user=user,
+            album_id=upload.album_id,
+            file_content=content,
+            filename=upload.filename,
+            content_type=upload.content_type,
+        )
+        await self.db.execute(delete(UploadSession).where(UploadSession.id == upload.id))
+        return photo, segments
+
+    async def cancel(self, upload: UploadSession) -> List[str]:
+        """Delete the session. Returns segment object names to delete after commit."""
+        segments = self.segment_names(upload)
+        await self.db.execute(delete(UploadSession).where(UploadSession.id == upload.id))
+        return segments
+
+    async def purge_expired(self, limit: int = 500) -> List[str]:
+        """
+        Delete expired sessions (최대 limit개).
+
+        Returns:
+            Segment object names to delete after commit
+        """
+        result = await self.db.execute(
+            select(UploadSession)
+            .where(UploadSession.expires_at <= datetime.utcnow())
+            .limit(limit)
+        )
+        expired = list(result.scalars().all())
+        if not expired:
+            return []
+        await self.db.execute(
+            delete(UploadSession).where(UploadSession.id.in_([upload.id for upload in expired]))
+        )
+        return [name for upload in expired for name in self.segment_names(upload)]
@@ -0,0 +1,195 @@
+"""
+Per-user usage counters and quota checks.
+
+user_usage 행을 사진 업로드/삭제, 앨범 생성/삭제와 같은 트랜잭션에서 증분 갱신합니다
+(INSERT ... ON CONFLICT DO UPDATE 한 문장, 동시 업로드에도 유실 없음).
+한도 확인은 사용자 행 1개를 기본 키로 읽는 O(1) 조회이며, 비즈니스 메트릭도 photos 전체
+GROUP BY 대신 이 테이블을 읽습니다.
+카운터가 어긋날 수 있는 경로(수동 DB 작업, 트랜잭션 외 실패)는 reconcile_usage가 주기적으로 바로잡습니다.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.album import Album
+from app.models.photo import Photo
+from app.models.stored_object import StoredObject
+from app.models.user import User
+from app.models.user_usage import UserUsage
+from app.utils.prometheus_metrics import object_storage_container_bytes, usage_counter_drift_total
+from app.utils.sql import upsert_increment
+
+logger = logging.getLogger("app.usage")
+
+USAGE_COLUMNS = ("photo_count", "album_count", "bytes_used")
+
+
+class QuotaExceededError(ValueError):
+    """Raised when an upload would exceed the user's quota."""
+
+
+class UsageService:
+    """
+    Service for per-user usage counters.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def apply(self, user_id: int, photos: int = 0, albums: int = 0, bytes_used: int = 0) -> None:
+        """Add deltas to the user's counters (삭제는 음수)."""
+        if not (photos or albums or bytes_used):
+            return
+        await upsert_increment(
+            self.db,
+            UserUsage.__table__,
+            ("user_id",),
+            USAGE_COLUMNS,
+            [{"user_id": user_id, "photo_count": photos, "album_count": albums, "bytes_used": bytes_used}],
+        )
+
+    async def get_usage(self, user_id: int) -> Dict[str, int]:
+        """Current counters (행이 없으면 0)."""
+        result = await self.db.execute(
+            select(UserUsage.photo_count, UserUsage.album_count, UserUsage.bytes_used)
+            .where(UserUsage.user_id == user_id)
+        )
+        row = result.first()
+        if row is None:
+            return {"photo_count": 0, "album_count": 0, "bytes_used": 0}
+        return {"photo_count": row.photo_count, "album_count": row.album_count, "bytes_used": row.bytes_used}
+
+    async def check_quota(self, user_id: int, photos: int = 1, bytes_used: int = 0) -> None:
+        """
+        Check that adding `photos` photos totalling `bytes_used` bytes stays within the quota.
+
+        한도 확인과 카운터 증가가 한 문장이 아니므로 동시 업로드 시 요청 1개 분량만큼 초과될 수 있습니다.
+
+        Raises:
+            QuotaExceededError: If the quota would be exceeded
+        """
+        settings = get_settings()
+        if not settings.user_quota_bytes and not settings.user_quota_photos:
+            return
+        usage = await self.get_usage(user_id)
+        if settings.user_quota_bytes and usage["bytes_used"] + bytes_used > settings.user_quota_bytes:
+            raise QuotaExceededError(
+                f"Storage quota exceeded: {usage['bytes_used']} of {settings.user_quota_bytes} bytes used"
+            )
+        if settings.user_quota_photos and usage["photo_count"] + photos > settings.user_quota_photos:
+            raise QuotaExceededError(
+                f"Photo quota exceeded: {usage['photo_count']} of {settings.user_quota_photos} photos used"
+            )
+
+    async def reconcile(self, user_id: int) -> bool:
+        """
+        Recompute one user's counters from photos/albums and fix drift.
+
+        사용량 행을 먼저 잠가(SELECT ... FOR UPDATE) 집계 중 커밋되는 업로드/삭제의 증분 갱신이
+        재집계 결과와 겹치거나 유실되지 않게 합니다.
+
+        Returns:
+            True if the stored counters were corrected
+        """
+        result = await self.db.execute(
+            select(UserUsage.photo_count, UserUsage.album_count, UserUsage.bytes_used)
+            .where(UserUsage.user_id == user_id)
+            .with_for_update()
+        )
+        current = result.first()
+
+        photo_count, bytes_used = (
+            await self.db.execute(
+                select(func.count(Photo.id), func.coalesce(func.sum(Photo.file_size), 0))
+                .where(Photo.owner_id == user_id)
+            )
+        ).one()
+        album_count = (
+            await self.db.execute(
+                select(func.count(Album.id)).where(Album.owner_id == user_id, Album.deleted_at.is_(None))
+            )
+        ).scalar_one()
+        actual = {"photo_count": photo_count, "album_count": album_count, "bytes_used": int(bytes_used)}
+
+        if current is None:
+            await self.apply(user_id, photos=photo_count, albums=album_count, bytes_used=actual["bytes_used"])
+            return any(actual.values())
+
+        await self.db.execute(
+            update(UserUsage)
+            .where(UserUsage.user_id == user_id)
+            .values(**actual, reconciled_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        return any(getattr(current, name) != actual[name] for name in USAGE_COLUMNS)
+
+
+async def reconcile_usage(batch_size: int = 200) -> None:
+    """
+    Recompute every user's counters. 사용자별로 커밋해 잠금 시간을 짧게 유지합니다.
+
+    Swift 컨테이너 통계(X-Container-Bytes-Used)를 함께 조회해 stored_objects 합계와 비교합니다
+    (차이가 크면 고아 오브젝트나 누락된 참조 정리가 필요하다는 신호).
+    """
+    from app.database import async_session_maker
+    from app.services.nhn_object_storage import get_storage_service
+
+    corrected = 0
+    last_id = 0
+    while True:
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(User.id)
+                .where(User.id > last_id, User.deleted_at.is_(None))
+                .order_by(User.id)
+                .limit(batch_size)
+            )
+            user_ids = list(result.scalars().all())
+            if not user_ids:
+                break
+            service = UsageService(session)
+            for user_id in user_ids:
+                corrected += await service.reconcile(user_id)
+                await session.commit()
+        last_id = user_ids[-1]
+    if corrected:
+        usage_counter_drift_total.inc(corrected)
+        logger.warning("Usage counters corrected", extra={"event": "usage_reconcile", "users": corrected})
+
+    stats = await get_storage_service().get_container_stats()
+    if stats is None:
+        return
+    object_storage_container_bytes.set(stats["bytes_used"])
+    async with async_session_maker() as session:
+        stored_bytes = (
+            await session.execute(select(func.coalesce(func.sum(StoredObject.file_size), 0)))
+        ).scalar_one()
+    logger.info(
+        "Usage reconciled",
+        extra={
+            "event": "usage_reconcile",
+            "container_bytes": stats["bytes_used"],
+            "container_objects": stats["object_count"],
+            "stored_object_bytes": int(stored_bytes),
+        },
+    )
+
+
+async def usage_reconcile_loop() -> None:
+    """
+    백그라운드 루프: usage_reconcile_interval_seconds마다 사용량 카운터 재집계.
+    """
+    interval = get_settings().usage_reconcile_interval_seconds
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await reconcile_usage()
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning("Usage reconcile failed: %s", e, exc_info=False)
@@ -0,0 +1,133 @@
+"""
+Write-behind share link view counter (공유 링크 조회수 버퍼링).
+
+조회마다 share_links 행을 갱신하면 인기 링크 하나의 행에 쓰기가 몰려 잠금 경합이 생깁니다.
+조회는 프로세스 메모리의 카운터만 올리고(공유 조회 요청은 읽기 전용 트랜잭션),
+share_view_flush_seconds마다 링크별 `view_count = view_count + :delta` UPDATE와
+일별 버킷(share_link_daily_views) upsert를 한 트랜잭션으로 반영합니다.
+
+- 종료 시(lifespan shutdown) 남은 카운트를 마지막으로 반영합니다.
+- 반영에 실패하면 카운트를 다시 버퍼에 합쳐 다음 주기에 재시도합니다.
+- 프로세스가 비정상 종료되면 마지막 주기 이후의 조회수는 유실될 수 있습니다 (최대 flush 주기만큼).
+"""
+import asyncio
+import logging
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import bindparam, select, update
+
+from app.config import get_settings
+from app.models.share import ShareLink
+from app.models.share_view import ShareLinkDailyView
+from app.utils.prometheus_metrics import share_view_flush_total
+from app.utils.sql import upsert_increment
+
+logger = logging.getLogger("app.share_views")
+
+
+class ShareViewCounter:
+    """In-memory view deltas per share link and per (share link, day)."""
+
+    def __init__(self):
+        self._totals: Dict[int, int] = Counter()
+        self._daily: Dict[Tuple[int, date], int] = Counter()
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Views not yet written to the database."""
+        return sum(self._totals.values())
+
+    def record(self, share_id: int) -> None:
+        """Count one view (메모리만 갱신, DB 쓰기 없음)."""
+        self._totals[share_id] += 1
+        self._daily[(share_id, datetime.utcnow().date())] += 1
+
+    async def flush(self) -> int:
+        """
+        Write buffered views to the database.
+
+        Returns:
+            Number of views written
+        """
+        from app.database import async_session_maker
+
+        async with self._flush_lock:
+            # 버퍼 교체는 await 없이 수행되므로 반영 중 들어온 조회는 새 버퍼에 쌓임
+            totals, self._totals = self._totals, Counter()
+            daily, self._daily = self._daily, Counter()
+            if not totals:
+                return 0
+            try:
+                async with async_session_maker() as session:
+                    # 반영 전에 삭제된 링크는 제외 (일별 버킷 FK 위반 방지)
+                    result = await session.execute(
+                        select(ShareLink.id).where(ShareLink.id.in_(list(totals)))
+                    )
+                    existing = set(result.scalars().all())
+                    table = ShareLink.__table__
+                    if existing:
+                        # 링크 ID 순으로 갱신해 잠금 순서 고정
+                        await session.execute(
+                            update(table)
+                            .where(table.c.id == bindparam("share_id"))
+                            .values(view_count=table.c.view_count + bindparam("delta")),
+                            [
+                                {"share_id": share_id, "delta": totals[share_id]}
+                                for share_id in sorted(existing)
+                            ],
+                        )
+                    await upsert_increment(
+                        session,
+                        ShareLinkDailyView.__table__,
+                        ("share_link_id", "day"),
+                        ("view_count",),
+                        [
+                            {"share_link_id": share_id, "day": day, "view_count": count}
+                            for (share_id, day), count in daily.items()
+                            if share_id in existing
+                        ],
+                    )
+                    await session.commit()
+            except Exception as e:
+                self._totals.update(totals)
+                self._daily.update(daily)
+                share_view_flush_total.labels(result="failure").inc()
+                logger.warning("Share view flush failed: %s", e, exc_info=False)
+                return 0
+            written = sum(totals[share_id] for share_id in existing)
+            share_view_flush_total.labels(result="success").inc()
+            logger.debug(
+                "Share views flushed",
+                extra={"event": "share_views", "links": len(existing), "views": written},
+            )
+            return written
+
+
+_view_counter: Optional[ShareViewCounter] = None
+
+
+def get_view_counter() -> ShareViewCounter:
+    """Get the process-wide share view counter."""
+    global _view_counter
+    if _view_counter is None:
+        _view_counter = ShareViewCounter()
+    return _view_counter
+
+
+async def view_counter_flush_loop() -> None:
+    """
+    백그라운드 루프: share_view_flush_seconds마다 버퍼된 조회수 반영.
+    """
+    interval = get_settings().share_view_flush_seconds
+    counter = get_view_counter()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await counter.flush()
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning("Share view flush loop failed: %s", e, exc_info=False)
@@ -0,0 +1,41 @@
+"""
+Bloom filter for string keys (공유 토큰 존재 여부 사전 확인용).
+
+"없음"은 확실하고 "있음"은 오탐률(error_rate)만큼 틀릴 수 있습니다. 삭제는 지원하지 않으므로
+지워진 키는 다시 만들 때까지 "있음"으로 남습니다 (이후 DB 확인에서 걸러짐).
+비트 배열은 bytearray 하나이며 항목당 약 -log2(error_rate) / ln 2 비트 (1%에서 약 9.6비트)를 씁니다.
+"""
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter with double hashing over one blake2b digest."""
+
+    __slots__ = ("capacity", "size_bits", "hash_count", "count", "_bits")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01, items: Iterable[str] = ()):
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.size_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size_bits + 7) // 8)
+        for item in items:
+            self.add(item)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
@@ -0,0 +1,221 @@
+"""
+이미지 헤더 메타데이터 추출 유틸리티.
+
+픽셀 데이터를 디코딩하지 않고 파일 앞부분(헤더)만 읽어 다음 값을 추출합니다.
+- width / height: JPEG SOF, PNG IHDR, GIF 화면 기술자, WebP VP8/VP8L/VP8X, HEIF ispe
+- orientation / taken_at / camera: JPEG·WebP의 EXIF (TIFF IFD0 + Exif IFD)
+
+순수 파이썬 구현이며 외부 의존성이 없습니다. 업로드 경로에서는 스레드 풀에서 호출합니다.
+"""
+import struct
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+# 메타데이터 추출 시 읽는 최대 바이트 수 (EXIF APP1 최대 64KB + SOF 여유)
+HEADER_BYTES = 256 * 1024
+
+# EXIF 태그
+_TAG_MAKE = 0x010F
+_TAG_MODEL = 0x0110
+_TAG_ORIENTATION = 0x0112
+_TAG_DATETIME = 0x0132
+_TAG_EXIF_IFD = 0x8769
+_TAG_DATETIME_ORIGINAL = 0x9003
+
+# TIFF 필드 타입별 바이트 크기
+_TIFF_TYPE_SIZES = {1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 7: 1, 9: 4, 10: 8}
+
+# JPEG SOF 마커 (DHT=C4, JPG=C8, DAC=CC 제외)
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+@dataclass
+class ImageMetadata:
+    """Metadata extracted from image headers. Unknown fields stay None."""
+
+    width: Optional[int] = None
+    height: Optional[int] = None
+    orientation: Optional[int] = None
+    taken_at: Optional[datetime] = None
+    camera: Optional[str] = None
+
+
+def extract_image_metadata(header: bytes) -> ImageMetadata:
+    """
+    Extract dimensions and EXIF fields from the leading bytes of an image.
+
+    Args:
+        header: First bytes of the file (``HEADER_BYTES`` is enough for common files)
+
+    Returns:
+        ImageMetadata (fields that cannot be determined are None)
+    """
+    meta = ImageMetadata()
+    try:
+        if header.startswith(b"\xff\xd8"):
+            _parse_jpeg(header, meta)
+        elif header.startswith(b"\x89PNG\r\n\x1a\n"):
+            meta.width, meta.height = struct.unpack(">II", header[16:24])
+        elif header[:6] in (b"GIF87a", b"GIF89a"):
+            meta.width, meta.height = struct.unpack("<HH", header[6:10])
+        elif header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+            _parse_webp(header, meta)
+        elif header[4:8] == b"ftyp":
+            _parse_heif(header, meta)
+    except (struct.error, IndexError, ValueError):
+        # 헤더가 잘렸거나 손상된 경우: 그때까지 얻은 값만 사용
+        pass
+    return meta
+
+
+def _parse_jpeg(data: bytes, meta: ImageMetadata) -> None:
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return
+        marker = data[pos + 1]
+        if marker == 0xFF:  # fill byte
+            pos += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # 길이 없는 마커
+            pos += 2
+            continue
+        if marker in (0xD9, 0xDA):  # EOI / SOS: 이후는 압축 데이터
+            return
+        (length,) = struct.unpack(">H", data[pos + 2:pos + 4])
+        segment = data[pos + 4:pos + 2 + length]
+        if marker == 0xE1 and segment.startswith(b"Exif\x00\x00"):
+            _parse_exif(segment[6:], meta)
+        elif marker in _JPEG_SOF_MARKERS:
+            meta.height, meta.width = struct.unpack(">HH", segment[1:5])
+            return
+        pos += 2 + length
+
+
+def _parse_webp(data: bytes, meta: ImageMetadata) -> None:
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_type = data[pos:pos + 4]
+        (size,) = struct.unpack("<I", data[pos + 4:pos + 8])
+        body = data[pos + 8:pos + 8 + size]
+        if chunk_type == b"VP8X":
+            meta.width = 1 + int.from_bytes(body[4:7], "little")
+            meta.height = 1 + int.from_bytes(body[7:10], "little")
+        elif chunk_type == b"VP8 " and meta.width is None:
+            meta.width = struct.unpack("<H", body[6:8])[0] & 0x3FFF
+            meta.height = struct.unpack("<H", body[8:10])[0] & 0x3FFF
+        elif chunk_type == b"VP8L" and meta.width is None:
+            (bits,) = struct.unpack("<I", body[1:5])
+            meta.width = (bits & 0x3FFF) + 1
+            meta.height = ((bits >> 14) & 0x3FFF) + 1
+        elif chunk_type == b"EXIF":
+            _parse_exif(body[6:] if body.startswith(b"Exif\x00\x00") else body, meta)
+        pos += 8 + size + (size & 1)  # 청크는 짝수 바이트 정렬
+
+
+def _iter_boxes(data: bytes, start: int, end: int):
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = struct.unpack(">I4s", data[pos:pos + 8])
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack(">Q", data[pos + 8:pos + 16])
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield box_type, pos + header, min(pos + size, end)
+        pos += size
+
+
+def _parse_heif(data: bytes, meta: ImageMetadata) -> None:
+    """HEIF/HEIC: meta > iprp > ipco > ispe (첫 번째 이미지 속성)에서 크기를 읽음."""
+    for box_type, start, end in _iter_boxes(data, 0, len(data)):
+        if box_type != b"meta":
+            continue
+        for child, c_start, c_end in _iter_boxes(data, start + 4, end):  # meta는 full box
+            if child != b"iprp":
+                continue
+            for prop, p_start, p_end in _iter_boxes(data, c_start, c_end):
+                if prop != b"ipco":
+                    continue
+                for item, i_start, _ in _iter_boxes(data, p_start, p_end):
+                    if item == b"ispe":
+                        meta.width, meta.height = struct.unpack(">II", data[i_start + 4:i_start + 12])
+                        return
+        return
+
+
+def _read_ifd(tiff: bytes, offset: int, endian: str) -> Dict[int, Tuple[int, int, bytes]]:
+    """IFD 엔트리를 {tag: (type, count, raw_value_bytes)} 형태로 반환."""
+    entries: Dict[int, Tuple[int, int, bytes]] = {}
+    (count,) = struct.unpack(endian + "H", tiff[offset:offset + 2])
+    for i in range(count):
+        entry = offset + 2 + i * 12
+        tag, field_type, value_count = struct.unpack(endian + "HHI", tiff[entry:entry + 8])
+        size = _TIFF_TYPE_SIZES.get(field_type, 1) * value_count
+        if size <= 4:
+            raw = tiff[entry + 8:entry + 8 + size]
+        else:
+            (value_offset,) = struct.unpack(endian + "I", tiff[entry + 8:entry + 12])
+            raw = tiff[value_offset:value_offset + size]
+        entries[tag] = (field_type, value_count, raw)
+    return entries
+
+
+def _ifd_ascii(entries: Dict[int, Tuple[int, int, bytes]], tag: int) -> Optional[str]:
+    if tag not in entries:
+        return None
+    value = entries[tag][2].split(b"\x00", 1)[0].decode("utf-8", errors="replace").strip()
+    return value or None
+
+
+def _ifd_int(entries: Dict[int, Tuple[int, int, bytes]], tag: int, endian: str) -> Optional[int]:
+    if tag not in entries:
+        return None
+    field_type, _, raw = entries[tag]
+    if field_type == 3:
+        return struct.unpack(endian + "H", raw[:2])[0]
+    if field_type == 4:
+        return struct.unpack(endian + "I", raw[:4])[0]
+    return None
+
+
+def _parse_exif_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value[:19], "%Y:%m:%d %H:%M:%S")
+    except ValueError:
+        return None
+
+
+def _parse_exif(tiff: bytes, meta: ImageMetadata) -> None:
+    if tiff[:2] == b"II":
+        endian = "<"
+    elif tiff[:2] == b"MM":
+        endian = ">"
+    else:
+        return
+    (ifd0_offset,) = struct.unpack(endian + "I", tiff[4:8])
+    ifd0 = _read_ifd(tiff, ifd0_offset, endian)
+
+    orientation = _ifd_int(ifd0, _TAG_ORIENTATION, endian)
+    if orientation and 1 <= orientation <= 8:
+        meta.orientation = orientation
+
+    make = _ifd_ascii(ifd0, _TAG_MAKE)
+    model = _ifd_ascii(ifd0, _TAG_MODEL)
+    if model and make and not model.lower().startswith(make.lower()):
+        meta.camera = f"{make} {model}"[:255]
+    elif model or make:
+        meta.camera = (model or make)[:255]
+
+    taken_at = None
+    exif_offset = _ifd_int(ifd0, _TAG_EXIF_IFD, endian)
+    if exif_offset:
+        exif_ifd = _read_ifd(tiff, exif_offset, endian)
+        taken_at = _parse_exif_datetime(_ifd_ascii(exif_ifd, _TAG_DATETIME_ORIGINAL))
+    meta.taken_at = taken_at or _parse_exif_datetime(_ifd_ascii(ifd0, _TAG_DATETIME))
@@ -0,0 +1,194 @@
+"""
+이미지 플레이스홀더 계산 유틸리티.
+
+사진 1장당 업로드(또는 업로드 확인) 시점에 한 번만 계산하여 Photo 컬럼에 저장합니다.
+- blurhash: 약 30자 문자열. 클라이언트가 원본 로드 전 흐릿한 미리보기를 즉시 렌더링
+- dominant_color: 대표 색상 (#rrggbb). 배경색/스켈레톤 색으로 사용
+
+CPU 작업(디코딩 + DCT)이므로 이벤트 루프가 아닌 스레드 풀에서 호출해야 합니다.
+디코딩은 decode_image로 한 번만 하고, 그 결과를 플레이스홀더와 perceptual hash 계산에 함께 넘깁니다.
+Pillow가 설치되지 않았거나 디코딩할 수 없는 포맷(HEIC 등)이면 None을 반환합니다.
+"""
+import io
+import logging
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow 미설치 환경에서는 플레이스홀더를 생성하지 않음
+    Image = None
+    ImageOps = None
+
+logger = logging.getLogger("app.image")
+
+# blurhash 계산용 썸네일 크기 (픽셀 수가 작을수록 빠름, 32x32면 충분)
+THUMBNAIL_SIZE = 32
+# 플레이스홀더 계산에 필요한 최소 디코딩 크기
+PLACEHOLDER_DECODE_SIZE = (THUMBNAIL_SIZE * 2, THUMBNAIL_SIZE * 2)
+# blurhash 컴포넌트 수 (가로 4 x 세로 3 → 28자)
+BLURHASH_X_COMPONENTS = 4
+BLURHASH_Y_COMPONENTS = 3
+
+_BASE83_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+@dataclass(frozen=True)
+class ImagePlaceholder:
+    """Precomputed placeholder for a photo."""
+
+    blurhash: str
+    dominant_color: str  # "#rrggbb"
+
+
+def _encode_base83(value: int, length: int) -> str:
+    result = []
+    for i in range(1, length + 1):
+        digit = (value // (83 ** (length - i))) % 83
+        result.append(_BASE83_CHARS[digit])
+    return "".join(result)
+
+
+def _srgb_to_linear(value: int) -> float:
+    v = value / 255.0
+    if v <= 0.04045:
+        return v / 12.92
+    return ((v + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value: float) -> int:
+    v = max(0.0, min(1.0, value))
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * (v ** (1 / 2.4)) - 0.055) * 255 + 0.5)
+
+
+def _sign_pow(value: float, exp: float) -> float:
+    return math.copysign(abs(value) ** exp, value)
+
+
+def encode_blurhash(
+    pixels: List[Tuple[int, int, int]],
+    width: int,
+    height: int,
+    x_components: int = BLURHASH_X_COMPONENTS,
+    y_components: int = BLURHASH_Y_COMPONENTS,
+) -> str:
+    """
+    Encode RGB pixels (row-major) into a blurhash string.
+
+    https://github.com/woltapp/blurhash/blob/master/Algorithm.md
+    """
+    linear = [(_srgb_to_linear(r), _srgb_to_linear(g), _srgb_to_linear(b)) for r, g, b in pixels]
+    cos_x = [[math.cos(math.pi * i * x / width) for x in range(width)] for i in range(x_components)]
+    cos_y = [[math.cos(math.pi * j * y / height) for y in range(height)] for j in range(y_components)]
+
+    factors: List[Tuple[float, float, float]] = []
+    scale = 1.0 / (width * height)
+    for j in range(y_components):
+        for i in range(x_components):
+            normalisation = 1.0 if i == 0 and j == 0 else 2.0
+            r = g = b = 0.0
+            for y in range(height):
+                cy = cos_y[j][y] * normalisation
+                row = y * width
+                for x in range(width):
+                    basis = cos_x[i][x] * cy
+                    pr, pg, pb = linear[row + x]
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    result = _encode_base83((x_components - 1) + (y_components - 1) * 9, 1)
+
+    if ac:
+        actual_max = max(abs(c) for f in ac for c in f)
+        quantised_max = max(0, min(82, int(actual_max * 166 - 0.5)))
+        max_value = (quantised_max + 1) / 166
+        result += _encode_base83(quantised_max, 1)
+    else:
+        max_value = 1.0
+        result += _encode_base83(0, 1)
+
+    dc_value = (_linear_to_srgb(dc[0]) << 16) + (_linear_to_srgb(dc[1]) << 8) + _linear_to_srgb(dc[2])
+    result += _encode_base83(dc_value, 4)
+
+    for r, g, b in ac:
+        quant = [
+            max(0, min(18, int(math.floor(_sign_pow(c / max_value, 0.5) * 9 + 9.5))))
+            for c in (r, g, b)
+        ]
+        result += _encode_base83(quant[0] * 19 * 19 + quant[1] * 19 + quant[2], 2)
+
+    return result
+
+
+def _dominant_color(thumbnail) -> str:
+    """썸네일을 소수 팔레트로 양자화한 뒤 가장 많이 쓰인 색을 대표 색상으로 사용."""
+    quantized = thumbnail.quantize(colors=5, method=Image.Quantize.MEDIANCUT)
+    palette = quantized.getpalette() or []
+    counts = quantized.getcolors() or []
+    if not counts or not palette:
+        r, g, b = thumbnail.resize((1, 1)).getpixel((0, 0))
+        return f"#{r:02x}{g:02x}{b:02x}"
+    _, index = max(counts)
+    r, g, b = palette[index * 3:index * 3 + 3]
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def decode_image(content: bytes, min_size: Tuple[int, int] = PLACEHOLDER_DECODE_SIZE):
+    """
+    Decode an image once for analysis (RGB, EXIF 회전 반영).
+
+    JPEG는 draft 모드로 DCT 단계에서 min_size 이상으로 축소 디코딩합니다 (전체 해상도 디코딩 회피).
+    Blocking (CPU bound) — run via ``run_in_executor``.
+
+    Args:
+        content: Encoded image bytes
+        min_size: Smallest (width, height) the analysis steps need
+
+    Returns:
+        PIL RGB image, or None if Pillow is unavailable or the image cannot be decoded
+    """
+    if Image is None or not content:
+        return None
+    try:
+        with Image.open(io.BytesIO(content)) as img:
+            img.draft("RGB", min_size)
+            img = ImageOps.exif_transpose(img)
+            return img.convert("RGB")
+    except Exception as e:
+        # 지원하지 않는 포맷/손상 파일: 분석 결과 없이 진행 (업로드 실패 아님)
+        logger.debug("Image decode skipped", extra={"event": "image_decode", "error": str(e)[:200]})
+        return None
+
+
+def compute_placeholder(image) -> Optional[ImagePlaceholder]:
+    """
+    Compute blurhash and dominant colour for an image.
+
+    Blocking (CPU bound) — run via ``run_in_executor``.
+
+    Args:
+        image: RGB image from decode_image (변경하지 않음)
+
+    Returns:
+        ImagePlaceholder, or None if the image is None or cannot be processed
+    """
+    if image is None:
+        return None
+    try:
+        thumbnail = image.copy()
+        thumbnail.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        width, height = thumbnail.size
+        pixels = list(thumbnail.getdata())
+        return ImagePlaceholder(
+            blurhash=encode_blurhash(pixels, width, height),
+            dominant_color=_dominant_color(thumbnail),
+        )
+    except Exception as e:
+        logger.debug("Placeholder computation skipped", extra={"event": "image_placeholder", "error": str(e)[:200]})
+        return None
@@ -0,0 +1,101 @@
+"""
+Keyset (cursor) pagination utilities.
+
+OFFSET은 건너뛴 행을 모두 읽어야 하므로 뒤 페이지일수록 느려집니다.
+대신 마지막 행의 정렬 키 (created_at, id)를 불투명한 커서로 돌려주고,
+다음 페이지는 `WHERE (created_at, id) < (커서)` 조건으로 인덱스에서 바로 이어 읽습니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a (created_at, id) sort key as an opaque URL-safe cursor."""
+    payload = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def created_before(created_col, id_col, cursor: str) -> ColumnElement:
+    """
+    WHERE condition for the next page of a `ORDER BY created_at DESC, id DESC` listing.
+    (created_at, id) 복합 인덱스로 범위 검색되도록 OR 형태로 전개 (row value 비교는 DB별 최적화 차이가 있음).
+    """
+    created_at, row_id = decode_cursor(cursor)
+    return or_(
+        created_col < created_at,
+        and_(created_col == created_at, id_col < row_id),
+    )
+
+
+def encode_score_cursor(score: float, row_id: int) -> str:
+    """Encode a (score, id) sort key for ranked listings (검색 결과 등)."""
+    payload = json.dumps([score, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_score_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Decode a cursor produced by ``encode_score_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(score), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def encode_order_cursor(order: int, row_id: int) -> str:
+    """Encode an (order, id) sort key for album photo listings (앨범 순서)."""
+    payload = json.dumps([order, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_order_cursor(cursor: str) -> Tuple[int, int]:
+    """
+    Decode a cursor produced by ``encode_order_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        order, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return int(order), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def ordered_after(order_col, id_col, cursor: str) -> ColumnElement:
+    """
+    WHERE condition for the next page of a `ORDER BY order ASC, id ASC` listing.
+    (album_id, order) 인덱스로 커서 위치부터 바로 이어 읽습니다.
+    """
+    order, row_id = decode_order_cursor(cursor)
+    return or_(
+        order_col > order,
+        and_(order_col == order, id_col > row_id),
+    )
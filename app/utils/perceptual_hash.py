@@ -0,0 +1,65 @@
+"""
+Perceptual hash (dHash) 유틸리티.
+
+연사·재저장·리사이즈처럼 바이트는 다르지만 눈으로는 거의 같은 사진을 찾기 위한 64비트 해시입니다.
+9x8 흑백 썸네일에서 가로로 인접한 픽셀의 밝기 비교 결과를 비트로 사용하며,
+두 해시의 해밍 거리(다른 비트 수)가 작을수록 비슷한 이미지입니다 (보통 0~10이면 근접 중복).
+
+DB BigInteger(부호 있는 64비트)에 저장하므로 부호 있는 정수로 반환합니다.
+입력은 image_placeholder.decode_image로 디코딩한 이미지이며(플레이스홀더와 디코딩 결과 공유),
+CPU 작업이므로 스레드 풀에서 호출해야 합니다. 이미지가 없거나(Pillow 미설치/디코딩 불가) 처리할 수 없으면 None을 반환합니다.
+"""
+import logging
+from typing import Optional
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow 미설치 환경에서는 해시를 생성하지 않음
+    Image = None
+
+logger = logging.getLogger("app.image")
+
+HASH_BITS = 64
+_HASH_WIDTH = 9
+_HASH_HEIGHT = 8
+# dHash 계산에 필요한 최소 디코딩 크기 (JPEG draft 축소 디코딩 하한)
+DHASH_DECODE_SIZE = (_HASH_WIDTH * 8, _HASH_HEIGHT * 8)
+
+
+def to_signed64(value: int) -> int:
+    """Unsigned 64-bit → signed (BigInteger 컬럼 저장용)."""
+    return value - (1 << HASH_BITS) if value >= (1 << (HASH_BITS - 1)) else value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two 64-bit hashes (부호 무관)."""
+    return ((a ^ b) & ((1 << HASH_BITS) - 1)).bit_count()
+
+
+def compute_dhash(image) -> Optional[int]:
+    """
+    Compute a 64-bit difference hash.
+
+    Blocking (CPU bound) — run via ``run_in_executor``.
+
+    Args:
+        image: Image from decode_image (EXIF 회전 반영됨, 변경하지 않음)
+
+    Returns:
+        Signed 64-bit hash, or None if the image is None or cannot be processed
+    """
+    if Image is None or image is None:
+        return None
+    try:
+        small = image.convert("L").resize((_HASH_WIDTH, _HASH_HEIGHT), Image.Resampling.LANCZOS)
+        pixels = list(small.getdata())
+    except Exception as e:
+        logger.debug("Perceptual hash skipped", extra={"event": "image_phash", "error": str(e)[:200]})
+        return None
+
+    value = 0
+    for y in range(_HASH_HEIGHT):
+        row = y * _HASH_WIDTH
+        for x in range(_HASH_WIDTH - 1):
+            value = (value << 1) | (pixels[row + x] < pixels[row + x + 1])
+    return to_signed64(value)
@@ -187,7 +187,7 @@ image_access_duration_seconds = Histogram(
 photo_upload_total = Counter(
     "photo_api_photo_upload_total",
     "Total number of photo upload attempts",
-    ["upload_method", "result"],  # upload_method: presigned | direct, result: success | failure
+    ["upload_method", "result"],  # upload_method: presigned | direct | batch | resumable, result: success | failure
     registry=REGISTRY,
 )
 
@@ -206,6 +206,13 @@ presigned_url_generation_total = Counter(
     registry=REGISTRY,
 )
 
+photo_upload_dedup_total = Counter(
+    "photo_api_photo_upload_dedup_total",
+    "Uploads whose bytes were already stored (object storage write skipped or copy removed)",
+    ["upload_method"],  # upload_method: presigned | direct | batch | resumable
+    registry=REGISTRY,
+)
+
 photo_upload_confirm_total = Counter(
     "photo_api_photo_upload_confirm_total",
     "Total number of photo upload confirmation attempts",
@@ -224,7 +231,7 @@ album_operations_total = Counter(
 album_photo_operations_total = Counter(
     "photo_api_album_photo_operations_total",
     "Total number of album photo operations",
-    ["operation", "result"],  # operation: add | remove, result: success | failure
+    ["operation", "result"],  # operation: add | remove | move, result: success | failure
     registry=REGISTRY,
 )
 
@@ -280,6 +287,65 @@ object_storage_usage_by_user_bytes = Gauge(
     registry=REGISTRY,
 )
 
+# Swift 컨테이너 실제 사용량 (사용량 재집계 시 HEAD 응답의 X-Container-Bytes-Used)
+object_storage_container_bytes = Gauge(
+    "photo_api_object_storage_container_bytes",
+    "Bytes used by the object storage container as reported by Swift",
+    registry=REGISTRY,
+)
+
+# 사용량 카운터(user_usage) 재집계 시 보정된 사용자 수
+usage_counter_drift_total = Counter(
+    "photo_api_usage_counter_drift_total",
+    "Users whose usage counters were corrected by reconciliation",
+    registry=REGISTRY,
+)
+
+# 업로드 한도 초과로 거절된 요청
+photo_upload_quota_exceeded_total = Counter(
+    "photo_api_photo_upload_quota_exceeded_total",
+    "Uploads rejected because the user's quota would be exceeded",
+    ["upload_method"],  # upload_method: presigned | direct | batch | resumable
+    registry=REGISTRY,
+)
+
+# 공유 링크 캐시 (토큰 조회, 앨범 구성)
+share_cache_requests_total = Counter(
+    "photo_api_share_cache_requests_total",
+    "Share link cache lookups",
+    ["cache", "result"],  # cache: link | album | response | negative | token_filter, result: hit | miss | reject
+    registry=REGISTRY,
+)
+
+share_manifest_publish_total = Counter(
+    "photo_api_share_manifest_publish_total",
+    "Static share manifest writes",
+    ["result"],  # published | tombstoned | failure
+    registry=REGISTRY,
+)
+
+share_view_flush_total = Counter(
+    "photo_api_share_view_flush_total",
+    "Buffered share view count flushes",
+    ["result"],  # success | failure
+    registry=REGISTRY,
+)
+
+# 백그라운드 삭제 작업 (앨범·계정)
+deletion_jobs_total = Counter(
+    "photo_api_deletion_jobs_total",
+    "Background deletion jobs finished",
+    ["kind", "result"],  # kind: album | user, result: done | retry | failed
+    registry=REGISTRY,
+)
+
+deletion_rows_deleted_total = Counter(
+    "photo_api_deletion_rows_deleted_total",
+    "Rows removed by background deletion jobs",
+    ["stage"],
+    registry=REGISTRY,
+)
+
 # 사진 업로드 시 실시간 업데이트용 Counter (시간별 추이 분석용)
 photo_upload_size_total = Counter(
     "photo_api_photo_upload_size_total_bytes",
@@ -395,6 +461,7 @@ async def update_business_metrics() -> None:
         from app.models.album import Album
         from app.models.photo import Photo
         from app.models.share import ShareLink
+        from app.models.user_usage import UserUsage
         from sqlalchemy import select, func
 
         now = datetime.now(timezone.utc)
@@ -422,19 +489,21 @@ async def update_business_metrics() -> None:
             new_users_7d = new_users_7d_result.scalar() or 0
 
             # 앨범 수 집계
-            total_albums_result = await db.execute(select(func.count(Album.id)))
+            total_albums_result = await db.execute(
+                select(func.count(Album.id)).where(Album.deleted_at.is_(None))
+            )
             total_albums = total_albums_result.scalar() or 0
 
             # 공유 앨범 수 (share_links가 있는 앨범)
             shared_albums_result = await db.execute(
                 select(func.count(func.distinct(Album.id)))
                 .join(ShareLink, ShareLink.album_id == Album.id)
-                .where(ShareLink.is_active == True)
+                .where(ShareLink.is_active == True, Album.deleted_at.is_(None))
             )
             shared_albums = shared_albums_result.scalar() or 0
 
-            # 사진 수 집계
-            total_photos_result = await db.execute(select(func.count(Photo.id)))
+            # 사진 수 집계 (user_usage 카운터 합: 사용자 수만큼만 읽음)
+            total_photos_result = await db.execute(select(func.sum(UserUsage.photo_count)))
             total_photos = total_photos_result.scalar() or 0
 
             # 최근 24h 업로드 사진 수
@@ -467,18 +536,12 @@ async def update_business_metrics() -> None:
             total_share_views_result = await db.execute(select(func.sum(ShareLink.view_count)))
             total_share_views = total_share_views_result.scalar() or 0
 
-            # Object Storage 사용량 집계 (사진 파일 크기 합계)
-            total_storage_result = await db.execute(
-                select(func.sum(Photo.file_size))
-            )
-            total_storage = total_storage_result.scalar() or 0
-
-            # 사용자별 Object Storage 사용량
+            # Object Storage 사용량 (사진 파일 크기 합계): photos 전체 GROUP BY 대신 user_usage 카운터
             user_storage_result = await db.execute(
-                select(Photo.owner_id, func.sum(Photo.file_size).label("total_size"))
-                .group_by(Photo.owner_id)
+                select(UserUsage.user_id, UserUsage.bytes_used).where(UserUsage.bytes_used > 0)
             )
-            user_storage_map = {row.owner_id: row.total_size for row in user_storage_result}
+            user_storage_map = {row.user_id: row.bytes_used for row in user_storage_result}
+            total_storage = sum(user_storage_map.values())
 
             # 메트릭 업데이트 (기존)
             users_total.labels(status="total").set(total_users)
@@ -0,0 +1,56 @@
+"""
+Search tokenizer (검색 색인/질의 공통).
+
+DB별 전문 검색(SQLite FTS5, PostgreSQL tsvector)은 공백 기준 토크나이저만 쓰고,
+언어 처리는 여기서 한 번에 합니다. 색인과 질의가 같은 함수를 거치므로 DB와 무관하게 같은 결과가 나옵니다.
+
+- NFKC 정규화 + 소문자화
+- 라틴/숫자: 단어 단위 (`IMG_0001.jpg` → img, 0001, jpg)
+- 한글/한자/가나: 형태소 분석기 없이 문자 bigram (`여름휴가` → 여름, 름휴, 휴가), 한 글자 단어는 unigram
+  질의는 prefix 매칭이므로 한 글자 질의(`여`)도 bigram(`여름`)과 매칭됩니다.
+"""
+import re
+import unicodedata
+from itertools import groupby
+from typing import List, Optional
+
+_WORD_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+# 질의 토큰 수 상한 (긴 문장 붙여넣기 방지)
+MAX_QUERY_TOKENS = 16
+
+
+def _is_cjk(char: str) -> bool:
+    code = ord(char)
+    return (
+        0xAC00 <= code <= 0xD7A3  # 한글 음절
+        or 0x1100 <= code <= 0x11FF  # 한글 자모
+        or 0x3130 <= code <= 0x318F  # 한글 호환 자모
+        or 0x3040 <= code <= 0x30FF  # 히라가나/가타카나
+        or 0x4E00 <= code <= 0x9FFF  # CJK 통합 한자
+    )
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into index/query tokens (CJK runs become character bigrams)."""
+    if not text:
+        return []
+    tokens: List[str] = []
+    for word in _WORD_PATTERN.findall(unicodedata.normalize("NFKC", text).lower()):
+        for is_cjk, chars in groupby(word, key=_is_cjk):
+            run = "".join(chars)
+            if is_cjk and len(run) > 1:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+            else:
+                tokens.append(run)
+    return tokens
+
+
+def document_tokens(*texts: Optional[str]) -> str:
+    """Space-separated tokens for the search_documents.tokens column."""
+    return " ".join(token for text in texts for token in tokenize(text))
+
+
+def query_tokens(query: str) -> List[str]:
+    """Distinct query tokens in order, capped at MAX_QUERY_TOKENS."""
+    return list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TOKENS]
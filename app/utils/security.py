@@ -1,7 +1,11 @@
 """
 Security utility functions for password hashing and JWT token management.
 """
+import base64
+import hashlib
+import hmac
 import secrets
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -147,6 +151,46 @@ def verify_image_access_token(token: str) -> Optional[int]:
         return None
 
 
+def share_image_url_expiry(now: Optional[float] = None) -> int:
+    """
+    Expiry (unix seconds) for signed share image URLs issued now.
+
+    share_image_url_ttl_seconds의 절반 단위로 올림해, 같은 구간에 발급한 URL은 같은 값을 가집니다
+    (직렬화된 공유 앨범 응답을 구간 동안 캐시 가능). 발급 시점 기준 남은 유효 시간은 TTL의 절반 이상 TTL 이하.
+    """
+    if now is None:
+        now = time.time()
+    step = max(1, settings.share_image_url_ttl_seconds // 2)
+    return (int(now) // step + 2) * step
+
+
+def sign_share_image(token: str, share_id: int, photo_id: int, storage_path: str, expires: int) -> str:
+    """
+    HMAC-SHA256 signature for a shared image URL (128비트, URL-safe base64).
+    서명 대상: (share token, share_id, photo_id, storage_path digest, expiry).
+    토큰을 포함하므로 URL 경로의 {token}을 바꾸면 검증에 실패합니다.
+    """
+    path_digest = hashlib.sha256(storage_path.encode()).hexdigest()
+    message = f"share-image:{token}:{share_id}:{photo_id}:{path_digest}:{expires}".encode()
+    digest = hmac.new(settings.jwt_secret_key.encode(), message, hashlib.sha256).digest()[:16]
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def verify_share_image_signature(
+    token: str,
+    share_id: int,
+    photo_id: int,
+    storage_path: str,
+    expires: int,
+    signature: str,
+) -> bool:
+    """
+    Verify a shared image URL signature (상수 시간 비교). 만료 여부는 호출자가 확인.
+    """
+    expected = sign_share_image(token, share_id, photo_id, storage_path, expires)
+    return hmac.compare_digest(expected, signature)
+
+
 def generate_share_token(length: int = 32) -> str:
     """
     Generate a secure random token for share links.
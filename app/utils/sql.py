@@ -0,0 +1,81 @@
+"""
+Dialect-aware SQL helpers.
+"""
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def upsert_increment(
+    db: AsyncSession,
+    table: Table,
+    key_columns: Sequence[str],
+    columns: Sequence[str],
+    rows: List[Dict[str, Any]],
+) -> None:
+    """
+    INSERT rows, or add their `columns` values to the existing row on key conflict.
+
+    읽고-쓰기 대신 한 문장(INSERT ... ON CONFLICT DO UPDATE / ON DUPLICATE KEY UPDATE)으로 처리하므로
+    동시 갱신에도 카운트가 유실되지 않습니다. 행은 키 순으로 정렬해 잠금 순서를 고정합니다 (교착 방지).
+    """
+    if not rows:
+        return
+    rows = sorted(rows, key=lambda row: tuple(row[name] for name in key_columns))
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+
+        stmt = insert(table).values(rows)
+        stmt = stmt.on_duplicate_key_update({name: table.c[name] + stmt.inserted[name] for name in columns})
+    else:
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        stmt = insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={name: table.c[name] + stmt.excluded[name] for name in columns},
+        )
+    await db.execute(stmt)
+
+
+async def insert_ignore(
+    db: AsyncSession,
+    table: Table,
+    key_columns: Sequence[str],
+    rows: List[Dict[str, Any]],
+) -> int:
+    """
+    INSERT rows, skipping those that violate the unique key on `key_columns`.
+
+    PostgreSQL/SQLite는 INSERT ... ON CONFLICT DO NOTHING RETURNING으로 실제 삽입된 행만 세고,
+    MySQL은 INSERT IGNORE의 rowcount를 사용합니다. 기존 행을 미리 읽지 않으므로 비용은 삽입할 행 수에 비례합니다.
+
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+
+        result = await db.execute(insert(table).values(rows).prefix_with("IGNORE"))
+        return result.rowcount
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    stmt = (
+        insert(table)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=list(key_columns))
+        .returning(*(table.c[name] for name in key_columns))
+    )
+    result = await db.execute(stmt)
+    return len(result.all())
@@ -0,0 +1,225 @@
+"""
+Streaming ZIP writer (stored, no compression).
+
+사진(JPEG/PNG/HEIC)은 이미 압축돼 있어 deflate 이득이 거의 없으므로 STORED 방식으로 그대로 담습니다.
+각 엔트리의 크기를 미리 알고 있으므로 전체 아카이브 크기(Content-Length)를 바이트를 읽기 전에 계산할 수 있고,
+CRC-32는 데이터를 흘려보내며 계산해 data descriptor(플래그 bit 3)로 뒤에 기록합니다.
+임시 파일 없이 청크 단위로 내보내며, 메모리 사용량은 prefetch 창 크기로만 제한됩니다.
+4GB를 넘는 아카이브는 ZIP64 종료 레코드를 사용합니다.
+"""
+import asyncio
+import struct
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, List
+
+LOCAL_HEADER_SIZE = 30
+DATA_DESCRIPTOR_SIZE = 16
+CENTRAL_HEADER_SIZE = 46
+ZIP64_OFFSET_EXTRA_SIZE = 12  # header id(2) + size(2) + local header offset(8)
+END_RECORD_SIZE = 22
+ZIP64_END_RECORD_SIZE = 56
+ZIP64_END_LOCATOR_SIZE = 20
+
+ZIP32_LIMIT = 0xFFFFFFFF
+ZIP32_ENTRY_LIMIT = 0xFFFF
+
+# general purpose flag: bit 3 (CRC/크기는 data descriptor에), bit 11 (파일명 UTF-8)
+FLAGS = 0x0808
+VERSION_ZIP = 20
+VERSION_ZIP64 = 45
+
+# 엔트리당 선읽기 큐 길이 (청크 수)
+PREFETCH_QUEUE_CHUNKS = 4
+
+
+@dataclass
+class ZipEntry:
+    """One file in the archive. `size` must equal the number of bytes the source yields."""
+
+    name: str
+    size: int
+    modified: datetime
+    source: str  # open_entry에 전달되는 식별자 (예: storage path)
+
+
+def _dos_datetime(value: datetime) -> tuple:
+    year = min(max(value.year, 1980), 2107)
+    dos_date = ((year - 1980) << 9) | (value.month << 5) | value.day
+    dos_time = (value.hour << 11) | (value.minute << 5) | (value.second // 2)
+    return dos_time, dos_date
+
+
+def unique_entry_names(names: List[str]) -> List[str]:
+    """
+    Make archive names unique and path-free: "a.jpg", "a (1).jpg", ...
+    앨범에는 같은 원본 파일명이 여러 번 들어올 수 있음.
+    """
+    seen: Dict[str, int] = {}
+    used = set()
+    result = []
+    for name in names:
+        base = (name or "photo").replace("\\", "/").rsplit("/", 1)[-1] or "photo"
+        candidate = base
+        while candidate in used:
+            seen[base] = seen.get(base, 0) + 1
+            stem, dot, ext = base.rpartition(".")
+            candidate = f"{stem} ({seen[base]}).{ext}" if dot else f"{base} ({seen[base]})"
+        used.add(candidate)
+        result.append(candidate)
+    return result
+
+
+class StoredZipStream:
+    """
+    Stored ZIP archive generated on the fly from entries of known size.
+
+    Usage:
+        archive = StoredZipStream(entries)
+        StreamingResponse(archive.stream(open_entry), headers={"Content-Length": str(archive.content_length)})
+    """
+
+    def __init__(self, entries: List[ZipEntry]):
+        for entry in entries:
+            if entry.size > ZIP32_LIMIT:
+                raise ValueError(f"Entry too large for stored ZIP: {entry.name}")
+        self.entries = entries
+        self._encoded_names = [entry.name.encode("utf-8") for entry in entries]
+        self._offsets: List[int] = []
+        offset = 0
+        for entry, name in zip(entries, self._encoded_names):
+            self._offsets.append(offset)
+            offset += LOCAL_HEADER_SIZE + len(name) + entry.size + DATA_DESCRIPTOR_SIZE
+        self._central_offset = offset
+        self._central_size = sum(
+            CENTRAL_HEADER_SIZE + len(name) + (ZIP64_OFFSET_EXTRA_SIZE if entry_offset >= ZIP32_LIMIT else 0)
+            for name, entry_offset in zip(self._encoded_names, self._offsets)
+        )
+        self._zip64 = (
+            len(entries) >= ZIP32_ENTRY_LIMIT
+            or self._central_offset >= ZIP32_LIMIT
+            or self._central_size >= ZIP32_LIMIT
+        )
+
+    @property
+    def content_length(self) -> int:
+        """Exact archive size in bytes, computed from entry sizes only."""
+        end = END_RECORD_SIZE
+        if self._zip64:
+            end += ZIP64_END_RECORD_SIZE + ZIP64_END_LOCATOR_SIZE
+        return self._central_offset + self._central_size + end
+
+    async def stream(
+        self,
+        open_entry: Callable[[ZipEntry], AsyncIterator[bytes]],
+        prefetch: int = 2,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the archive bytes.
+
+        현재 엔트리를 내보내는 동안 다음 `prefetch`개 엔트리의 다운로드를 미리 시작합니다.
+        엔트리마다 큐 길이가 제한되어 있어 메모리는 (prefetch + 1) × PREFETCH_QUEUE_CHUNKS 청크를 넘지 않습니다.
+
+        Raises:
+            ValueError: If a source yields a different number of bytes than its declared size
+        """
+        crcs: List[int] = []
+        pending: List[tuple] = []
+        current = None
+        next_index = 0
+
+        def _start_next() -> None:
+            nonlocal next_index
+            entry = self.entries[next_index]
+            queue: asyncio.Queue = asyncio.Queue(maxsize=PREFETCH_QUEUE_CHUNKS)
+            pending.append((entry, queue, asyncio.create_task(_pump(entry, queue))))
+            next_index += 1
+
+        async def _pump(entry: ZipEntry, queue: asyncio.Queue) -> None:
+            try:
+                async for chunk in open_entry(entry):
+                    if chunk:
+                        await queue.put(chunk)
+                await queue.put(None)
+            except Exception as e:
+                await queue.put(e)
+
+        try:
+            for index, (entry, name) in enumerate(zip(self.entries, self._encoded_names)):
+                while next_index < len(self.entries) and next_index <= index + prefetch:
+                    _start_next()
+                _, queue, current = pending.pop(0)
+
+                dos_time, dos_date = _dos_datetime(entry.modified)
+                yield struct.pack(
+                    "<IHHHHHIIIHH",
+                    0x04034B50, VERSION_ZIP, FLAGS, 0, dos_time, dos_date,
+                    0, entry.size, entry.size, len(name), 0,
+                ) + name
+
+                crc = 0
+                written = 0
+                while True:
+                    chunk = await queue.get()
+                    if chunk is None:
+                        break
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    written += len(chunk)
+                    if written > entry.size:
+                        break
+                    crc = zlib.crc32(chunk, crc)
+                    yield chunk
+                if written != entry.size:
+                    raise ValueError(
+                        f"Size mismatch for {entry.name}: expected {entry.size}, got {written}"
+                    )
+
+                crcs.append(crc)
+                yield struct.pack("<IIII", 0x08074B50, crc, entry.size, entry.size)
+        finally:
+            # 클라이언트 연결 종료 등으로 중단되면 선읽기 중인 다운로드 취소
+            if current is not None:
+                current.cancel()
+            for _, _, task in pending:
+                task.cancel()
+
+        yield self._central_directory(crcs)
+
+    def _central_directory(self, crcs: List[int]) -> bytes:
+        parts = []
+        for entry, name, crc, offset in zip(self.entries, self._encoded_names, crcs, self._offsets):
+            dos_time, dos_date = _dos_datetime(entry.modified)
+            extra = b""
+            if offset >= ZIP32_LIMIT:
+                extra = struct.pack("<HHQ", 0x0001, 8, offset)
+            version = VERSION_ZIP64 if extra else VERSION_ZIP
+            parts.append(struct.pack(
+                "<IHHHHHHIIIHHHHHII",
+                0x02014B50, version, version, FLAGS, 0, dos_time, dos_date,
+                crc, entry.size, entry.size, len(name), len(extra), 0, 0, 0, 0,
+                ZIP32_LIMIT if extra else offset,
+            ) + name + extra)
+
+        count = len(self.entries)
+        if self._zip64:
+            zip64_end_offset = self._central_offset + self._central_size
+            parts.append(struct.pack(
+                "<IQHHIIQQQQ",
+                0x06064B50, ZIP64_END_RECORD_SIZE - 12, VERSION_ZIP64, VERSION_ZIP64, 0, 0,
+                count, count, self._central_size, self._central_offset,
+            ))
+            parts.append(struct.pack("<IIQI", 0x07064B50, 0, zip64_end_offset, 1))
+            parts.append(struct.pack(
+                "<IHHHHIIH",
+                0x06054B50, 0, 0,
+                min(count, ZIP32_ENTRY_LIMIT), min(count, ZIP32_ENTRY_LIMIT),
+                min(self._central_size, ZIP32_LIMIT), min(self._central_offset, ZIP32_LIMIT), 0,
+            ))
+        else:
+            parts.append(struct.pack(
+                "<IHHHHIIH",
+                0x06054B50, 0, 0, count, count, self._central_size, self._central_offset, 0,
+            ))
+        return b"".join(parts)
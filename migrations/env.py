@@ -0,0 +1,74 @@
+"""
+Alembic environment.
+
+DB URL은 앱과 동일하게 app.database에서 결정합니다 (DATABASE_URL 환경변수/.env, 비어 있으면 SQLite).
+비동기 드라이버(aiosqlite/asyncpg/asyncmy)를 그대로 사용하여 마이그레이션을 실행합니다.
+"""
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.database import Base, _database_url
+import app.models  # noqa: F401  (모든 모델을 metadata에 등록)
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# 모델 밖에서 마이그레이션으로만 관리하는 DB별 객체 (autogenerate/check 비교 대상에서 제외)
+# - SQLite FTS5 가상 테이블과 그 섀도 테이블, PostgreSQL 표현식 GIN 인덱스
+MANUAL_OBJECT_PREFIXES = ("search_documents_fts", "ix_search_documents_tsv")
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    return not (reflected and compare_to is None and name and name.startswith(MANUAL_OBJECT_PREFIXES))
+
+
+def run_migrations_offline() -> None:
+    """Emit SQL to stdout instead of executing (alembic upgrade head --sql)."""
+    context.configure(
+        url=_database_url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=_database_url.startswith("sqlite"),
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite는 ALTER 제약이 많아 batch 모드(테이블 재생성)로 처리
+        render_as_batch=connection.dialect.name == "sqlite",
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    connectable = create_async_engine(_database_url, poolclass=NullPool)
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,75 @@
+"""photo analysis columns and content-addressed storage
+
+- photos: blurhash, dominant_color (placeholder), width/height/orientation/taken_at/camera (헤더 메타데이터)
+- photos.content_hash + stored_objects (SHA-256 기반 중복 제거, 참조 카운트)
+
+기존 사진은 모두 NULL로 남으며, content_hash가 없는 사진은 기존 경로를 그대로 사용합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 08:24:10
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("photos") as batch_op:
+        batch_op.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column("blurhash", sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column("dominant_color", sa.String(length=7), nullable=True))
+        batch_op.add_column(sa.Column("width", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("height", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("orientation", sa.SmallInteger(), nullable=True))
+        batch_op.add_column(sa.Column("taken_at", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("camera", sa.String(length=255), nullable=True))
+        batch_op.create_index("ix_photos_content_hash", ["content_hash"], unique=False)
+        batch_op.create_index("ix_photos_owner_content_hash", ["owner_id", "content_hash"], unique=False)
+        batch_op.create_index("ix_photos_width", ["width"], unique=False)
+        batch_op.create_index("ix_photos_height", ["height"], unique=False)
+        batch_op.create_index("ix_photos_orientation", ["orientation"], unique=False)
+        batch_op.create_index("ix_photos_camera", ["camera"], unique=False)
+        batch_op.create_index("ix_photos_owner_taken_at", ["owner_id", "taken_at"], unique=False)
+
+    op.create_table(
+        "stored_objects",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("storage_path", sa.String(length=500), nullable=False),
+        sa.Column("file_size", sa.Integer(), nullable=False),
+        sa.Column("content_type", sa.String(length=100), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_stored_objects_content_hash", "stored_objects", ["content_hash"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_stored_objects_content_hash", table_name="stored_objects")
+    op.drop_table("stored_objects")
+
+    with op.batch_alter_table("photos") as batch_op:
+        batch_op.drop_index("ix_photos_owner_taken_at")
+        batch_op.drop_index("ix_photos_camera")
+        batch_op.drop_index("ix_photos_orientation")
+        batch_op.drop_index("ix_photos_height")
+        batch_op.drop_index("ix_photos_width")
+        batch_op.drop_index("ix_photos_owner_content_hash")
+        batch_op.drop_index("ix_photos_content_hash")
+        batch_op.drop_column("camera")
+        batch_op.drop_column("taken_at")
+        batch_op.drop_column("orientation")
+        batch_op.drop_column("height")
+        batch_op.drop_column("width")
+        batch_op.drop_column("dominant_color")
+        batch_op.drop_column("blurhash")
+        batch_op.drop_column("content_hash")
@@ -0,0 +1,44 @@
+"""performance indexes matched to service queries
+
+| 인덱스 | 쿼리 (services/photo.py, services/album.py) |
+|---|---|
+| photos(owner_id, created_at, id) | 사진 목록: WHERE owner_id = ? ORDER BY created_at DESC, id DESC (offset/keyset) |
+| albums(owner_id, created_at, id) | 앨범 목록: WHERE owner_id = ? ORDER BY created_at DESC, id DESC |
+| albums(cover_photo_id) | 사진 삭제 시 ON DELETE SET NULL 대상 조회 |
+| album_photos(album_id, order) | 앨범 사진 목록/개수/MAX(order): WHERE album_id = ? ORDER BY order |
+| album_photos(photo_id, album_id) | 사진 삭제 시 연관 행 조회, 포함 여부 확인 |
+| share_links(album_id, created_at) | 앨범별 공유 링크 목록: WHERE album_id = ? ORDER BY created_at DESC |
+
+owner_id 단일 인덱스는 복합 인덱스의 선두 컬럼으로 대체됩니다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 08:26:45
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_photos_owner_created_id", "photos", ["owner_id", "created_at", "id"], unique=False)
+    op.create_index("ix_albums_owner_created_id", "albums", ["owner_id", "created_at", "id"], unique=False)
+    op.create_index("ix_albums_cover_photo_id", "albums", ["cover_photo_id"], unique=False)
+    op.create_index("ix_album_photos_album_order", "album_photos", ["album_id", "order"], unique=False)
+    op.create_index("ix_album_photos_photo_album", "album_photos", ["photo_id", "album_id"], unique=False)
+    op.create_index("ix_share_links_album_created", "share_links", ["album_id", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_share_links_album_created", table_name="share_links")
+    op.drop_index("ix_album_photos_photo_album", table_name="album_photos")
+    op.drop_index("ix_album_photos_album_order", table_name="album_photos")
+    op.drop_index("ix_albums_cover_photo_id", table_name="albums")
+    op.drop_index("ix_albums_owner_created_id", table_name="albums")
+    op.drop_index("ix_photos_owner_created_id", table_name="photos")
@@ -0,0 +1,26 @@
+"""photos.phash for near-duplicate detection
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 09:48:02
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("photos") as batch_op:
+        batch_op.add_column(sa.Column("phash", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("photos") as batch_op:
+        batch_op.drop_column("phash")
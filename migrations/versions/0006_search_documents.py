@@ -0,0 +1,90 @@
+"""search_documents with dialect-specific full-text index
+
+- SQLite: FTS5 외부 콘텐츠 테이블(search_documents_fts) + INSERT/UPDATE/DELETE 동기화 트리거.
+  owner_key 컬럼('u' || owner_id)을 함께 색인해 MATCH 단계에서 사용자 범위로 좁힘.
+- PostgreSQL: to_tsvector('simple', tokens) 표현식 GIN 인덱스.
+- 그 외(MySQL 등): 전문 인덱스 없이 LIKE로 검색 (services/search.py).
+
+기존 사진·앨범 색인: python -m app.commands.rebuild_search_index
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 10:21:40
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "search_documents",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("doc_type", sa.String(length=16), nullable=False),
+        sa.Column("doc_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("body", sa.Text(), nullable=True),
+        sa.Column("tokens", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("doc_type", "doc_id", name="uq_search_documents_doc"),
+    )
+    op.create_index("ix_search_documents_owner_type", "search_documents", ["owner_id", "doc_type"], unique=False)
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        # FTS5 외부 콘텐츠 소스: owner_key를 계산 컬럼으로 제공하는 뷰 ('rebuild' 명령 시 사용)
+        op.execute(
+            "CREATE VIEW search_documents_fts_source AS "
+            "SELECT id, 'u' || owner_id AS owner_key, tokens FROM search_documents"
+        )
+        op.execute(
+            "CREATE VIRTUAL TABLE search_documents_fts USING fts5("
+            "owner_key, tokens, content='search_documents_fts_source', content_rowid='id')"
+        )
+        op.execute(
+            "CREATE TRIGGER search_documents_ai AFTER INSERT ON search_documents BEGIN "
+            "INSERT INTO search_documents_fts(rowid, owner_key, tokens) "
+            "VALUES (new.id, 'u' || new.owner_id, new.tokens); END"
+        )
+        op.execute(
+            "CREATE TRIGGER search_documents_ad AFTER DELETE ON search_documents BEGIN "
+            "INSERT INTO search_documents_fts(search_documents_fts, rowid, owner_key, tokens) "
+            "VALUES ('delete', old.id, 'u' || old.owner_id, old.tokens); END"
+        )
+        op.execute(
+            "CREATE TRIGGER search_documents_au AFTER UPDATE ON search_documents BEGIN "
+            "INSERT INTO search_documents_fts(search_documents_fts, rowid, owner_key, tokens) "
+            "VALUES ('delete', old.id, 'u' || old.owner_id, old.tokens); "
+            "INSERT INTO search_documents_fts(rowid, owner_key, tokens) "
+            "VALUES (new.id, 'u' || new.owner_id, new.tokens); END"
+        )
+    elif dialect == "postgresql":
+        op.execute(
+            "CREATE INDEX ix_search_documents_tsv ON search_documents "
+            "USING gin (to_tsvector('simple', tokens))"
+        )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS search_documents_au")
+        op.execute("DROP TRIGGER IF EXISTS search_documents_ad")
+        op.execute("DROP TRIGGER IF EXISTS search_documents_ai")
+        op.execute("DROP TABLE IF EXISTS search_documents_fts")
+        op.execute("DROP VIEW IF EXISTS search_documents_fts_source")
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_search_documents_tsv")
+
+    op.drop_index("ix_search_documents_owner_type", table_name="search_documents")
+    op.drop_table("search_documents")
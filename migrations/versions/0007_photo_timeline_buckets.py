@@ -0,0 +1,33 @@
+"""photo_timeline_buckets rollup for the photo timeline
+
+기존 사진은 마이그레이션 후 `python -m app.commands.rebuild_photo_timeline`으로 채웁니다.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 11:05:47
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "photo_timeline_buckets",
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("bucket", sa.Date(), nullable=False),
+        sa.Column("photo_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("owner_id", "bucket"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("photo_timeline_buckets")
@@ -0,0 +1,52 @@
+"""user_usage counters, backfilled from photos and albums
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 11:42:18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_usage",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("photo_count", sa.Integer(), nullable=False),
+        sa.Column("album_count", sa.Integer(), nullable=False),
+        sa.Column("bytes_used", sa.BigInteger(), nullable=False),
+        sa.Column("reconciled_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    # 기존 사용자 집계 (마이그레이션 1회만 전체 GROUP BY)
+    op.execute(
+        """
+        INSERT INTO user_usage (user_id, photo_count, album_count, bytes_used, reconciled_at)
+        SELECT u.id,
+               COALESCE(p.photo_count, 0),
+               COALESCE(a.album_count, 0),
+               COALESCE(p.bytes_used, 0),
+               CURRENT_TIMESTAMP
+        FROM users u
+        LEFT JOIN (
+            SELECT owner_id, COUNT(*) AS photo_count, SUM(file_size) AS bytes_used
+            FROM photos GROUP BY owner_id
+        ) p ON p.owner_id = u.id
+        LEFT JOIN (
+            SELECT owner_id, COUNT(*) AS album_count FROM albums GROUP BY owner_id
+        ) a ON a.owner_id = u.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_usage")
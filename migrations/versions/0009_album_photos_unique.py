@@ -0,0 +1,38 @@
+"""unique (album_id, photo_id) on album_photos
+
+중복 행은 가장 먼저 추가된 행(최소 id)만 남기고 삭제한 뒤 제약을 추가합니다.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 12:20:05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # MySQL은 DELETE 대상 테이블을 서브쿼리에서 직접 참조할 수 없어 파생 테이블로 감쌈
+    op.execute(
+        """
+        DELETE FROM album_photos
+        WHERE id NOT IN (
+            SELECT keep_id FROM (
+                SELECT MIN(id) AS keep_id FROM album_photos GROUP BY album_id, photo_id
+            ) AS keep
+        )
+        """
+    )
+    with op.batch_alter_table("album_photos") as batch_op:
+        batch_op.create_unique_constraint("uq_album_photos_album_photo", ["album_id", "photo_id"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("album_photos") as batch_op:
+        batch_op.drop_constraint("uq_album_photos_album_photo", type_="unique")
@@ -0,0 +1,32 @@
+"""spread album_photos.order by ORDER_GAP
+
+사진 이동 시 앞뒤 사진 order 사이 값을 쓰도록 기존 값에 간격(1024)을 벌려 둡니다.
+(정렬 순서는 그대로, 동률은 id로 구분)
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 13:05:41
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ORDER_GAP = 1024
+
+album_photos = sa.table("album_photos", sa.column("order", sa.Integer))
+
+
+def upgrade() -> None:
+    # 기존 값은 추가 순번(0, 1, 2, ...)이라 곱해도 Integer 범위를 넘지 않음
+    op.execute(album_photos.update().values(order=album_photos.c.order * ORDER_GAP))
+
+
+def downgrade() -> None:
+    op.execute(album_photos.update().values(order=album_photos.c.order / ORDER_GAP))
@@ -0,0 +1,48 @@
+"""soft delete columns and deletion_jobs
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 13:48:12
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("albums") as batch_op:
+        batch_op.add_column(sa.Column("deleted_at", sa.DateTime(), nullable=True))
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(sa.Column("deleted_at", sa.DateTime(), nullable=True))
+    op.create_table(
+        "deletion_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("target_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("stage", sa.String(length=32), nullable=True),
+        sa.Column("processed", sa.Integer(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("locked_until", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_deletion_jobs_status_id", "deletion_jobs", ["status", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_deletion_jobs_status_id", table_name="deletion_jobs")
+    op.drop_table("deletion_jobs")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("deleted_at")
+    with op.batch_alter_table("albums") as batch_op:
+        batch_op.drop_column("deleted_at")
@@ -0,0 +1,26 @@
+"""albums.version for shared album response caching
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19 14:31:26
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("albums") as batch_op:
+        batch_op.add_column(sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("albums") as batch_op:
+        batch_op.drop_column("version")
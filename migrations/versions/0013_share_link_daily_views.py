@@ -0,0 +1,31 @@
+"""share_link_daily_views for buffered view counting
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-19 15:02:53
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "share_link_daily_views",
+        sa.Column("share_link_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("view_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["share_link_id"], ["share_links.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("share_link_id", "day"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("share_link_daily_views")
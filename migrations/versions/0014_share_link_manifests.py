@@ -0,0 +1,34 @@
+"""share_links manifest columns for static CDN-served shared albums
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-19 16:20:41
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("share_links") as batch_op:
+        batch_op.add_column(
+            sa.Column("publish_manifest", sa.Boolean(), server_default=sa.false(), nullable=False)
+        )
+        batch_op.add_column(sa.Column("manifest_version", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("manifest_expires_at", sa.DateTime(), nullable=True))
+        batch_op.create_index("ix_share_links_publish_manifest", ["publish_manifest"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("share_links") as batch_op:
+        batch_op.drop_index("ix_share_links_publish_manifest")
+        batch_op.drop_column("manifest_expires_at")
+        batch_op.drop_column("manifest_version")
+        batch_op.drop_column("publish_manifest")
@@ -32,6 +32,7 @@ echo "[2/6] photo-api 소스 복사..."
 rsync -a --exclude='.git' --exclude='__pycache__' --exclude='*.pyc' --exclude='venv' \
   "$PHOTO_API_SOURCE/" "$SERVICE_HOME/" 2>/dev/null || {
   cp -a "$PHOTO_API_SOURCE/app" "$PHOTO_API_SOURCE/requirements.txt" "$SERVICE_HOME/"
+  cp -a "$PHOTO_API_SOURCE/alembic.ini" "$PHOTO_API_SOURCE/migrations" "$SERVICE_HOME/"
   [[ -f "$PHOTO_API_SOURCE/.env" ]] && cp -a "$PHOTO_API_SOURCE/.env" "$SERVICE_HOME/" || true
   [[ -d "$PHOTO_API_SOURCE/conf" ]] && cp -a "$PHOTO_API_SOURCE/conf" "$SERVICE_HOME/" || true
 }
@@ -62,6 +63,8 @@ Group=photo-api
 WorkingDirectory=/opt/photo-api
 Environment="PATH=/opt/photo-api/venv/bin:/usr/local/bin:/usr/bin:/bin"
 EnvironmentFile=/opt/photo-api/.env
+# DB 스키마 마이그레이션 (이미 최신이면 아무 작업 없음)
+ExecStartPre=/opt/photo-api/venv/bin/alembic upgrade head
 ExecStart=/opt/photo-api/venv/bin/uvicorn app.main:app --host 0.0.0.0 --port 8000
 Restart=on-failure
 RestartSec=5
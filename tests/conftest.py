@@ -0,0 +1,46 @@
+"""
+Shared fixtures.
+
+마이그레이션 테스트는 앱과 같은 방식(`alembic upgrade head`, DATABASE_URL 환경 변수)으로 스키마를 만든 DB를 사용합니다.
+- SQLite(aiosqlite): 임시 파일 DB, 항상 실행
+- PostgreSQL(asyncpg): TEST_POSTGRES_URL(postgresql+asyncpg://...)이 설정된 경우에만 실행.
+  빈 DB를 사용해야 하며 테스트 후 downgrade base로 되돌립니다.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_alembic(database_url: str, *args: str) -> None:
+    """Run the alembic CLI against database_url from the repository root."""
+    env = {**os.environ, "DATABASE_URL": database_url}
+    subprocess.run(
+        [sys.executable, "-m", "alembic", *args],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture(scope="session", params=["sqlite", "postgresql"])
+def migrated_db_url(request, tmp_path_factory) -> str:
+    """Database URL with all migrations applied."""
+    if request.param == "sqlite":
+        path = tmp_path_factory.mktemp("db") / "test.db"
+        database_url = f"sqlite+aiosqlite:///{path}"
+        run_alembic(database_url, "upgrade", "head")
+        yield database_url
+        return
+
+    database_url = os.environ.get("TEST_POSTGRES_URL")
+    if not database_url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    run_alembic(database_url, "upgrade", "head")
+    yield database_url
+    run_alembic(database_url, "downgrade", "base")
@@ -0,0 +1,112 @@
+"""
+Index usage of the hot queries (0003 performance indexes).
+
+서비스 메서드가 실제로 실행하는 SQL을 가로채 EXPLAIN하고, 계획에 해당 ix_* 인덱스가 나오는지 확인합니다.
+- SQLite: EXPLAIN QUERY PLAN (통계 없이도 인덱스를 선택)
+- PostgreSQL: 빈 테이블에서는 순차 스캔이 더 싸므로 enable_seqscan=off로 인덱스 선택 가능 여부만 확인
+"""
+import asyncio
+from datetime import datetime
+from typing import Awaitable, Callable, List, Tuple
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.services.album import AlbumService
+from app.services.photo import PhotoService
+from app.services.shared_album_cache import bump_photo_album_versions
+from app.utils.pagination import encode_cursor, encode_order_cursor
+
+USER_ID = 1
+ALBUM_ID = 1
+PHOTO_ID = 1
+CURSOR_AT = datetime(2026, 1, 1)
+
+
+async def _query_plan(database_url: str, call: Callable[[AsyncSession], Awaitable]) -> str:
+    """Run `call`, then EXPLAIN every SELECT it executed. Returns the joined plan text."""
+    engine = create_async_engine(database_url, poolclass=NullPool)
+    statements: List[Tuple[str, tuple]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _capture)
+    try:
+        async with AsyncSession(engine) as session:
+            await call(session)
+            await session.rollback()
+        event.remove(engine.sync_engine, "before_cursor_execute", _capture)
+        assert statements, "no SELECT was executed"
+
+        lines = []
+        async with engine.connect() as conn:
+            if engine.dialect.name == "sqlite":
+                prefix = "EXPLAIN QUERY PLAN "
+            else:
+                prefix = "EXPLAIN "
+                await conn.exec_driver_sql("SET enable_seqscan = off")
+            for statement, parameters in statements:
+                result = await conn.exec_driver_sql(prefix + statement, parameters)
+                lines += [" ".join(str(value) for value in row) for row in result.all()]
+        return "\n".join(lines)
+    finally:
+        await engine.dispose()
+
+
+QUERIES = {
+    "photo owner listing": (
+        lambda db: PhotoService(db).get_user_photos_page(USER_ID, limit=20),
+        "ix_photos_owner_created_id",
+    ),
+    "photo keyset page": (
+        lambda db: PhotoService(db).get_user_photos_page(
+            USER_ID, limit=20, cursor=encode_cursor(CURSOR_AT, 100)
+        ),
+        "ix_photos_owner_created_id",
+    ),
+    "album owner listing": (
+        lambda db: AlbumService(db).get_user_albums_page(USER_ID, limit=20),
+        "ix_albums_owner_created_id",
+    ),
+    "album keyset page": (
+        lambda db: AlbumService(db).get_user_albums_page(
+            USER_ID, limit=20, cursor=encode_cursor(CURSOR_AT, 100)
+        ),
+        "ix_albums_owner_created_id",
+    ),
+    "album photos keyset page": (
+        lambda db: AlbumService(db).get_album_photos_page(
+            ALBUM_ID, limit=20, cursor=encode_order_cursor(1024, 100)
+        ),
+        "ix_album_photos_album_order",
+    ),
+    "album photo count": (
+        lambda db: AlbumService(db).get_album_photo_count(ALBUM_ID),
+        "ix_album_photos_album_order",
+    ),
+    "album max(order)": (
+        lambda db: AlbumService(db)._get_max_order(ALBUM_ID),
+        "ix_album_photos_album_order",
+    ),
+    "album membership by photo": (
+        lambda db: bump_photo_album_versions(db, [PHOTO_ID, PHOTO_ID + 1]),
+        "ix_album_photos_photo_album",
+    ),
+    "album share links": (
+        lambda db: AlbumService(db).get_album_share_links(ALBUM_ID),
+        "ix_share_links_album_created",
+    ),
+}
+
+
+@pytest.mark.parametrize("name", list(QUERIES))
+def test_query_uses_index(migrated_db_url: str, name: str) -> None:
+    call, index_name = QUERIES[name]
+    plan = asyncio.run(_query_plan(migrated_db_url, call))
+    assert index_name in plan, f"{name}: {index_name} not used\n{plan}"
+    # 인덱스 순서로 읽으므로 별도 정렬 단계가 없어야 함
+    assert "TEMP B-TREE FOR ORDER BY" not in plan, f"{name}: sorted outside the index\n{plan}"